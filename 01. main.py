@@ -1,20 +1,63 @@
 # main.py
 import subprocess
+from recon import reconcile
+from recon.mismatch import mismatch_path
+from recon.service import ServiceClient
+from utils_results import record_result
 
-scripts = [
+DATA1 = "data.parquet"
+DATA2 = "data_modified.parquet"
+
+# URL of a running "21. recon_service.py" (e.g. "http://127.0.0.1:8765") to run the
+# engines there, warm, instead of in this process; None runs them here
+SERVICE_URL = None
+
+# Setup scripts still run as separate programs
+setup_scripts = [
     # "01. wipe_results.py",
     # "02. data_generator.py",
-    # "03. recon_pandas.py",
-    # "04. recon_duck_db.py",
-    # "05. recon_polars.py",
-    # "06. recon_polars_streaming.py",
-    "07. recon_polars_vectorized.py",
-    # "08. recon_pyarrow.py",
     # "09. pyarrow_batch_optimizer.py",
-    # "09. recon_optimised_pyarrow.py",
+]
+
+# Engines run in this process, so each library is imported once and stays warm.
+# (chart label, engine, options) — mirrors the numbered recon scripts.
+engines = [
+    # ("Pandas", "pandas", {}),
+    # ("Pandas\n(Chunked)", "pandas_chunked", {}),
+    # ("DuckDB", "duckdb", {"mismatches": mismatch_path("duckdb")}),
+    # ("Polars", "polars", {}),
+    # ("Polars\n(Streaming)", "polars_streaming", {}),
+    ("Polars\n (Vectorized)", "polars_vectorized", {"mismatches": mismatch_path("polars")}),
+    # ("Polars\n(Lazy sink)", "polars_lazy", {"mismatches": mismatch_path("polars_lazy")}),
+    # ("PyArrow", "pyarrow", {"batch_size": 7_000_000, "dictionary_columns": None}),
+    # ("PyArrow\n(Tuned batch size)", "pyarrow", {"tune": True, "use_fingerprint_index": True,
+    #                                             "mismatches": mismatch_path("pyarrow")}),
+    # ("PyArrow\n(IPC snapshot)", "pyarrow", {"input_mode": "ipc"}),
+    # ("PyArrow\n(Prefetch)", "pyarrow", {"prefetch": 2}),
+    # ("PyArrow\n(Footer check)", "pyarrow", {"footer_check": True}),
+    # ("DuckDB\n(Keyed)", "duckdb", {"key": "row", "temp_directory": "duckdb_tmp", "memory_limit": "4GB"}),
+    # ("Digest\n(Incremental)", "digest", {"key": "row"}),
+    # ("PyArrow\n(Parallel)", "pyarrow", {"workers": 4}),
+]
+
+report_scripts = [
+    # "13. benchmark.py",   # repeated cold/warm runs with statistics (slow)
     "10. visualization_final_results.py",
 ]
 
-for script in scripts:
-    print(f"\n 🔥 Running {script}...")
-    subprocess.run(["python", script], check=True)
+# Process pools used by some engines re-import this module on spawn-based platforms
+if __name__ == "__main__":
+    for script in setup_scripts:
+        print(f"\n 🔥 Running {script}...")
+        subprocess.run(["python", script], check=True)
+
+    run = ServiceClient(SERVICE_URL).reconcile if SERVICE_URL else reconcile
+    for label, engine, opts in engines:
+        print(f"\n 🔥 Running {label.replace(chr(10), ' ')}...")
+        result = run(DATA1, DATA2, engine=engine, **opts)
+        print(f"Row-level match rate: {result.match_rate:.10f}  ({result.timings['total']:.3f}s)")
+        record_result(label, result)
+
+    for script in report_scripts:
+        print(f"\n 🔥 Running {script}...")
+        subprocess.run(["python", script], check=True)
@@ -1,9 +1,16 @@
-from pathlib import Path
-
-RESULTS_PATH = Path("results.pkl")
+from datetime import datetime
+from utils_results import RESULTS_PATH, connect
 
+# The store is append-only: wiping starts a fresh one and keeps the old runs aside
 if RESULTS_PATH.exists():
-    RESULTS_PATH.unlink()  # deletes the file
-    print("✅ 'results.pkl' has been deleted.")
+    archive = RESULTS_PATH.with_name(f"{RESULTS_PATH.stem}-{datetime.now():%Y%m%d-%H%M%S}{RESULTS_PATH.suffix}")
+    RESULTS_PATH.rename(archive)
+    for suffix in ("-wal", "-shm"):  # SQLite's WAL side files belong to the archived store
+        side = RESULTS_PATH.with_name(RESULTS_PATH.name + suffix)
+        if side.exists():
+            side.rename(archive.with_name(archive.name + suffix))
+    # The fresh store must not pull the old results.pkl runs back in
+    connect(RESULTS_PATH, import_legacy=False).close()
+    print(f"✅ '{RESULTS_PATH}' archived as '{archive}'; new runs start a fresh history.")
 else:
-    print("⚠️ 'results.pkl' not found. Nothing to delete.")
+    print(f"⚠️ '{RESULTS_PATH}' not found. Nothing to wipe.")
@@ -1,68 +1,143 @@
-# pip install pandas pyarrow numpy
-import numpy as np
-import pandas as pd
+# pip install pyarrow numpy
+import argparse
 import string
-from pathlib import Path
-import shutil
-
-np.random.seed(42)
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+# --- Config (defaults reproduce the original 7M-row benchmark dataset) ---
+parser = argparse.ArgumentParser(description="Stream a base and a modified Parquet file, one row group at a time.")
+parser.add_argument("--rows", type=int, default=7_000_000)
+parser.add_argument("--row-group-size", type=int, default=1_048_576, help="rows generated and written per step")
+parser.add_argument("--letter-cols", type=int, default=10, help="low-cardinality string columns L1..Ln")
+parser.add_argument("--int-cols", type=int, default=1, help="integer columns in [1, 100]: value, value_2, ...")
+parser.add_argument("--float-cols", type=int, default=0, help="float64 columns amount_1, amount_2, ...")
+parser.add_argument("--timestamp-cols", type=int, default=0, help="timestamp[us] columns ts_1, ts_2, ...")
+parser.add_argument("--mutations", type=int, default=200, help="exact number of rows changed in the copy")
+parser.add_argument("--mutation-rate", type=float, default=None, help="fraction of rows changed (overrides --mutations)")
+parser.add_argument("--null-density", type=float, default=0.0, help="fraction of nulls in every non-key column")
+parser.add_argument("--shuffle", action="store_true", help="write the modified copy in a different row order")
+parser.add_argument("--seed", type=int, default=42)
+parser.add_argument("--compression", default="snappy")
+parser.add_argument("--base-path", default="data.parquet")
+parser.add_argument("--modified-path", default="data_modified.parquet")
+args = parser.parse_args()
 
-N = 7_000_000
-LETTER_COLS = [f"L{i}" for i in range(1, 11)]
-VALUE_COL = "value"
 ROW_COL = "row"
-
-# 1) Generate base dataset
-letters = np.array(list(string.ascii_uppercase))  # 26 uppercase letters
-
-# random letters for the 10 columns, shape (N, 10)
-letter_matrix = letters[np.random.randint(0, len(letters), size=(N, len(LETTER_COLS)))]
-
-# random integer values [1, 100]
-values = np.random.randint(1, 101, size=N)
-
-df = pd.DataFrame(
-    {ROW_COL: np.arange(1, N + 1, dtype=np.int64),
-     **{col: letter_matrix[:, i] for i, col in enumerate(LETTER_COLS)},
-     VALUE_COL: values}
+LETTER_COLS = [f"L{i}" for i in range(1, args.letter_cols + 1)]
+INT_COLS = ["value" if i == 1 else f"value_{i}" for i in range(1, args.int_cols + 1)]
+FLOAT_COLS = [f"amount_{i}" for i in range(1, args.float_cols + 1)]
+TS_COLS = [f"ts_{i}" for i in range(1, args.timestamp_cols + 1)]
+
+LETTERS = pa.array(list(string.ascii_uppercase), pa.large_string())  # 26 uppercase letters
+TS_START = np.datetime64("2024-01-01T00:00:00", "us").astype(np.int64)
+TS_SPAN = 365 * 24 * 3600 * 1_000_000  # one year in microseconds
+
+schema = pa.schema(
+    [pa.field(ROW_COL, pa.int64())]
+    + [pa.field(c, pa.large_string()) for c in LETTER_COLS]
+    + [pa.field(c, pa.int64()) for c in INT_COLS]
+    + [pa.field(c, pa.float64()) for c in FLOAT_COLS]
+    + [pa.field(c, pa.timestamp("us")) for c in TS_COLS]
 )
 
-# (Optional) make string columns Arrow-backed for memory/perf when writing
-for col in LETTER_COLS:
-    df[col] = df[col].astype("string[pyarrow]")
-
-base_path = Path("data.parquet")
-df.to_parquet(base_path, engine="pyarrow", compression="snappy", index=False)
-
-# 2) Copy file and modify exactly 5 random rows (letters + value)
-copy_path = Path("data_modified.parquet")
-shutil.copy(base_path, copy_path)
-
-# Load, mutate 5 rows, save back
-df2 = pd.read_parquet(copy_path, engine="pyarrow")
-
-# Pick X unique target row indices (0-based)
-size = 200
-change_idx = np.random.choice(df2.index.values, size=size, replace=False)
-
-# Change letters: re-draw fresh random letters
-new_letter_matrix = letters[np.random.randint(0, len(letters), size=(size, len(LETTER_COLS)))]
-for i, col in enumerate(LETTER_COLS):
-    df2.loc[change_idx, col] = new_letter_matrix[:, i]
-
-# Change value: re-draw fresh ints in [1, 100]
-# (Ensures a change by re-drawing any equal-to-original entries)
-old_vals = df2.loc[change_idx, VALUE_COL].to_numpy()
-new_vals = np.random.randint(1, 101, size=size)
-mask_same = new_vals == old_vals
-while mask_same.any():
-    new_vals[mask_same] = np.random.randint(1, 101, size=mask_same.sum())
-    mask_same = new_vals == old_vals
-
-df2.loc[change_idx, VALUE_COL] = new_vals
-
-# Save the modified copy
-df2.to_parquet(copy_path, engine="pyarrow", compression="snappy", index=False)
+# Chunk boundaries; every chunk becomes one row group in both files
+starts = list(range(0, args.rows, args.row_group_size))
+sizes = [min(args.row_group_size, args.rows - s) for s in starts]
+
+
+def null_mask(rng, n):
+    if args.null_density <= 0:
+        return None
+    return rng.random(n) < args.null_density
+
+
+def generate_chunk(chunk):
+    # Each chunk has its own seeded stream, so it can be (re)generated in any order
+    rng = np.random.default_rng([args.seed, chunk])
+    n, start = sizes[chunk], starts[chunk]
+
+    columns = {ROW_COL: np.arange(start + 1, start + n + 1, dtype=np.int64)}
+    for c in LETTER_COLS:
+        columns[c] = rng.integers(0, len(LETTERS), size=n, dtype=np.int8)
+    for c in INT_COLS:
+        columns[c] = rng.integers(1, 101, size=n)
+    for c in FLOAT_COLS:
+        columns[c] = np.round(rng.uniform(0, 10_000, size=n), 2)
+    for c in TS_COLS:
+        columns[c] = TS_START + rng.integers(0, TS_SPAN, size=n)
+    masks = {c: null_mask(rng, n) for c in columns if c != ROW_COL}
+    return columns, masks
+
+
+def mutate_chunk(columns, masks, chunk, count):
+    # Change `count` random rows: fresh letters, and numbers that are guaranteed to differ
+    rng = np.random.default_rng([args.seed, chunk, 1])
+    n = sizes[chunk]
+    idx = rng.choice(n, size=count, replace=False)
+
+    columns = {c: v.copy() for c, v in columns.items()}
+    masks = {c: (None if m is None else m.copy()) for c, m in masks.items()}
+    for c in LETTER_COLS:
+        columns[c][idx] = rng.integers(0, len(LETTERS), size=count, dtype=np.int8)
+    for c in INT_COLS:
+        columns[c][idx] = (columns[c][idx] - 1 + rng.integers(1, 100, size=count)) % 100 + 1
+    for c in FLOAT_COLS:
+        columns[c][idx] = np.round(columns[c][idx] + rng.uniform(0.01, 100, size=count), 2)
+    for c in TS_COLS:
+        columns[c][idx] += rng.integers(1_000_000, 3600 * 1_000_000, size=count)
+    # A mutated value is always a real value, never a null
+    for m in masks.values():
+        if m is not None:
+            m[idx] = False
+    return columns, masks, idx
+
+
+def to_batch(columns, masks, order=None):
+    arrays = []
+    for field in schema:
+        values, mask = columns[field.name], masks.get(field.name)
+        if order is not None:
+            values = values[order]
+            mask = None if mask is None else mask[order]
+        if field.name in LETTER_COLS:
+            # Vectorized lookup into the 26-letter array (no NumPy object arrays)
+            arrays.append(pc.take(LETTERS, pa.array(values, mask=mask)))
+        else:
+            arrays.append(pa.array(values, type=field.type, mask=mask))
+    return pa.record_batch(arrays, schema=schema)
+
+
+# --- Decide how many rows each chunk mutates (exact total, or a per-row rate) ---
+rng = np.random.default_rng(args.seed)
+if args.mutation_rate is not None:
+    mutation_counts = rng.binomial(sizes, args.mutation_rate)
+else:
+    if args.mutations > args.rows:
+        parser.error(f"cannot mutate {args.mutations} rows out of {args.rows}")
+    mutation_counts = rng.multivariate_hypergeometric(np.array(sizes), args.mutations)
+
+# Shuffled copy: chunks are written in a permuted order and rows permuted within each chunk
+chunk_order = rng.permutation(len(sizes)) if args.shuffle else np.arange(len(sizes))
+
+# --- Stream both files, one row group per step, in constant memory ---
+changed_rows = []
+with pq.ParquetWriter(args.base_path, schema, compression=args.compression) as base_writer, \
+     pq.ParquetWriter(args.modified_path, schema, compression=args.compression) as mod_writer:
+    for step in range(len(sizes)):
+        columns, masks = generate_chunk(step)
+        base_writer.write_batch(to_batch(columns, masks), row_group_size=args.row_group_size)
+
+        chunk = int(chunk_order[step])
+        if chunk != step:
+            columns, masks = generate_chunk(chunk)
+        columns, masks, idx = mutate_chunk(columns, masks, chunk, int(mutation_counts[chunk]))
+        changed_rows.extend(columns[ROW_COL][idx].tolist())
+
+        order = np.random.default_rng([args.seed, chunk, 2]).permutation(sizes[chunk]) if args.shuffle else None
+        mod_writer.write_batch(to_batch(columns, masks, order), row_group_size=args.row_group_size)
 
 print("Done.")
-print("Changed row numbers:", df2.loc[change_idx, ROW_COL].to_list())
+print(f"Rows: {args.rows:,}  Row groups: {len(sizes)}  Changed rows: {len(changed_rows):,}")
+print("Changed row numbers:", sorted(changed_rows)[:50], "..." if len(changed_rows) > 50 else "")
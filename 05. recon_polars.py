@@ -1,36 +1,10 @@
-import time
-import polars as pl
-from utils_results import load_results, save_results
+from recon import reconcile
+from utils_results import record_result
 
-# --- Load existing results dict (robust to empty/corrupt) ---
-results = load_results()
+# Compare row tuples pulled into Python (the slow way, kept for comparison)
+result = reconcile("data.parquet", "data_modified.parquet", engine="polars")
+print(f"Row-level match rate: {result.match_rate:.10f}")
 
-# --- Start timer ---
-start_time = time.time()
-
-# Read Parquet files using Polars
-df1 = pl.read_parquet("data.parquet")
-df2 = pl.read_parquet("data_modified.parquet")
-
-# Compute row-level match rate
-# (df1 == df2) gives a Boolean DataFrame
-# .row(eq=True) checks if all values in the row are True
-match_rate = (df1 == df2).rows().count((True,) * df1.width) / df1.height
-
-# Print result
-print(f"Row-level match rate: {match_rate:.10f}")
-
-# --- End timer ---
-elapsed_time = time.time() - start_time
-
-# --- Update results dictionary ---
-results["Polars"] = {
-    "match_rate": round(match_rate, 10),
-    "time_taken_sec": round(elapsed_time, 10)
-}
-
-# --- Save updated results ---
-save_results(results)
-
-# --- Print summary ---
+# --- Update & persist results ---
+results = record_result("Polars", result)
 print(results)
@@ -1,40 +1,25 @@
-import time
-import polars as pl
-from utils_results import load_results, save_results
-
-# --- Load existing results dict (robust to empty/corrupt) ---
-results = load_results()
-
-# Start timer
-start_time = time.time()
-
-# Read Parquet files using Polars
-df1 = pl.read_parquet("data.parquet")
-df2 = pl.read_parquet("data_modified.parquet")
-
-# assume both frames have identical schemas and column order
-match_rate = (
-    (df1 == df2)
-    .select(pl.all_horizontal(pl.all()).alias("row_match"))
-    .select(pl.col("row_match").mean())
-    .item()
+from recon import reconcile
+from recon.mismatch import mismatch_path
+from utils_results import record_result
+
+WRITE_MISMATCHES = True   # export differing rows + per-column diff mask to mismatches/polars.parquet
+KEY_COL = "row"           # copied next to row_index in the mismatch file (if present)
+# Per-column comparison rules (see recon/rules.py); everything else is compared exactly, e.g.
+# {"value": {"abs_tol": 1}, "L1": {"ignore_case": True, "trim": True}, "L2": {"nulls_equal": True}}
+RULES = {}
+
+# Compare both eager frames column-wise inside Polars
+result = reconcile(
+    "data.parquet", "data_modified.parquet", engine="polars_vectorized",
+    mismatches=mismatch_path("polars") if WRITE_MISMATCHES else None,
+    rules=RULES, label_col=KEY_COL,
 )
 
 # Print result
-print(f"Row-level match rate: {match_rate:.10f}")
-
-# End timer
-end_time = time.time()
-elapsed_time = end_time - start_time
-
-# --- Update results dictionary ---
-results["Polars\n (Vectorized)"] = {
-    "match_rate": round(match_rate, 10),
-    "time_taken_sec": round(elapsed_time, 10)
-}
+print(f"Row-level match rate: {result.match_rate:.10f}")
 
-# --- Save updated results ---
-save_results(results)
+# --- Update & persist results ---
+results = record_result("Polars\n (Vectorized)", result)
 
 # --- Print summary ---
 print(results)
@@ -14,6 +14,9 @@ path1 = "data.parquet"
 path2 = "data_modified.parquet"
 
 #### OPTIMISER
+# Offline sweep, kept for the runtime-vs-batch-size plot. Day-to-day runs of
+# "09. recon_optimised_pyarrow.py" tune online (recon/tuner.py) and only
+# use pyarrow.pkl as their starting point.
 # Testing different batch sizes
 batch_sizes = list(range(10_000, 400_001, 10_000))  # 10k → 1M in 10k steps
 batch_times = []
@@ -1,18 +1,33 @@
-import pickle
+import statistics
+from contextlib import closing
 import matplotlib
 import matplotlib.pyplot as plt
-from pathlib import Path
+from utils_results import RESULTS_PATH, connect, load_results
 
-# --- Load results from pickle ---
-RESULTS_PATH = Path("results.pkl")
+HISTORY = 20             # runs per label in the trend chart / regression baseline
+REGRESSION_FACTOR = 1.25  # latest run this much slower than the median of the previous ones
 
-if RESULTS_PATH.exists():
-    with open(RESULTS_PATH, "rb") as f:
-        results = pickle.load(f)
-else:
-    raise FileNotFoundError("⚠️ 'results.pkl' not found. Run your analysis scripts first.")
+if not RESULTS_PATH.exists():
+    raise FileNotFoundError(f"⚠️ '{RESULTS_PATH}' not found. Run your analysis scripts first.")
 
-# --- Extract methods and times ---
+# --- Only runs on the most recently used dataset are charted together ---
+with closing(connect()) as con:
+    row = con.execute("SELECT dataset FROM runs ORDER BY id DESC LIMIT 1").fetchone()
+    dataset = row["dataset"] if row else None
+    # Last HISTORY runs per label, oldest first; SQLite does the windowing, not Python
+    history = con.execute("""
+        SELECT label, time_taken_sec FROM (
+            SELECT label, id, time_taken_sec,
+                   ROW_NUMBER() OVER (PARTITION BY label ORDER BY id DESC) AS n
+            FROM runs WHERE dataset IS ? AND time_taken_sec IS NOT NULL
+        ) WHERE n <= ? ORDER BY label, id
+    """, (dataset, HISTORY)).fetchall()
+
+results = load_results(dataset=dataset) if dataset is not None else load_results()
+if not results:
+    raise FileNotFoundError(f"⚠️ No runs in '{RESULTS_PATH}'. Run your analysis scripts first.")
+
+# --- Extract methods and times (latest run per method) ---
 methods = list(results.keys())
 times = [v['time_taken_sec'] for v in results.values()]
 
@@ -61,3 +76,30 @@ plt.tight_layout()
 plt.savefig("10. results.png")
 
 print("Final results saved in '10. results.png'")
+
+# --- Trends: time per run for every method, plus regressions of the latest run ---
+series = {}
+for label, t in history:
+    series.setdefault(label, []).append(t)
+
+plt.figure(figsize=(9, 4))
+regressions = []
+for label, values in series.items():
+    plt.plot(range(1, len(values) + 1), values, marker="o", label=label.replace("\n", " "))
+    if len(values) > 1:
+        baseline = statistics.median(values[:-1])
+        if values[-1] > baseline * REGRESSION_FACTOR:
+            regressions.append((label, values[-1], baseline))
+
+plt.title(f"Time per run (last {HISTORY} runs per method)")
+plt.xlabel("Run")
+plt.ylabel("Seconds")
+plt.legend(fontsize=7, frameon=False)
+for spine in ("top", "right"):
+    plt.gca().spines[spine].set_visible(False)
+plt.tight_layout()
+plt.savefig("10. trends.png")
+print("Trends saved in '10. trends.png'")
+
+for label, latest, baseline in regressions:
+    print(f"⚠️ Regression: {label.replace(chr(10), ' ')} took {latest:.3f}s vs a median of {baseline:.3f}s")
@@ -0,0 +1,25 @@
+from pathlib import Path
+from recon import reconcile
+from utils_results import record_result
+
+DATA1 = Path("data.parquet")
+DATA2 = Path("data_modified.parquet")
+
+# --- Config ---
+KEY_COL = "row"                     # column that identifies a row in both files
+TEMP_DIR = Path("duckdb_tmp")       # spill location for the out-of-core hash join
+MEMORY_LIMIT = "4GB"                # join spills to TEMP_DIR beyond this
+
+# --- Full outer hash join on the key, counted in a single aggregate ---
+result = reconcile(
+    DATA1, DATA2, engine="duckdb",
+    key=KEY_COL, temp_directory=TEMP_DIR, memory_limit=MEMORY_LIMIT,
+)
+
+print(f"Matched: {result.matched_rows:,}  Mismatched: {result.mismatched_rows:,}  "
+      f"Left-only: {result.left_only:,}  Right-only: {result.right_only:,}")
+print(f"Key-level match rate: {result.match_rate:.10f}")
+
+# --- Update & persist results ---
+results = record_result("DuckDB\n(Keyed)", result)
+print(results)
@@ -0,0 +1,27 @@
+import os
+from recon import reconcile
+from utils_results import record_result
+
+# --- Config ---
+path1 = "data.parquet"
+path2 = "data_modified.parquet"
+batch_size = 131_072
+num_workers = os.cpu_count() or 1   # one process per core
+num_runs = 5
+
+# Process pools re-import this module in the workers on spawn-based platforms
+if __name__ == "__main__":
+    # Each worker reads its own row-group range of both files
+    runs = [
+        reconcile(path1, path2, engine="pyarrow", batch_size=batch_size, workers=num_workers)
+        for _ in range(num_runs)
+    ]
+    result = runs[-1]
+    avg_time = sum(r.timings["total"] for r in runs) / num_runs
+
+    # --- Update results dict & persist ---
+    results = record_result("PyArrow\n(Parallel)", result, time_taken_sec=round(avg_time, 10))
+
+    print(f"Row-level match rate: {result.match_rate:.10f}")
+    print(f"Average time over {num_runs} runs ({num_workers} workers): {avg_time:.6f} sec")
+    print(results)
@@ -0,0 +1,49 @@
+from recon.bench import benchmark, save_benchmark
+from recon.mismatch import mismatch_path
+from recon.tuner import load_tuned_batch_size
+
+# --- Config ---
+DATA1 = "data.parquet"
+DATA2 = "data_modified.parquet"
+WARMUP = 1
+REPEAT = 5
+CACHE_MODES = ["cold", "warm"]   # cold evicts both files from the page cache before every run
+
+# (label, engine, options) — same runs as "01. main.py"
+engines = [
+    ("Pandas", "pandas", {}),
+    ("Pandas\n(Chunked)", "pandas_chunked", {}),
+    ("DuckDB", "duckdb", {"mismatches": mismatch_path("duckdb")}),
+    # ("Polars", "polars", {}),   # pulls every row into Python; minutes per repetition
+    ("Polars\n(Streaming)", "polars_streaming", {}),
+    ("Polars\n (Vectorized)", "polars_vectorized", {"mismatches": mismatch_path("polars")}),
+    ("Polars\n(Lazy sink)", "polars_lazy", {"mismatches": mismatch_path("polars_lazy")}),
+    ("PyArrow", "pyarrow", {"batch_size": 7_000_000, "dictionary_columns": None}),
+    ("PyArrow\n(Tuned batch size)", "pyarrow", {"batch_size": load_tuned_batch_size(), "tune": True,
+                                                "use_fingerprint_index": True,
+                                                "mismatches": mismatch_path("pyarrow")}),
+    ("PyArrow\n(IPC snapshot)", "pyarrow", {"input_mode": "ipc"}),
+    ("PyArrow\n(Prefetch)", "pyarrow", {"prefetch": 2}),
+    ("PyArrow\n(Footer check)", "pyarrow", {"footer_check": True}),
+    ("DuckDB\n(Keyed)", "duckdb", {"key": "row", "temp_directory": "duckdb_tmp", "memory_limit": "4GB"}),
+    ("Digest\n(Incremental)", "digest", {"key": "row"}),
+]
+
+# Process pools used by some engines re-import this module on spawn-based platforms
+if __name__ == "__main__":
+    print(f"{'engine':<28}{'cache':<7}{'median':>10}{'p95':>10}{'stddev':>10}{'peak RSS':>12}")
+    for cache in CACHE_MODES:
+        for label, engine, opts in engines:
+            record = benchmark(DATA1, DATA2, engine, opts, label=label,
+                               warmup=WARMUP, repeat=REPEAT, cache=cache)
+            path = save_benchmark(record)
+
+            total = record["stats"]["total"]
+            rss = record["stats"]["peak_rss_bytes"].get("max")
+            rss_text = f"{rss / 2**20:,.0f} MiB" if rss else "n/a"
+            # "cold?" = no posix_fadvise on this platform, so the page cache was not dropped
+            mode = cache if record["cold_cache_supported"] else "cold?"
+            print(f"{label.replace(chr(10), ' '):<28}{mode:<7}{total['median']:>10.3f}"
+                  f"{total['p95']:>10.3f}{total['stddev']:>10.3f}{rss_text:>12}")
+
+    print(f"\nPer-phase timings (read/compare/reduce/...) saved to {path}")
@@ -0,0 +1,23 @@
+from pathlib import Path
+from recon import reconcile
+from utils_results import record_result
+
+# --- Config ---
+BASELINE = Path("data.parquet")              # or a kept digest, e.g. "data.parquet.digest.parquet"
+DELIVERY = Path("data_modified.parquet")
+KEY_COL = "row"
+SAVE_DIGEST = True   # the delivery's digest becomes the next run's baseline
+
+# --- Hash only the delivery and probe the baseline's (key -> row hash) digest ---
+result = reconcile(BASELINE, DELIVERY, engine="digest", key=KEY_COL, save_digest=SAVE_DIGEST)
+
+print(f"Matched: {result.matched_rows:,}  Mismatched: {result.mismatched_rows:,}  "
+      f"Left-only: {result.left_only:,}  Right-only: {result.right_only:,}")
+print(f"Key-level match rate: {result.match_rate:.10f}")
+print({phase: round(t, 3) for phase, t in result.timings.items()})
+if result.extra["digest"]:
+    print(f"Next baseline: {result.extra['digest']}")
+
+# --- Update & persist results ---
+results = record_result("Digest\n(Incremental)", result)
+print(results)
@@ -0,0 +1,27 @@
+from pathlib import Path
+from recon import reconcile
+from utils_results import record_result
+
+# --- Config ---
+LEFT_ROOT = Path("dataset")                  # Hive layout, e.g. dataset/date=2024-01-01/part-0.parquet
+RIGHT_ROOT = Path("dataset_modified")
+FILE_ENGINE = "pyarrow"                      # engine run on each file pair
+WORKERS = None                               # None = one process per CPU
+SKIP_IDENTICAL = "footer"                    # "footer" (stats + raw chunk bytes), "fingerprint" or None
+MISMATCH_DIR = Path("mismatches/dataset")    # one mismatch file per pair, same relative path
+
+# --- Pair files by relative path, skip identical pairs, compare the rest in parallel ---
+result = reconcile(LEFT_ROOT, RIGHT_ROOT, engine="dataset", file_engine=FILE_ENGINE, workers=WORKERS,
+                   skip_identical=SKIP_IDENTICAL, mismatches=MISMATCH_DIR)
+
+print(f"Matched: {result.matched_rows:,}  Mismatched: {result.mismatched_rows:,}  "
+      f"Left-only: {result.left_only:,}  Right-only: {result.right_only:,}")
+print(f"Files compared: {result.extra['files_compared']}  skipped as identical: {result.extra['files_skipped']}")
+for label in ("left_only_partitions", "right_only_partitions", "left_only_files", "right_only_files"):
+    if result.extra[label]:
+        print(f"{label.replace('_', ' ').capitalize()}: {', '.join(result.extra[label])}")
+print({phase: round(t, 3) for phase, t in result.timings.items()})
+
+# --- Update & persist results ---
+results = record_result("Dataset\n(Partitioned)", result)
+print(results)
@@ -0,0 +1,29 @@
+from recon import reconcile
+from recon.trace import TRACE_DIR, trace_path
+
+# --- Config ---
+DATA1 = "data.parquet"
+DATA2 = "data_modified.parquet"
+
+# (engine, options) — each run writes traces/<name>.json (chrome://tracing or ui.perfetto.dev)
+engines = [
+    ("duckdb", "duckdb", {}),
+    ("polars_vectorized", "polars_vectorized", {}),
+    ("pyarrow", "pyarrow", {}),
+    ("pyarrow_prefetch", "pyarrow", {"prefetch": 2}),
+]
+
+# --- Trace every engine and print the flat summary ---
+print(f"{'engine':<20}{'wall s':>8}{'cpu/wall':>10}{'MB/s':>9}{'rows/s':>14}{'I/O s':>8}{'decode s':>10}")
+for name, engine, opts in engines:
+    result = reconcile(DATA1, DATA2, engine=engine, trace=trace_path(name), **opts)
+    s = result.extra["trace"]
+    io_s = f"{s['io_s']:.3f}" if "io_s" in s else "-"
+    decode_s = f"{s['decode_s']:.3f}" if "decode_s" in s else "-"
+    print(f"{name:<20}{s['wall_s']:>8.3f}{s['cpu_utilization']:>10.2f}{s['read_mb_per_s']:>9.0f}"
+          f"{s['rows_per_s']:>14,.0f}{io_s:>8}{decode_s:>10}")
+    for phase, p in s["phases"].items():
+        print(f"    {phase:<12}{p['count']:>6} x {p['mean_ms']:8.2f} ms  (max {p['max_ms']:.2f} ms, total {p['total_s']:.3f} s)")
+
+# cpu/wall near the number of busy cores = compute-bound; well below it = waiting on I/O
+print(f"\nTraces written to {TRACE_DIR}/")
@@ -0,0 +1,25 @@
+import sys
+from recon import reconcile
+
+# --- Config ---
+path1 = "data.parquet"
+path2 = "data_modified.parquet"
+THRESHOLD = 0.9999     # go/no-go: the snapshots "match" when at least this share of rows does
+CONFIDENCE = 0.95
+MAX_FRACTION = 0.25    # give up (inconclusive) after sampling this share of the rows
+SEED = None            # fix for a reproducible sample
+
+# --- Sample row groups until the confidence interval clears or breaches the threshold ---
+result = reconcile(path1, path2, engine="sample", threshold=THRESHOLD, confidence=CONFIDENCE,
+                   fraction=MAX_FRACTION, seed=SEED)
+e = result.extra
+
+print(f"Estimated match rate: {e['estimated_match_rate']:.6f}  "
+      f"({e['look_confidence']:.2%} CI {e['ci_low']:.6f} .. {e['ci_high']:.6f}, "
+      f"{e['looks']} looks, design effect {e['design_effect']:.1f})")
+print(f"Sampled {e['sampled_rows']:,} of {e['total_rows']:,} rows ({e['sampled_fraction']:.1%}, "
+      f"{e['row_groups_read']}/{e['row_groups']} row groups) in {result.timings['total']:.3f} sec")
+print(f"Decision vs {THRESHOLD}: {e['decision']}")
+
+# Non-zero exit code so a pipeline step can gate on it
+sys.exit(0 if e["decision"] == "pass" else 1)
@@ -0,0 +1,13 @@
+from recon import reconcile
+from utils_results import record_result
+
+# --- Config ---
+BATCH_SIZE = 131_072   # rows per chunk and side; memory stays bounded by one chunk
+
+# Stream aligned chunks into pandas (Arrow-backed dtypes) and accumulate the counts
+result = reconcile("data.parquet", "data_modified.parquet", engine="pandas_chunked", batch_size=BATCH_SIZE)
+print(f"Row-level match rate: {result.match_rate:.10f}")
+
+# --- Update & persist results ---
+results = record_result("Pandas\n(Chunked)", result)
+print(results)
@@ -0,0 +1,27 @@
+import os
+
+# --- Config ---
+THREADS = None          # Polars sizes its thread pool once, at import: set it before importing
+if THREADS:
+    os.environ["POLARS_MAX_THREADS"] = str(THREADS)
+WRITE_MISMATCHES = True  # streamed to mismatches/polars_lazy.parquet by the same query
+SHOW_PLAN = True
+
+from recon import reconcile
+from recon.mismatch import mismatch_path
+from utils_results import record_result
+
+# One lazy query: counts and mismatching rows from a single streaming pass
+result = reconcile(
+    "data.parquet", "data_modified.parquet", engine="polars_lazy",
+    mismatches=mismatch_path("polars_lazy") if WRITE_MISMATCHES else None,
+    explain=SHOW_PLAN,
+)
+
+if SHOW_PLAN:
+    print(result.extra["plan"], end="\n\n")
+print(f"Row-level match rate: {result.match_rate:.10f}  ({result.extra['threads']} threads)")
+
+# --- Update & persist results ---
+results = record_result("Polars\n(Lazy sink)", result)
+print(results)
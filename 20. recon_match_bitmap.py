@@ -0,0 +1,44 @@
+from pathlib import Path
+
+from recon import reconcile
+from recon.bitmap import MatchBitmap, bitmap_path, drill_down
+from utils_results import record_result
+
+# --- Config ---
+LEFT, RIGHT = "data.parquet", "data_modified.parquet"
+ENGINE = "pyarrow"
+DRILL_COLUMNS = None   # columns shown for mismatching rows (None = all)
+DRILL_LIMIT = 20
+KEY_COL, KEY_RANGE = "row", (1, 10_001)   # mismatching keys listed for this [lo, hi)
+
+# The previous run's bitmap, kept to see what changed since
+path = bitmap_path(ENGINE)
+previous = MatchBitmap.load(path) if path.exists() else None
+if previous is not None:
+    path.replace(path.with_suffix(".previous.parquet"))
+
+# Counts as usual, plus the run-length encoded positions of every mismatching row
+result = reconcile(LEFT, RIGHT, engine=ENGINE, bitmap=path)
+bitmap = MatchBitmap.load(result.extra["bitmap"])
+print(f"Row-level match rate: {result.match_rate:.10f}")
+print(f"{bitmap} in {Path(result.extra['bitmap']).stat().st_size:,} bytes")
+
+# --- Set operations against the previous run ---
+if previous is not None and previous.num_rows == bitmap.num_rows:
+    print(f"Still mismatching: {len(bitmap & previous):,}  new: {len(bitmap - previous):,}  "
+          f"fixed: {len(previous - bitmap):,}")
+
+# --- Range query: mismatches per tenth of the file ---
+step = max(1, -(-bitmap.num_rows // 10))
+for lo in range(0, bitmap.num_rows, step):
+    print(f"  rows {lo:>12,} - {min(lo + step, bitmap.num_rows):>12,}: {bitmap.count_range(lo, lo + step):,}")
+
+# --- Key-range query: only the key column of row groups in range is read ---
+print(bitmap.rows_by_key(LEFT, KEY_COL, *KEY_RANGE).to_pandas())
+
+# --- Drill-down: only the row groups holding mismatches are read ---
+print(drill_down(LEFT, RIGHT, bitmap, columns=DRILL_COLUMNS, limit=DRILL_LIMIT).to_pandas())
+
+# --- Update & persist results ---
+results = record_result("PyArrow\n(Bitmap)", result)
+print(results)
@@ -0,0 +1,28 @@
+from recon.service import DEFAULT_PORT, ReconService, serve
+from utils_results import record_result
+
+# --- Config ---
+HOST, PORT = "127.0.0.1", DEFAULT_PORT   # local only: jobs name arbitrary files
+WORKERS = 2          # jobs running at once
+QUEUE_SIZE = 16      # jobs waiting beyond that; more are refused with 503
+PRELOAD = ["pyarrow", "polars_vectorized", "duckdb"]   # imported before the first job
+RECORD_RESULTS = True  # jobs with a label are appended to the results store
+
+
+def record(job, result):
+    if job["label"]:
+        record_result(job["label"], result)
+
+
+# Stays up until interrupted; submit with recon.service.ServiceClient or POST /jobs
+service = ReconService(workers=WORKERS, queue_size=QUEUE_SIZE, preload=PRELOAD,
+                       on_result=record if RECORD_RESULTS else None)
+server = serve(service, HOST, PORT)
+print(f"Reconciliation service on http://{HOST}:{PORT} ({WORKERS} workers, queue {QUEUE_SIZE})")
+try:
+    server.serve_forever()
+except KeyboardInterrupt:
+    pass
+finally:
+    server.server_close()
+    service.shutdown()
@@ -0,0 +1,13 @@
+# recon/__init__.py
+"""
+Reconcile two Parquet snapshots with interchangeable engines.
+
+    from recon import reconcile
+    result = reconcile("data.parquet", "data_modified.parquet", engine="duckdb")
+    print(result.match_rate, result.timings["total"], result.peak_rss_bytes)
+"""
+from .api import reconcile
+from .engines import ENGINES
+from .result import ReconResult
+
+__all__ = ["reconcile", "ReconResult", "ENGINES"]
@@ -0,0 +1,47 @@
+# recon/api.py
+import time
+from contextlib import nullcontext
+
+from .engines import get_engine
+from .memory import PeakRSS
+from .result import ReconResult
+from .trace import cpu_seconds, read_io_counters, run_summary, tracing
+
+
+def reconcile(left, right, engine: str = "pyarrow", trace=None, **opts) -> ReconResult:
+    """
+    Reconcile two Parquet files with the chosen engine.
+
+    Engine-specific options (batch_size, key, mismatches, ...) are passed through.
+    The returned result carries the wall-clock time of the whole call (file
+    opening and schema probing included) in timings["total"] and the peak RSS
+    observed while it ran.
+
+    trace: path of a Chrome-trace JSON to record the run into (see recon.trace);
+    its flat summary is also put in result.extra["trace"].
+    """
+    run = get_engine(engine)
+
+    with PeakRSS() as mem, (tracing(engine) if trace is not None else nullcontext()) as tracer:
+        if tracer is not None:
+            io_before, cpu_before = read_io_counters(), cpu_seconds()
+        start_time = time.perf_counter()
+        result = run(left, right, **opts)
+        end_time = time.perf_counter()
+        elapsed_time = end_time - start_time
+
+    result.timings["total"] = elapsed_time
+    result.peak_rss_bytes = mem.peak
+    result.inputs = (str(left), str(right))
+
+    if tracer is not None:
+        io_after = read_io_counters()
+        io_delta = {k: io_after[k] - io_before[k] for k in io_after.keys() & io_before.keys()}
+        if not tracer.events:
+            # The engine recorded nothing itself: lay its phase totals out in order
+            tracer.phases(start_time, result.timings)
+        tracer.complete("reconcile", start_time, end_time, cat="run", engine=engine)
+        summary = run_summary(tracer, result, elapsed_time, cpu_seconds() - cpu_before, io_delta)
+        tracer.export(trace, summary)
+        result.extra["trace"] = summary
+    return result
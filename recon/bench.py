@@ -0,0 +1,144 @@
+# recon/bench.py
+import json, math, os, platform, socket, statistics, sys
+from datetime import datetime, timezone
+from importlib import metadata
+from pathlib import Path
+
+from .api import reconcile
+
+BENCH_DIR = Path("benchmarks")
+SCHEMA_VERSION = 1
+LIBRARIES = ["pyarrow", "pandas", "polars", "duckdb", "numpy"]
+
+
+def machine_info() -> dict:
+    # Tags every record so numbers from different boxes are never mixed up
+    versions = {}
+    for lib in LIBRARIES:
+        try:
+            versions[lib] = metadata.version(lib)
+        except metadata.PackageNotFoundError:
+            versions[lib] = None
+    return {
+        "host": socket.gethostname(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "python": sys.version.split()[0],
+        "libraries": versions,
+    }
+
+
+def drop_page_cache(paths) -> bool:
+    """
+    Ask the OS to evict the files from the page cache (no root needed).
+    Returns False where posix_fadvise isn't available, i.e. cold runs aren't really cold.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return False
+    for path in paths:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    return True
+
+
+def warm_page_cache(paths, block: int = 1 << 24) -> None:
+    # Read every byte once so the following run is served from memory
+    for path in paths:
+        with open(path, "rb") as f:
+            while f.read(block):
+                pass
+
+
+def summarize(values: list) -> dict:
+    values = sorted(v for v in values if v is not None)
+    if not values:
+        return {}
+    # Nearest-rank p95: with few repetitions it is simply the slowest run or close to it
+    p95 = values[math.ceil(0.95 * len(values)) - 1]
+    return {
+        "median": statistics.median(values),
+        "p95": p95,
+        "stddev": statistics.stdev(values) if len(values) > 1 else 0.0,
+        "min": values[0],
+        "max": values[-1],
+        "mean": statistics.fmean(values),
+    }
+
+
+def benchmark(left, right, engine: str, opts: dict = None, *, label: str = None,
+              warmup: int = 1, repeat: int = 5, cache: str = "warm") -> dict:
+    """
+    Run one engine warmup + repeat times and summarize per-phase timings and peak RSS.
+
+    cache="cold" evicts both files from the page cache before every run (warmup
+    included); cache="warm" reads them once up front so every run starts hot.
+    """
+    if cache not in ("cold", "warm"):
+        raise ValueError(f"cache must be 'cold' or 'warm', got {cache!r}")
+    if repeat < 1:
+        raise ValueError("repeat must be at least 1")
+    opts = opts or {}
+    paths = [left, right]
+
+    cold_supported = True
+    if cache == "warm":
+        warm_page_cache(paths)
+
+    runs = []
+    for i in range(warmup + repeat):
+        if cache == "cold":
+            cold_supported = drop_page_cache(paths)
+        result = reconcile(left, right, engine=engine, **opts)
+        if i < warmup:
+            continue
+
+        timings = dict(result.timings)
+        # Whatever the engine didn't attribute to a phase (opening files, planning, ...)
+        timings["other"] = max(0.0, timings["total"] - sum(v for k, v in timings.items() if k != "total"))
+        runs.append({"timings": timings, "peak_rss_bytes": result.peak_rss_bytes})
+
+    phases = sorted({phase for run in runs for phase in run["timings"]})
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "machine": machine_info(),
+        "label": label or engine,
+        "engine": engine,
+        "options": {k: str(v) for k, v in opts.items()},
+        "dataset": {
+            "left": str(left), "right": str(right),
+            "left_bytes": os.path.getsize(left), "right_bytes": os.path.getsize(right),
+            "rows": result.total_rows,
+        },
+        "match_rate": result.match_rate,
+        "cache": cache,
+        "cold_cache_supported": cold_supported,
+        "warmup": warmup,
+        "repeat": repeat,
+        "runs": runs,
+        "stats": {
+            **{phase: summarize([run["timings"].get(phase) for run in runs]) for phase in phases},
+            "peak_rss_bytes": summarize([run["peak_rss_bytes"] for run in runs]),
+        },
+    }
+
+
+def save_benchmark(record: dict, bench_dir: Path = BENCH_DIR) -> Path:
+    """Append one record to benchmarks/<host>.jsonl; nothing is ever overwritten."""
+    bench_dir.mkdir(parents=True, exist_ok=True)
+    path = bench_dir / f"{record['machine']['host']}.jsonl"
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+    return path
+
+
+def load_benchmarks(bench_dir: Path = BENCH_DIR, host: str = None) -> list:
+    records = []
+    for path in sorted(bench_dir.glob(f"{host or '*'}.jsonl")):
+        with open(path, encoding="utf-8") as f:
+            records.extend(json.loads(line) for line in f if line.strip())
+    return [r for r in records if r.get("schema_version") == SCHEMA_VERSION]
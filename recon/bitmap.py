@@ -0,0 +1,254 @@
+# recon/bitmap.py
+import json
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from .compare import dictionary_columns as detect_dictionary_columns
+from .filters import arrow_mask, prune_row_groups
+from .footer import read_footer
+
+BITMAP_DIR = Path("bitmaps")
+BITMAP_METADATA_KEY = b"recon_bitmap"
+
+
+def bitmap_path(engine: str) -> Path:
+    # One bitmap per engine, e.g. bitmaps/pyarrow.parquet (overwritten by the next run)
+    BITMAP_DIR.mkdir(exist_ok=True)
+    return BITMAP_DIR / f"{engine}.parquet"
+
+
+class MatchBitmap:
+    """
+    Per-row match result of one run, run-length encoded: the mismatching row positions
+    (0-based, in the left file) as sorted, disjoint [start, start + length) runs. Matching
+    rows cost nothing, so 7M rows with a few hundred mismatches take a few KB.
+
+    compared_rows: rows the run actually compared (fewer than num_rows with filters);
+    matched = compared_rows - mismatched. Bitmaps over the same file combine with
+    & | - ^ (rows mismatching in both runs, in either, only in the first, ...).
+    Ranges are queried by position (count_range, rows) or by key (rows_by_key).
+    """
+
+    def __init__(self, starts, lengths, num_rows: int, compared_rows: int = None):
+        self.starts = np.asarray(starts, dtype=np.int64)
+        self.lengths = np.asarray(lengths, dtype=np.int64)
+        self.num_rows = num_rows
+        self.compared_rows = num_rows if compared_rows is None else compared_rows
+
+    @classmethod
+    def from_positions(cls, positions, num_rows: int, compared_rows: int = None) -> "MatchBitmap":
+        # Sorted, unique mismatching positions -> runs of consecutive positions
+        positions = np.asarray(positions, dtype=np.int64)
+        if len(positions) == 0:
+            return cls([], [], num_rows, compared_rows)
+        breaks = np.flatnonzero(np.diff(positions) != 1) + 1
+        starts = positions[np.concatenate(([0], breaks))]
+        ends = positions[np.concatenate((breaks - 1, [len(positions) - 1]))] + 1
+        return cls(starts, ends - starts, num_rows, compared_rows)
+
+    # --- Counting and range queries ---
+    @property
+    def mismatched(self) -> int:
+        return int(self.lengths.sum())
+
+    @property
+    def matched(self) -> int:
+        return self.compared_rows - self.mismatched
+
+    def count_range(self, lo: int, hi: int) -> int:
+        """Mismatching rows with lo <= position < hi."""
+        ends = self.starts + self.lengths
+        clipped = np.minimum(ends, hi) - np.maximum(self.starts, lo)
+        return int(clipped[clipped > 0].sum())
+
+    def rows(self, lo: int = 0, hi: int = None) -> np.ndarray:
+        """Mismatching positions in [lo, hi), expanded from the runs."""
+        hi = self.num_rows if hi is None else hi
+        ends = self.starts + self.lengths
+        first, last = np.searchsorted(ends, lo, side="right"), np.searchsorted(self.starts, hi)
+        parts = [np.arange(max(s, lo), min(e, hi)) for s, e in zip(self.starts[first:last], ends[first:last])]
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+
+    def rows_by_key(self, path, key_col: str, lo=None, hi=None) -> pa.Table:
+        """
+        Mismatching rows whose key (a column of the left file `path`, e.g. the engines'
+        label_col) lies in [lo, hi), as a table of row_index and key. Only row groups
+        whose statistics overlap the range and that hold a mismatch are read, and of
+        those only the key column.
+        """
+        filters = ([(key_col, ">=", lo)] if lo is not None else []) + ([(key_col, "<", hi)] if hi is not None else [])
+        meta = read_footer(path)
+        pf = pq.ParquetFile(path, metadata=meta)
+        starts = np.concatenate(([0], np.cumsum([meta.row_group(i).num_rows for i in range(meta.num_row_groups)])))
+        parts = []
+        for rg in prune_row_groups(meta, filters):
+            rows = self.rows(starts[rg], starts[rg + 1])
+            if not len(rows):
+                continue
+            keys = pf.read_row_group(rg, columns=[key_col]).column(key_col).take(pa.array(rows - starts[rg]))
+            part = pa.table({"row_index": rows, key_col: keys})
+            parts.append(part.filter(arrow_mask(part, filters)) if filters else part)
+        if not parts:
+            return pa.schema([pa.field("row_index", pa.int64()), meta.schema.to_arrow_schema().field(key_col)]).empty_table()
+        return pa.concat_tables(parts)
+
+    def __contains__(self, position: int) -> bool:
+        if len(self.starts) == 0:
+            return False
+        i = np.searchsorted(self.starts, position, side="right") - 1
+        return bool(i >= 0 and position < self.starts[i] + self.lengths[i])
+
+    def __len__(self) -> int:
+        return self.mismatched
+
+    # --- Set operations across runs ---
+    def _combine(self, other: "MatchBitmap", keep) -> "MatchBitmap":
+        # Cut the row space at every run boundary of either side, keep the pieces where
+        # keep(in_self, in_other) holds and merge adjacent ones; never expands the runs
+        # compared_rows is carried over from the left operand
+        if self.num_rows != other.num_rows:
+            raise ValueError(f"Bitmaps cover different files: {self.num_rows} vs {other.num_rows} rows")
+        bounds = np.unique(np.concatenate((self.starts, self.starts + self.lengths,
+                                           other.starts, other.starts + other.lengths)))
+        if len(bounds) < 2:
+            return MatchBitmap([], [], self.num_rows, self.compared_rows)
+        lo, hi = bounds[:-1], bounds[1:]
+        mask = keep(self._covers(lo), other._covers(lo))
+        lo, hi = lo[mask], hi[mask]
+        # Pieces that touch the previous piece continue its run
+        new_run = np.concatenate(([True], lo[1:] != hi[:-1])) if len(lo) else np.empty(0, dtype=bool)
+        starts = lo[new_run]
+        ends = hi[np.concatenate((np.flatnonzero(new_run)[1:] - 1, [len(hi) - 1]))] if len(lo) else hi
+        return MatchBitmap(starts, ends - starts, self.num_rows, self.compared_rows)
+
+    def _covers(self, points: np.ndarray) -> np.ndarray:
+        if len(self.starts) == 0:
+            return np.zeros(len(points), dtype=bool)
+        i = np.searchsorted(self.starts, points, side="right") - 1
+        return (i >= 0) & (points < (self.starts + self.lengths)[np.maximum(i, 0)])
+
+    def __and__(self, other):
+        return self._combine(other, np.logical_and)
+
+    def __or__(self, other):
+        return self._combine(other, np.logical_or)
+
+    def __sub__(self, other):
+        return self._combine(other, lambda a, b: a & ~b)
+
+    def __xor__(self, other):
+        return self._combine(other, np.logical_xor)
+
+    def __eq__(self, other):
+        return (isinstance(other, MatchBitmap) and self.num_rows == other.num_rows
+                and np.array_equal(self.starts, other.starts) and np.array_equal(self.lengths, other.lengths))
+
+    def __repr__(self):
+        return (f"MatchBitmap({self.mismatched:,} mismatched of {self.compared_rows:,} compared rows, "
+                f"{len(self.starts):,} runs)")
+
+    # --- Persistence ---
+    def save(self, path) -> Path:
+        # Two delta-encoded integer columns; a few hundred runs compress to a few KB
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        info = {"num_rows": self.num_rows, "compared_rows": self.compared_rows}
+        table = pa.table({"start": self.starts, "length": self.lengths}).replace_schema_metadata(
+            {BITMAP_METADATA_KEY: json.dumps(info)})
+        pq.write_table(table, path, use_dictionary=False, compression="zstd",
+                       column_encoding={"start": "DELTA_BINARY_PACKED", "length": "DELTA_BINARY_PACKED"})
+        return path
+
+    @classmethod
+    def load(cls, path) -> "MatchBitmap":
+        table = pq.read_table(path)
+        info = json.loads(table.schema.metadata[BITMAP_METADATA_KEY])
+        return cls(table["start"].to_numpy(), table["length"].to_numpy(), info["num_rows"], info["compared_rows"])
+
+
+class BitmapBuilder:
+    """Accumulate mismatching positions batch by batch (in increasing order) into runs."""
+
+    def __init__(self, num_rows: int):
+        self.num_rows = num_rows
+        self._positions = []
+
+    def add(self, positions) -> None:
+        # positions: mismatching file positions of one batch
+        if len(positions):
+            # Stored as runs right away, so memory follows the runs, not the mismatches
+            bitmap = MatchBitmap.from_positions(positions, self.num_rows)
+            self._positions.append((bitmap.starts, bitmap.lengths))
+
+    def finish(self, compared_rows: int = None) -> MatchBitmap:
+        # compared_rows: the run's total (row groups skipped as identical count as compared)
+        if not self._positions:
+            return MatchBitmap([], [], self.num_rows, compared_rows)
+        starts = np.concatenate([s for s, _ in self._positions])
+        lengths = np.concatenate([n for _, n in self._positions])
+        # Runs that continue across a batch boundary are merged
+        ends = starts + lengths
+        new_run = np.concatenate(([True], starts[1:] != ends[:-1]))
+        run_ends = ends[np.concatenate((np.flatnonzero(new_run)[1:] - 1, [len(ends) - 1]))]
+        starts = starts[new_run]
+        return MatchBitmap(starts, run_ends - starts, self.num_rows, compared_rows)
+
+
+def mismatch_positions(row_equal, positions=None, offset: int = 0) -> np.ndarray:
+    """
+    File positions of the rows whose row_equal is not True (null counts as a mismatch).
+    positions: batch positions of the rows in row_equal, when only a subset was compared.
+    """
+    idx = pc.indices_nonzero(pc.invert(pc.fill_null(row_equal, False))).to_numpy()
+    if positions is not None:
+        idx = np.asarray(positions)[idx]
+    return idx.astype(np.int64) + offset
+
+
+def drill_down(left, right, bitmap: MatchBitmap, columns: list = None, lo: int = 0, hi: int = None,
+               limit: int = None) -> pa.Table:
+    """
+    Side-by-side values of mismatching rows, reading only the row groups that hold them
+    (no rescan of the rest, no compare). Columns come out as <name> and <name>_right next
+    to row_index; lo / hi / limit narrow the rows, columns the columns decoded.
+    """
+    rows = bitmap.rows(lo, hi)
+    if limit is not None:
+        rows = rows[:limit]
+    meta1, meta2 = read_footer(left), read_footer(right)
+    schema = meta1.schema.to_arrow_schema()
+    columns = columns or schema.names
+
+    layout = [meta1.row_group(i).num_rows for i in range(meta1.num_row_groups)]
+    if layout != [meta2.row_group(i).num_rows for i in range(meta2.num_row_groups)]:
+        raise ValueError("Row-group layout mismatch: drill-down needs identically chunked files")
+    starts = np.concatenate(([0], np.cumsum(layout)))
+
+    # Low-cardinality strings are read as codes; only the few rows taken get decoded
+    dictionary = detect_dictionary_columns(meta1, meta2, schema)
+    pf1 = pq.ParquetFile(left, metadata=meta1, read_dictionary=dictionary)
+    pf2 = pq.ParquetFile(right, metadata=meta2, read_dictionary=dictionary)
+
+    parts = []
+    group_of = np.searchsorted(starts, rows, side="right") - 1
+    for rg in np.unique(group_of):
+        local = pa.array(rows[group_of == rg] - starts[rg])
+        t1 = pf1.read_row_group(int(rg), columns=columns).take(local)
+        t2 = pf2.read_row_group(int(rg), columns=columns).take(local)
+        arrays = [pa.array(rows[group_of == rg])]
+        names = ["row_index"]
+        for c in columns:
+            value_type = schema.field(c).type
+            arrays += [t1.column(c).cast(value_type), t2.column(c).cast(value_type)]
+            names += [c, f"{c}_right"]
+        parts.append(pa.table(arrays, names=names))
+    if not parts:
+        fields = [pa.field("row_index", pa.int64())]
+        for c in columns:
+            fields += [schema.field(c), schema.field(c).with_name(f"{c}_right")]
+        return pa.schema(fields).empty_table()
+    return pa.concat_tables(parts)
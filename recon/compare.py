@@ -0,0 +1,65 @@
+# recon/compare.py
+import pyarrow as pa
+import pyarrow.compute as pc
+
+
+def dictionary_columns(meta1, meta2, schema: pa.Schema) -> list:
+    """
+    String/binary columns stored dictionary-encoded in every row group of both files.
+
+    Those are the low-cardinality ones (the writer falls back to plain encoding
+    once a dictionary grows too large), so reading them with read_dictionary
+    keeps them as small integer codes instead of materializing every string.
+    """
+    candidates = [
+        f.name for f in schema
+        if pa.types.is_string(f.type) or pa.types.is_large_string(f.type)
+        or pa.types.is_binary(f.type) or pa.types.is_large_binary(f.type)
+    ]
+
+    def all_dictionary_encoded(meta, name) -> bool:
+        for rg in range(meta.num_row_groups):
+            rg_meta = meta.row_group(rg)
+            for ci in range(rg_meta.num_columns):
+                col_meta = rg_meta.column(ci)
+                if col_meta.path_in_schema == name and not col_meta.has_dictionary_page:
+                    return False
+        return True
+
+    return [c for c in candidates if all_dictionary_encoded(meta1, c) and all_dictionary_encoded(meta2, c)]
+
+
+def _chunks(values) -> list:
+    return values.chunks if isinstance(values, pa.ChunkedArray) else [values]
+
+
+def shared_dictionary_codes(a, b) -> tuple:
+    """
+    Integer codes for two dictionary columns, expressed against one shared dictionary.
+
+    When both sides already carry the same dictionary their indices are used as is;
+    otherwise the dictionaries are unified (b's codes remapped onto a's values, new
+    values appended), so equal codes always mean equal values. Nulls stay null.
+    Accepts Arrays or ChunkedArrays and returns the same kind.
+    """
+    chunks_a, chunks_b = _chunks(a), _chunks(b)
+
+    dictionaries = [c.dictionary for c in chunks_a + chunks_b]
+    if all(d.equals(dictionaries[0]) for d in dictionaries[1:]):
+        codes = [c.indices for c in chunks_a + chunks_b]
+    else:
+        unified = pa.chunked_array(chunks_a + chunks_b, type=a.type).unify_dictionaries()
+        codes = [c.indices for c in unified.chunks]
+
+    codes_a, codes_b = codes[:len(chunks_a)], codes[len(chunks_a):]
+    if isinstance(a, pa.ChunkedArray):
+        index_type = a.type.index_type
+        return pa.chunked_array(codes_a, type=index_type), pa.chunked_array(codes_b, type=index_type)
+    return codes_a[0], codes_b[0]
+
+
+def equal(a, b):
+    # pc.equal semantics (null in -> null out); dictionary columns compare by code
+    if pa.types.is_dictionary(a.type) and pa.types.is_dictionary(b.type):
+        return pc.equal(*shared_dictionary_codes(a, b))
+    return pc.equal(a, b)
@@ -0,0 +1,108 @@
+# recon/dataset.py
+import os, struct
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from .fingerprint import build_index, diff_row_groups
+from .footer import footer_plan
+
+
+def list_files(root) -> dict:
+    """
+    Parquet files under a (Hive-partitioned) directory, keyed by their path relative to it,
+    e.g. {"year=2024/month=01/part-0.parquet": Path(...)}. Sidecars are left out.
+    """
+    root = Path(root)
+    dataset = ds.dataset(root, format="parquet", partitioning="hive", exclude_invalid_files=False,
+                         ignore_prefixes=[".", "_"])
+    files = {}
+    for f in dataset.files:
+        path = Path(f)
+        if path.suffix == ".parquet" and not path.name.endswith(".digest.parquet"):
+            files[path.relative_to(root).as_posix()] = path
+    return dict(sorted(files.items()))
+
+
+def partition_of(relative_path: str) -> str:
+    # "year=2024/month=01/part-0.parquet" -> "year=2024/month=01" ("" for the root)
+    return relative_path.rpartition("/")[0]
+
+
+def footer_bytes(path: Path) -> bytes:
+    # Parquet ends with <footer><4-byte footer length>PAR1
+    with open(path, "rb") as f:
+        f.seek(-8, os.SEEK_END)
+        length = struct.unpack("<I", f.read(4))[0]
+        f.seek(-8 - length, os.SEEK_END)
+        return f.read(length)
+
+
+def identical(left: Path, right: Path, how: str) -> bool:
+    """
+    Whether a file pair can be skipped as equal without decoding it. Both modes are
+    proofs; chunks that may hold nulls or NaN never count as proven equal.
+
+    "footer": every column chunk is proven equal from the footers and, where the
+        statistics agree, from its raw bytes, read block by block and stopping at the
+        first difference (see recon.footer.footer_plan).
+    "fingerprint": every column chunk's raw bytes hash the same (see recon.fingerprint).
+        Both files are read in full; the indexes are built in memory, no sidecar is
+        written into the input tree.
+    """
+    if how == "footer":
+        plan = footer_plan(left, right)
+    elif how == "fingerprint":
+        plan = diff_row_groups(build_index(left), build_index(right))
+    else:
+        raise ValueError(f"skip_identical must be 'footer', 'fingerprint' or None, got {how!r}")
+    return plan is not None and not plan[1]
+
+
+def pair_files(left_root, right_root) -> tuple:
+    """
+    Match files by relative path. Returns (pairs, left_only, right_only): pairs is a
+    list of (relative path, left path, right path), the others are {relative path: path}.
+    """
+    left_files, right_files = list_files(left_root), list_files(right_root)
+    pairs = [(rel, left_files[rel], right_files[rel]) for rel in left_files if rel in right_files]
+    left_only = {rel: p for rel, p in left_files.items() if rel not in right_files}
+    right_only = {rel: p for rel, p in right_files.items() if rel not in left_files}
+    return pairs, left_only, right_only
+
+
+def _reconcile_pair(left, right, engine: str, opts: dict, skip_identical: str = None):
+    # Worker: imported here so each process only loads the engine it runs
+    from .api import reconcile
+    from .result import ReconResult
+    left, right = Path(left), Path(right)
+    if skip_identical is not None and identical(left, right, skip_identical):
+        # Nothing differs now: outputs of an earlier run over this pair are stale
+        for option in ("mismatches", "bitmap"):
+            if opts.get(option) is not None:
+                Path(opts[option]).unlink(missing_ok=True)
+        return ReconResult(engine, file_rows(left), 0, extra={"skipped": True})
+    return reconcile(left, right, engine=engine, **opts)
+
+
+def reconcile_pairs(jobs: list, engine: str, max_workers: int = None, skip_identical: str = None) -> dict:
+    """
+    Run one engine over (relative path, left, right, opts) jobs on a process pool.
+    With skip_identical, each worker first tries to prove its pair equal (see identical())
+    and, if it can, counts every row as matched with extra["skipped"] set.
+    Returns {relative path: ReconResult}.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1 or len(jobs) <= 1:
+        return {rel: _reconcile_pair(left, right, engine, opts, skip_identical)
+                for rel, left, right, opts in jobs}
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(jobs))) as pool:
+        futures = {rel: pool.submit(_reconcile_pair, str(left), str(right), engine, opts, skip_identical)
+                   for rel, left, right, opts in jobs}
+        return {rel: f.result() for rel, f in futures.items()}
+
+
+def file_rows(path: Path) -> int:
+    return pq.read_metadata(path).num_rows
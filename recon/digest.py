@@ -0,0 +1,221 @@
+# recon/digest.py
+import hashlib, json, os
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from .compare import dictionary_columns
+from .rowhash import fold, hashable, new_hashes, raw_values
+
+DIGEST_SUFFIX = ".digest.parquet"
+DIGEST_VERSION = 2  # 2: values mixed before folding, strings hashed from their bytes
+DIGEST_METADATA_KEY = b"recon_digest"
+HASH_COL = "row_hash"
+NULL_HASH = np.uint64(0x6A09E667F3BCC908)  # every null hashes the same, so null == null
+READ_BATCH_ROWS = 131_072
+
+
+def digest_path(path) -> Path:
+    # Sidecar lives next to the Parquet file: data.parquet -> data.parquet.digest.parquet
+    return Path(str(path) + DIGEST_SUFFIX)
+
+
+def _stable_hash(value) -> int:
+    # Python's hash() is salted per process, so it can't be persisted
+    data = value if isinstance(value, bytes) else str(value).encode()
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+def _is_binary_like(data_type: pa.DataType) -> bool:
+    return (pa.types.is_string(data_type) or pa.types.is_large_string(data_type)
+            or pa.types.is_binary(data_type) or pa.types.is_large_binary(data_type))
+
+
+def _bytes_hashes(values: pa.Array) -> np.ndarray:
+    """
+    A uint64 per string/binary value, from its bytes, vectorised: the length, then the
+    bytes 8 at a time (little-endian words, zero-padded), folded like a row hash. One
+    NumPy pass per 8 bytes of the longest value, over the values still that long.
+    """
+    n = len(values)
+    offset_type = np.int64 if pa.types.is_large_string(values.type) or pa.types.is_large_binary(values.type) \
+        else np.int32
+    offsets = np.frombuffer(values.buffers()[1], dtype=offset_type)[values.offset:values.offset + n + 1]
+    data = values.buffers()[2]
+    data = np.frombuffer(data, dtype=np.uint8) if data is not None else np.empty(0, dtype=np.uint8)
+    starts = offsets[:-1].astype(np.int64)
+    lengths = np.diff(offsets).astype(np.int64)
+
+    h = new_hashes(n)
+    fold(h, lengths.view(np.uint64))
+    padded = np.concatenate((data, np.zeros(8, dtype=np.uint8)))
+    lanes = np.arange(8)
+    for k in range(0, int(lengths.max(initial=0)), 8):
+        active = np.flatnonzero(lengths > k)
+        words = padded[(starts[active] + k)[:, None] + lanes]
+        words[lanes >= (lengths[active] - k)[:, None]] = 0  # bytes past the value's end
+        sub = h[active]
+        fold(sub, words.view("<u8").ravel())
+        h[active] = sub
+    return h
+
+
+def _value_hashes(values: pa.Array) -> np.ndarray:
+    """
+    A stable uint64 per value, independent of batch boundaries and library versions:
+    raw bits for fixed-width types, a hash of the bytes for strings and binaries
+    (dictionary columns: hashed once per entry, then gathered by code), blake2b of the
+    Python value for anything else (nested types).
+    """
+    if pa.types.is_boolean(values.type):
+        values = pc.cast(values, pa.uint8())
+    elif pa.types.is_floating(values.type):
+        values = pc.add(values, pa.scalar(0.0, values.type))  # -0.0 + 0.0 == +0.0
+    elif pa.types.is_decimal(values.type):
+        values = pc.cast(values, pa.string())
+    elif pa.types.is_string_view(values.type) or pa.types.is_binary_view(values.type):
+        values = pc.cast(values, pa.large_binary())
+
+    if hashable(values.type):
+        hashes = raw_values(values).astype(np.uint64)
+    elif _is_binary_like(values.type):
+        hashes = _bytes_hashes(values)
+    else:
+        if not pa.types.is_dictionary(values.type):
+            values = pc.dictionary_encode(values)
+        if _is_binary_like(values.dictionary.type):
+            entries = _bytes_hashes(values.dictionary)
+        else:
+            entries = np.array([_stable_hash(v) for v in values.dictionary.to_pylist()], dtype=np.uint64)
+        entries = entries if len(entries) else np.zeros(1, dtype=np.uint64)
+        # Null codes point at entry 0 here and are overwritten below
+        codes = pc.fill_null(values.indices, 0).to_numpy(zero_copy_only=False)
+        hashes = entries[codes]
+
+    if values.null_count:
+        hashes[values.is_null().to_numpy(zero_copy_only=False)] = NULL_HASH
+    return hashes
+
+
+def batch_digest(batch: pa.RecordBatch, key_col: str, columns: list) -> pa.RecordBatch:
+    # key -> one 64-bit hash over every other column, in schema order
+    h = new_hashes(batch.num_rows)
+    for c in columns:
+        fold(h, _value_hashes(batch.column(c)))
+    return pa.record_batch([batch.column(key_col), pa.array(h, pa.uint64())], names=[key_col, HASH_COL])
+
+
+def _open(path) -> pq.ParquetFile:
+    # Low-cardinality strings stay dictionary-encoded, so each distinct value is hashed once
+    meta = pq.read_metadata(path)
+    return pq.ParquetFile(path, metadata=meta,
+                          read_dictionary=dictionary_columns(meta, meta, meta.schema.to_arrow_schema()))
+
+
+def compute_digest(path, key_col: str = "row") -> pa.Table:
+    # In-memory digest of a Parquet file, for deliveries that won't become a baseline
+    pf = _open(path)
+    columns = [c for c in pf.schema_arrow.names if c != key_col]
+    batches = [batch_digest(b, key_col, columns) for b in pf.iter_batches(batch_size=READ_BATCH_ROWS)]
+    if not batches:  # an empty file has no batch to take the schema from
+        return pa.schema([pf.schema_arrow.field(key_col), pa.field(HASH_COL, pa.uint64())]).empty_table()
+    return pa.Table.from_batches(batches)
+
+
+def _source_stamp(path: Path, key_col: str) -> dict:
+    stat = path.stat()
+    return {"version": DIGEST_VERSION, "key": key_col, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def read_digest_info(path) -> dict:
+    metadata = pq.read_metadata(path).metadata or {}
+    raw = metadata.get(DIGEST_METADATA_KEY)
+    return json.loads(raw) if raw else {}
+
+
+def build_digest(path, key_col: str = "row", out=None) -> Path:
+    """
+    Stream a Parquet file once and persist its (key, row_hash) digest as Parquet.
+    16 bytes per row, so a baseline stays cheap to keep around after the raw file is gone.
+    """
+    path = Path(path)
+    out = Path(out) if out is not None else digest_path(path)
+    pf = _open(path)
+    schema = pq.read_schema(path)
+    if key_col not in schema.names:
+        raise ValueError(f"Key column '{key_col}' not found in {path}")
+    columns = [c for c in schema.names if c != key_col]
+
+    info = {
+        **_source_stamp(path, key_col),
+        "columns": columns,
+        "schema": schema.to_string(show_schema_metadata=False),
+    }
+    out_schema = pa.schema(
+        [schema.field(key_col), pa.field(HASH_COL, pa.uint64())],
+        metadata={DIGEST_METADATA_KEY: json.dumps(info)},
+    )
+
+    # Hashes don't compress and sorted integer keys delta-encode to almost nothing
+    encodings = {HASH_COL: "PLAIN"}
+    if pa.types.is_integer(schema.field(key_col).type):
+        encodings[key_col] = "DELTA_BINARY_PACKED"
+
+    # Atomic write, same as the fingerprint index
+    tmp = out.with_suffix(".tmp")
+    with pq.ParquetWriter(tmp, out_schema, use_dictionary=False, column_encoding=encodings,
+                          compression={HASH_COL: "NONE", key_col: "SNAPPY"}) as writer:
+        for batch in pf.iter_batches(batch_size=READ_BATCH_ROWS):
+            writer.write_batch(batch_digest(batch, key_col, columns).cast(out_schema))
+    os.replace(tmp, out)
+    return out
+
+
+def load_or_build_digest(path, key_col: str = "row") -> tuple:
+    """
+    Return (digest table, info). `path` is either a digest file (the raw baseline may be
+    long gone) or a Parquet file whose sidecar digest is reused while size and mtime match.
+    """
+    path = Path(path)
+    if str(path).endswith(DIGEST_SUFFIX):
+        sidecar = path
+    else:
+        sidecar = digest_path(path)
+        info = read_digest_info(sidecar) if sidecar.exists() else {}
+        stamp = _source_stamp(path, key_col)
+        if any(info.get(k) != v for k, v in stamp.items()):
+            build_digest(path, key_col, sidecar)
+
+    info = read_digest_info(sidecar)
+    if info.get("version") != DIGEST_VERSION:
+        raise ValueError(f"{sidecar} is not a version {DIGEST_VERSION} digest")
+    if info.get("key") != key_col:
+        raise ValueError(f"{sidecar} is keyed on '{info.get('key')}', not '{key_col}'")
+    return pq.read_table(sidecar), info
+
+
+def compare_digests(base: pa.Table, new: pa.Table, key_col: str) -> tuple:
+    """
+    Full outer hash join of two digests on the key.
+    Returns (matched, mismatched, left_only, right_only) like the keyed DuckDB mode.
+    """
+    def count(mask) -> int:
+        return int(pc.sum(pc.cast(mask, pa.int64())).as_py() or 0)
+
+    # Same keys in the same order (the usual hourly delivery): no join needed
+    if base.num_rows == new.num_rows and base[key_col].equals(new[key_col]):
+        matched = count(pc.equal(base[HASH_COL], new[HASH_COL]))
+        return matched, base.num_rows - matched, 0, 0
+
+    joined = base.rename_columns([key_col, "h1"]).join(
+        new.rename_columns([key_col, "h2"]), keys=key_col, join_type="full outer")
+
+    in_left, in_right = pc.is_valid(joined["h1"]), pc.is_valid(joined["h2"])
+    same = pc.fill_null(pc.equal(joined["h1"], joined["h2"]), False)
+
+    matched = count(same)
+    mismatched = count(pc.and_(pc.and_(in_left, in_right), pc.invert(same)))
+    return matched, mismatched, count(pc.invert(in_right)), count(pc.invert(in_left))
@@ -0,0 +1,25 @@
+# recon/engines/__init__.py
+import importlib
+
+# Engine name -> "module:function". Modules are imported on first use and then stay
+# loaded, so running several engines in one process pays each import only once.
+ENGINES = {
+    "pandas": "recon.engines.pandas_engine:reconcile",
+    "pandas_chunked": "recon.engines.pandas_engine:reconcile_chunked",
+    "duckdb": "recon.engines.duckdb_engine:reconcile",
+    "polars": "recon.engines.polars_engine:reconcile_eager",
+    "polars_streaming": "recon.engines.polars_engine:reconcile_streaming",
+    "polars_vectorized": "recon.engines.polars_engine:reconcile_vectorized",
+    "polars_lazy": "recon.engines.polars_engine:reconcile_lazy",
+    "pyarrow": "recon.engines.pyarrow_engine:reconcile",
+    "digest": "recon.engines.digest_engine:reconcile",
+    "dataset": "recon.engines.dataset_engine:reconcile",
+    "sample": "recon.engines.sample_engine:reconcile",
+}
+
+
+def get_engine(name: str):
+    if name not in ENGINES:
+        raise ValueError(f"Unknown engine '{name}'. Choose from: {', '.join(ENGINES)}")
+    module, func = ENGINES[name].split(":")
+    return getattr(importlib.import_module(module), func)
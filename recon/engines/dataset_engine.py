@@ -0,0 +1,72 @@
+# recon/engines/dataset_engine.py
+from pathlib import Path
+from time import perf_counter
+
+from ..dataset import file_rows, pair_files, partition_of, reconcile_pairs
+from ..result import ReconResult
+
+
+def reconcile(left, right, *, file_engine: str = "pyarrow", workers: int = None,
+              skip_identical: str = "footer", mismatches=None, **opts) -> ReconResult:
+    """
+    Reconcile two partitioned directories file by file and merge the counts.
+
+    Files are paired by their path relative to each root (Hive partitions included).
+    Pairs proven equal by skip_identical ("footer", "fingerprint" or None, see
+    recon.dataset.identical) are counted as matched without decoding; the rest run
+    through `file_engine` with `opts`. Both steps run per pair, spread over `workers`
+    processes. Rows of files or partitions present on one side only count as
+    left-only / right-only. A skipped pair counts all its rows, so skip_identical
+    can't be combined with filters.
+    mismatches: a directory; each pair writes <dir>/<relative path> there.
+    """
+    if skip_identical is not None and opts.get("filters"):
+        raise ValueError("skip_identical counts whole files; it can't be combined with filters")
+    t0 = perf_counter()
+    left, right = Path(left), Path(right)
+    pairs, left_files, right_files = pair_files(left, right)
+    if not pairs and not left_files and not right_files:
+        raise ValueError(f"No Parquet files under {left} or {right}")
+
+    jobs = []
+    for rel, l, r in pairs:
+        pair_opts = dict(opts)
+        if mismatches is not None:
+            out = Path(mismatches) / rel
+            out.parent.mkdir(parents=True, exist_ok=True)
+            pair_opts["mismatches"] = out
+        jobs.append((rel, l, r, pair_opts))
+    t1 = perf_counter()
+
+    # --- Skip pairs proven equal, compare the rest; one file pair per task ---
+    results = reconcile_pairs(jobs, file_engine, max_workers=workers, skip_identical=skip_identical)
+    t2 = perf_counter()
+    skipped = [rel for rel, result in results.items() if result.extra.get("skipped")]
+
+    # --- Merge ---
+    matched_rows = mismatched_rows = left_only = right_only = 0
+    for result in results.values():
+        matched_rows += result.matched_rows
+        mismatched_rows += result.mismatched_rows
+        left_only += result.left_only
+        right_only += result.right_only
+    left_only += sum(file_rows(p) for p in left_files.values())
+    right_only += sum(file_rows(p) for p in right_files.values())
+
+    # Partitions (directories) missing entirely from one side, as opposed to single files
+    left_parts = {partition_of(rel) for rel, _, _ in pairs} | {partition_of(rel) for rel in left_files}
+    right_parts = {partition_of(rel) for rel, _, _ in pairs} | {partition_of(rel) for rel in right_files}
+
+    timings = {"plan": t1 - t0, "compare": t2 - t1, "merge": perf_counter() - t2}
+    return ReconResult(
+        "dataset", matched_rows, mismatched_rows, left_only, right_only, timings=timings,
+        extra={
+            "file_engine": file_engine,
+            "files_compared": len(jobs) - len(skipped),
+            "files_skipped": len(skipped),
+            "left_only_files": sorted(left_files),
+            "right_only_files": sorted(right_files),
+            "left_only_partitions": sorted(left_parts - right_parts),
+            "right_only_partitions": sorted(right_parts - left_parts),
+        },
+    )
@@ -0,0 +1,43 @@
+# recon/engines/digest_engine.py
+from time import perf_counter
+
+import pyarrow.parquet as pq
+
+from ..digest import build_digest, compare_digests, compute_digest, load_or_build_digest
+from ..result import ReconResult
+
+
+def reconcile(left, right, *, key: str = "row", save_digest: bool = False) -> ReconResult:
+    """
+    Keyed reconciliation of a new delivery against a persisted baseline digest.
+
+    left: the baseline, as a digest file (*.digest.parquet) or a Parquet file whose
+        sidecar digest is built once and reused while the file is unchanged.
+    right: the new delivery; only this file is scanned.
+    save_digest: persist the delivery's digest next to it (opt-in, as it writes into
+        the delivery's directory), so it can be the next run's baseline without
+        rescanning (the raw file can then be archived).
+    Nulls compare equal to nulls, like the keyed DuckDB mode.
+    """
+    t0 = perf_counter()
+    base, info = load_or_build_digest(left, key)
+    t1 = perf_counter()
+
+    columns = [c for c in pq.read_schema(right).names if c != key]
+    if columns != info["columns"]:
+        raise ValueError(f"Columns differ from the baseline digest: {columns} vs {info['columns']}")
+
+    # Hash the delivery (written to disk when it is to become the next baseline)
+    if save_digest:
+        new_path = build_digest(right, key)
+        new = pq.read_table(new_path)
+    else:
+        new_path, new = None, compute_digest(right, key)
+    t2 = perf_counter()
+
+    matched, mismatched, left_only, right_only = compare_digests(base, new, key)
+    t3 = perf_counter()
+
+    timings = {"baseline": t1 - t0, "hash": t2 - t1, "probe": t3 - t2}
+    return ReconResult("digest", matched, mismatched, left_only, right_only, timings=timings,
+                       extra={"key": key, "digest": None if new_path is None else str(new_path)})
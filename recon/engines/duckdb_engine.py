@@ -0,0 +1,262 @@
+# recon/engines/duckdb_engine.py
+from pathlib import Path
+from time import perf_counter
+
+import duckdb
+import pyarrow.parquet as pq
+
+from ..bitmap import MatchBitmap
+from ..filters import normalize, to_sql
+from ..footer import read_footer
+from ..mismatch import diff_mask_metadata, MASK_METADATA_KEY
+from ..result import ReconResult
+
+
+# --- Helper: quote identifiers for DuckDB ---
+def quote_ident(col: str) -> str:
+    return '"' + col.replace('"', '""') + '"'
+
+
+def quote_path(path) -> str:
+    # A path as a SQL string literal (paths may come from a service request)
+    return "'" + Path(path).as_posix().replace("'", "''") + "'"
+
+
+def _columns(con, path: Path) -> list:
+    # LIMIT 0 gets the schema without scanning
+    cur = con.execute(f"SELECT * FROM read_parquet({quote_path(path)}) LIMIT 0")
+    return [c[0] for c in cur.description]
+
+
+def _diff_mask(cols: list) -> str:
+    # Bit i set when column i differs (NULL-safe, like the match itself)
+    return " | ".join(
+        f"((t1.{quote_ident(c)} IS DISTINCT FROM t2.{quote_ident(c)})::UBIGINT << {i})"
+        for i, c in enumerate(cols)
+    )
+
+
+def _copy_options(cols: list) -> str:
+    mask_columns = diff_mask_metadata(cols)[MASK_METADATA_KEY].replace("'", "''")
+    return f"(FORMAT PARQUET, KV_METADATA {{{MASK_METADATA_KEY}: '{mask_columns}'}})"
+
+
+ALIGN_MODES = ("positional", "file_row_number")
+
+
+def _aligned(left: Path, right: Path, align: str, row_numbers: bool = False) -> str:
+    # Bare scans only: wrapping a side in a subquery makes DuckDB materialise the
+    # positional join instead of running it as a POSITIONAL_SCAN of both files
+    if align == "file_row_number":
+        return (f"read_parquet({quote_path(left)}, file_row_number = true) t1 JOIN "
+                f"read_parquet({quote_path(right)}, file_row_number = true) t2 "
+                f"ON t1.file_row_number = t2.file_row_number")
+    numbered = ", file_row_number = true" if row_numbers else ""
+    return f"read_parquet({quote_path(left)}{numbered}) t1 POSITIONAL JOIN read_parquet({quote_path(right)}) t2"
+
+
+def reconcile(left, right, *, key: str = None, align: str = "positional", columns: list = None,
+              filters=None, mismatches=None, label_col: str = "row", threads: int = None,
+              temp_directory=None, memory_limit: str = None, con=None, bitmap=None) -> ReconResult:
+    """
+    Reconcile two Parquet files inside DuckDB.
+
+    key: None aligns rows by position; a column name does a full outer hash join on it
+        and also reports left-only / right-only keys. Non-null keys must be unique on
+        each side (a duplicate would pair with every copy on the other side); duplicates
+        raise ValueError. Rows with a null key never pair and count as one-sided.
+    align: how rows are paired without a key. "positional" streams both scans side by
+        side (POSITIONAL JOIN of the bare scans, no hash table); "file_row_number" joins
+        on the row's position in its file as reported by read_parquet (a hash join, so
+        one side is held in memory). Rows past the end of the shorter file are counted
+        from the footers as left-only / right-only, never joined.
+    columns: compare only these columns (None = all overlapping); DuckDB's projection
+        pushdown then skips decoding the rest.
+    filters: rows to compare, as pyarrow-style (column, op, value) tuples (see recon.filters).
+        Keyed mode pushes them into both scans, where row-group statistics prune what they
+        can; positional modes must scan both files to keep positions, and select pairs by
+        the left file's values.
+    mismatches: Parquet path for differing rows + diff mask, or None to skip.
+    label_col: column copied next to row_index in the mismatch file (positional mode).
+    threads: DuckDB worker threads (None = DuckDB's default, one per core).
+    temp_directory / memory_limit: let large joins spill to disk instead of failing.
+    con: reuse an existing connection (settings above are applied to it).
+    bitmap: path for the run-length encoded row-match bitmap (see recon.bitmap), or None;
+        positional modes only, as row positions mean nothing to a key join.
+    """
+    if align not in ALIGN_MODES:
+        raise ValueError(f"align must be one of {ALIGN_MODES}, got {align!r}")
+    if bitmap is not None and key is not None:
+        raise ValueError("bitmap needs row positions; it can't be combined with key")
+    t0 = perf_counter()
+    left, right = Path(left), Path(right)
+    con = con or duckdb.connect()
+    if threads is not None:
+        con.execute(f"SET threads = {int(threads)}")
+    if temp_directory is not None:
+        Path(temp_directory).mkdir(parents=True, exist_ok=True)
+        con.execute("SET temp_directory = ?", [Path(temp_directory).as_posix()])
+    if memory_limit is not None:
+        con.execute("SET memory_limit = ?", [str(memory_limit)])
+
+    # --- Infer column names from both files and align ---
+    cols1, cols2 = _columns(con, left), _columns(con, right)
+
+    # Take intersection, preserving order from the first file
+    cols = [c for c in cols1 if c in cols2]
+    if columns is not None:
+        missing = [c for c in columns if c not in cols]
+        if missing:
+            raise ValueError(f"Columns not found in both files: {missing}")
+        cols = [c for c in cols if c in columns or c == key]
+    if key is not None:
+        if key not in cols:
+            raise ValueError(f"Key column '{key}' must exist in both Parquet files.")
+        cols.remove(key)
+
+    if not cols:
+        raise ValueError("No overlapping columns between the two Parquet files.")
+
+    # --- Build NULL-safe equality across all overlapping columns ---
+    eq_conditions = " AND ".join(
+        f"(t1.{quote_ident(c)} IS NOT DISTINCT FROM t2.{quote_ident(c)})" for c in cols
+    )
+
+    if mismatches is not None and Path(mismatches).exists():
+        Path(mismatches).unlink()  # never leave mismatches from a previous run behind
+
+    # Connection, settings and schema probing; the scan/compare/aggregate is one query
+    timings = {"setup": perf_counter() - t0}
+
+    if key is not None:
+        return _reconcile_keyed(con, left, right, key, cols, eq_conditions, filters, mismatches, timings)
+
+    # Only the first min(n1, n2) rows pair up; the rest are one-sided by definition
+    n1, n2 = read_footer(left).num_rows, read_footer(right).num_rows
+    paired = min(n1, n2)
+    conditions = [f"({to_sql(filters, 't1')})"] if normalize(filters) else []
+    numbered = align == "positional" and n1 != n2
+    if numbered:
+        # Past the shorter file one side is all NULL; t1's row number tells those rows apart
+        conditions.append(f"t1.file_row_number < {paired}")
+
+    def where(*extra) -> str:
+        return f"WHERE {' AND '.join(conditions + list(extra))}" if conditions or extra else ""
+
+    # --- Query: compare row i vs row i, counted in a single aggregate ---
+    query = f"""
+    SELECT COUNT(*) FILTER (WHERE {eq_conditions}), COUNT(*) FILTER (WHERE NOT ({eq_conditions}))
+    FROM {_aligned(left, right, align, row_numbers=numbered)}
+    {where()};
+    """
+    t1 = perf_counter()
+    matched, mismatched = con.execute(query).fetchone()
+    left_only, right_only = n1 - paired, n2 - paired
+    if normalize(filters):
+        # Filters pick rows by the left file's values: right-only rows have none
+        right_only = 0
+        if left_only:
+            left_only = con.execute(f"""
+            SELECT COUNT(*) FROM read_parquet({quote_path(left)}, file_row_number = true) t1
+            WHERE file_row_number >= {paired} AND ({to_sql(filters, 't1')})
+            """).fetchone()[0]
+    t2 = perf_counter()
+    timings["execute"] = t2 - t1
+
+    # Only runs when something differs, so the all-match path pays nothing extra
+    if mismatches is not None and mismatched:
+        key_select = f"t1.{quote_ident(label_col)}, " if label_col in cols1 else ""
+        # row_index comes from read_parquet's file_row_number, not from the join's output order
+        con.execute(f"""
+        COPY (
+          SELECT t1.file_row_number::BIGINT AS row_index, {key_select}({_diff_mask(cols)}) AS diff_mask
+          FROM {_aligned(left, right, align, row_numbers=True)}
+          {where(f"NOT ({eq_conditions})")}
+          ORDER BY row_index
+        ) TO {quote_path(mismatches)} {_copy_options(cols)};
+        """)
+        timings["mismatches"] = perf_counter() - t2
+
+    extra = {"align": align}
+    if bitmap is not None:
+        t3 = perf_counter()
+        rows = []
+        if mismatches is not None and mismatched:
+            # Already written out, ordered: no second scan
+            rows = pq.read_table(mismatches, columns=["row_index"])["row_index"].to_numpy()
+        elif mismatched:
+            rows = con.execute(f"""
+            SELECT t1.file_row_number::BIGINT AS row_index
+            FROM {_aligned(left, right, align, row_numbers=True)}
+            {where(f"NOT ({eq_conditions})")}
+            ORDER BY row_index
+            """).fetchnumpy()["row_index"]
+        match_bitmap = MatchBitmap.from_positions(rows, n1, matched + mismatched)
+        extra.update(bitmap=str(match_bitmap.save(bitmap)), bitmap_runs=len(match_bitmap.starts))
+        timings["bitmap"] = perf_counter() - t3
+
+    return ReconResult("duckdb", matched, mismatched, left_only, right_only, timings=timings, extra=extra)
+
+
+def _reconcile_keyed(con, left: Path, right: Path, key: str, cols: list,
+                     eq_conditions: str, filters, mismatches, timings: dict) -> ReconResult:
+    k = quote_ident(key)
+
+    # Filters go into each scan, so DuckDB can prune row groups by their statistics
+    where = f"WHERE {to_sql(filters)}" if normalize(filters) else ""
+
+    # The presence flags distinguish "row missing on one side" from NULL data values
+    joined = f"""
+      t1 AS (SELECT TRUE AS present, * FROM read_parquet({quote_path(left)}) {where}),
+      t2 AS (SELECT TRUE AS present, * FROM read_parquet({quote_path(right)}) {where})"""
+
+    # A duplicated key would pair with every copy on the other side and inflate the counts
+    t0 = perf_counter()
+    dup1, dup2 = con.execute(f"""
+    WITH {joined}
+    SELECT (SELECT COUNT({k}) - COUNT(DISTINCT {k}) FROM t1), (SELECT COUNT({k}) - COUNT(DISTINCT {k}) FROM t2);
+    """).fetchone()
+    timings["key_check"] = perf_counter() - t0
+    if dup1 or dup2:
+        raise ValueError(f"Key column '{key}' is not unique: {dup1} duplicate key(s) in the left file, "
+                         f"{dup2} in the right one")
+
+    # --- Query: full outer hash join on the key, counted in a single aggregate ---
+    query = f"""
+    WITH {joined},
+    matched AS (
+      SELECT
+        t1.present AS in_left,
+        t2.present AS in_right,
+        {eq_conditions} AS row_match
+      FROM t1
+      FULL OUTER JOIN t2 ON t1.{k} = t2.{k}
+    )
+    SELECT
+      COUNT(*) FILTER (WHERE in_left AND in_right AND row_match)     AS matched,
+      COUNT(*) FILTER (WHERE in_left AND in_right AND NOT row_match) AS mismatched,
+      COUNT(*) FILTER (WHERE in_right IS NULL)                       AS left_only,
+      COUNT(*) FILTER (WHERE in_left IS NULL)                        AS right_only
+    FROM matched;
+    """
+    t1 = perf_counter()
+    matched, mismatched, left_only, right_only = con.execute(query).fetchone()
+    t2 = perf_counter()
+    timings["execute"] = t2 - t1
+
+    # Keys present on both sides whose values differ
+    if mismatches is not None and mismatched:
+        con.execute(f"""
+        COPY (
+          WITH {joined}
+          SELECT t1.{k}, ({_diff_mask(cols)}) AS diff_mask
+          FROM t1
+          JOIN t2 ON t1.{k} = t2.{k}
+          WHERE NOT ({eq_conditions})
+          ORDER BY t1.{k}
+        ) TO {quote_path(mismatches)} {_copy_options(cols)};
+        """)
+        timings["mismatches"] = perf_counter() - t2
+
+    return ReconResult("duckdb", matched, mismatched, left_only, right_only,
+                       timings=timings, extra={"key": key})
@@ -0,0 +1,112 @@
+# recon/engines/pandas_engine.py
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from ..bitmap import BitmapBuilder
+from ..filters import arrow_mask, filter_columns, normalize
+from ..result import ReconResult
+
+
+def reconcile(left, right, *, columns: list = None, filters=None) -> ReconResult:
+    """
+    Both files loaded whole, then compared frame against frame.
+
+    columns / filters: compare only these columns / rows (see recon.filters); rows are
+    picked by the left file's values and the same positions taken on the right.
+    """
+    t0 = perf_counter()
+    if not normalize(filters):
+        df1 = pd.read_parquet(left, columns=columns)
+        df2 = pd.read_parquet(right, columns=columns)
+    else:
+        # The mask is evaluated in Arrow, before anything is converted to pandas
+        compare_cols = columns or pq.read_schema(left).names
+        read_cols = compare_cols + [c for c in filter_columns(filters) if c not in compare_cols]
+        table1, table2 = pq.read_table(left, columns=read_cols), pq.read_table(right, columns=read_cols)
+        mask = arrow_mask(table1, filters)
+        df1 = table1.filter(mask).select(compare_cols).to_pandas()
+        df2 = table2.filter(mask).select(compare_cols).to_pandas()
+    t1 = perf_counter()
+
+    # Compute row-level matches
+    row_match = (df1 == df2).all(axis=1)
+    t2 = perf_counter()
+    matched = int(row_match.sum())
+    t3 = perf_counter()
+
+    timings = {"read": t1 - t0, "compare": t2 - t1, "reduce": t3 - t2}
+    return ReconResult("pandas", matched, len(df1) - matched, timings=timings)
+
+
+def reconcile_chunked(left, right, *, batch_size: int = 131_072, columns: list = None,
+                      filters=None, bitmap=None) -> ReconResult:
+    """
+    Aligned chunks of both files, each converted to a pandas frame and compared, so
+    memory stays bounded by one chunk per side instead of two whole frames.
+
+    Frames use pd.ArrowDtype columns (no object strings); each column's equality is
+    reduced into one NumPy bool array per chunk. A null on either side is a mismatch,
+    as in the PyArrow engine. columns / filters: as for reconcile().
+    bitmap: path for the run-length encoded row-match bitmap (see recon.bitmap), or None.
+    """
+    t0 = perf_counter()
+    pf1, pf2 = pq.ParquetFile(left), pq.ParquetFile(right)
+    if pf1.metadata.num_rows != pf2.metadata.num_rows:
+        raise ValueError(f"Total row count mismatch: {pf1.metadata.num_rows} vs {pf2.metadata.num_rows}")
+
+    names = pf1.schema_arrow.names
+    missing = [c for c in columns or [] if c not in names]
+    if missing:
+        raise ValueError(f"Columns not found: {missing}")
+    compare_cols = [c for c in names if columns is None or c in columns]
+    read_cols = compare_cols + [c for c in filter_columns(filters) if c not in compare_cols]
+    filtered = bool(normalize(filters))
+
+    timings = {"read": 0.0, "compare": 0.0, "reduce": 0.0}
+    matched = total = offset = 0
+    builder = BitmapBuilder(pf1.metadata.num_rows) if bitmap is not None else None
+    it1 = pf1.iter_batches(batch_size=batch_size, columns=read_cols)
+    it2 = pf2.iter_batches(batch_size=batch_size, columns=read_cols)
+    timings["read"] += perf_counter() - t0
+    while True:
+        t0 = perf_counter()
+        b1, b2 = next(it1, None), next(it2, None)
+        if b1 is None or b2 is None:
+            break
+        if b1.num_rows != b2.num_rows:
+            raise ValueError("Batch shape mismatch")
+        batch_rows, selected = b1.num_rows, None
+        if filtered:
+            mask = arrow_mask(b1, filters)
+            selected = pc.indices_nonzero(mask).to_numpy()
+            b1, b2 = b1.filter(mask), b2.filter(mask)
+        df1 = b1.select(compare_cols).to_pandas(types_mapper=pd.ArrowDtype)
+        df2 = b2.select(compare_cols).to_pandas(types_mapper=pd.ArrowDtype)
+        t1 = perf_counter()
+
+        # One bool per row, ANDed in place column by column; NA (a null side) counts as False
+        row_match = np.ones(len(df1), dtype=bool)
+        for c in compare_cols:
+            np.logical_and(row_match, (df1[c] == df2[c]).to_numpy(dtype=bool, na_value=False), out=row_match)
+        t2 = perf_counter()
+        matched += int(np.count_nonzero(row_match))
+        total += len(df1)
+        if builder is not None:
+            rows = np.flatnonzero(~row_match)
+            builder.add((rows if selected is None else selected[rows]) + offset)
+        offset += batch_rows
+        t3 = perf_counter()
+
+        timings["read"] += t1 - t0
+        timings["compare"] += t2 - t1
+        timings["reduce"] += t3 - t2
+
+    extra = {"batch_size": batch_size}
+    if builder is not None:
+        match_bitmap = builder.finish(total)
+        extra.update(bitmap=str(match_bitmap.save(bitmap)), bitmap_runs=len(match_bitmap.starts))
+    return ReconResult("pandas_chunked", matched, total - matched, timings=timings, extra=extra)
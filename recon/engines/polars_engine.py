@@ -0,0 +1,320 @@
+# recon/engines/polars_engine.py
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from ..bitmap import MatchBitmap
+from ..compare import dictionary_columns as detect_dictionary_columns, shared_dictionary_codes
+from ..filters import filter_columns, normalize, to_polars
+from ..footer import read_footer
+from ..mismatch import MAX_MASK_COLUMNS, diff_mask_metadata
+from ..result import ReconResult
+from ..rules import polars_equal, resolve_rules
+
+
+def _projection(path, columns, filters, extra=()) -> tuple:
+    """
+    (compare_cols, read_cols): the columns to compare, in file order, and those plus
+    whatever the filter (and e.g. a mismatch label) needs. read_cols is None when
+    every column is read anyway.
+    """
+    names = pq.read_schema(path).names
+    if columns is None and not normalize(filters):
+        return names, None
+    missing = [c for c in (columns or []) if c not in names]
+    if missing:
+        raise ValueError(f"Columns not found: {missing}")
+    compare_cols = [c for c in names if columns is None or c in columns]
+    needed = filter_columns(filters) + [c for c in extra if c in names]
+    return compare_cols, compare_cols + [c for c in dict.fromkeys(needed) if c not in compare_cols]
+
+
+def _select_rows(df1: pl.DataFrame, df2: pl.DataFrame, filters) -> tuple:
+    # Rows picked by the left file's values, same positions taken on the right
+    if not normalize(filters):
+        return df1, df2, None
+    mask = df1.select(to_polars(filters)).to_series()
+    return df1.filter(mask), df2.filter(mask), mask.arg_true()
+
+
+def reconcile_eager(left, right, *, columns: list = None, filters=None) -> ReconResult:
+    """Row tuples pulled into Python: kept as the slow baseline."""
+    t0 = perf_counter()
+    compare_cols, read_cols = _projection(left, columns, filters)
+    df1 = pl.read_parquet(left, columns=read_cols)
+    df2 = pl.read_parquet(right, columns=read_cols)
+    df1, df2, _ = _select_rows(df1, df2, filters)
+    df1, df2 = df1.select(compare_cols), df2.select(compare_cols)
+    t1 = perf_counter()
+
+    # (df1 == df2) gives a Boolean DataFrame; count rows that are all True
+    eq = df1 == df2
+    t2 = perf_counter()
+    matched = eq.rows().count((True,) * df1.width)
+    t3 = perf_counter()
+
+    timings = {"read": t1 - t0, "compare": t2 - t1, "reduce": t3 - t2}
+    return ReconResult("polars", matched, df1.height - matched, timings=timings)
+
+
+def reconcile_streaming(left, right, *, columns: list = None, filters=None) -> ReconResult:
+    """
+    Lazy row hashes joined on a row index, collected with the streaming engine.
+    Read, compare and reduce are fused into one query, timed as "execute".
+
+    columns / filters: see recon.filters; the filter runs on the left scan (where Polars
+    pushes it down) and the inner join on the row index keeps the same rows on the right.
+    """
+    t0 = perf_counter()
+    l1 = pl.scan_parquet(left)
+    l2 = pl.scan_parquet(right)
+
+    # Get column names without forcing full resolution
+    cols1 = l1.collect_schema().names()
+    cols2 = l2.collect_schema().names()
+    # Use overlapping columns (preserves l1 order)
+    cols = [c for c in cols1 if c in cols2]
+    if columns is not None:
+        missing = [c for c in columns if c not in cols]
+        if missing:
+            raise ValueError(f"Columns not found in both files: {missing}")
+        cols = [c for c in cols if c in columns]
+    if not cols:
+        raise ValueError("No overlapping columns between the two Parquet files.")
+
+    # Attach a row index to preserve order (before filtering, so positions survive)
+    l1 = l1.with_row_index("rn")
+    if normalize(filters):
+        l1 = l1.filter(to_polars(filters))
+
+    # Row-level hash via struct hashing (version-proof-ish; seed pins current version)
+    h1i = l1.select("rn", pl.struct(cols).hash(seed=0).alias("h"))
+    h2i = l2.with_row_index("rn").select("rn", pl.struct(cols).hash(seed=0).alias("h"))
+
+    t1 = perf_counter()
+    matched, total = (
+        h1i.join(h2i, on="rn", how="inner", suffix="_right")
+           .with_columns((pl.col("h") == pl.col("h_right")).alias("row_match"))
+           .select(pl.col("row_match").sum(), pl.len())
+           .collect(engine="streaming")
+           .row(0)
+    )
+    t2 = perf_counter()
+
+    timings = {"plan": t1 - t0, "execute": t2 - t1}
+    return ReconResult("polars_streaming", matched, total - matched, timings=timings)
+
+
+def _read_dictionary_codes(left, right, dictionary_columns, keep=(), read_cols: list = None) -> tuple:
+    """
+    Read both files with the given columns kept as dictionary arrays, then swap each of
+    those columns for integer codes against a dictionary shared by both sides. Polars
+    then compares small integers instead of strings (and never builds Categoricals).
+    Columns in `keep` are always read as values.
+    """
+    meta1, meta2 = read_footer(left), read_footer(right)
+    if dictionary_columns == "auto":
+        dictionary_columns = detect_dictionary_columns(meta1, meta2, meta1.schema.to_arrow_schema())
+    dictionary_columns = [c for c in dictionary_columns or []
+                          if c not in keep and (read_cols is None or c in read_cols)]
+
+    if not dictionary_columns:
+        return (pl.read_parquet(left, columns=read_cols), pl.read_parquet(right, columns=read_cols),
+                dictionary_columns)
+
+    t1 = pq.read_table(left, columns=read_cols, read_dictionary=dictionary_columns)
+    t2 = pq.read_table(right, columns=read_cols, read_dictionary=dictionary_columns)
+    for c in dictionary_columns:
+        codes1, codes2 = shared_dictionary_codes(t1.column(c), t2.column(c))
+        t1 = t1.set_column(t1.schema.get_field_index(c), c, codes1)
+        t2 = t2.set_column(t2.schema.get_field_index(c), c, codes2)
+    return pl.from_arrow(t1), pl.from_arrow(t2), dictionary_columns
+
+
+def reconcile_vectorized(left, right, *, dictionary_columns="auto", columns: list = None, filters=None,
+                         rules: dict = None, mismatches=None, label_col: str = "row",
+                         bitmap=None) -> ReconResult:
+    """
+    Eager frames compared column-wise inside Polars.
+
+    dictionary_columns: columns compared by dictionary code instead of by string;
+        "auto" picks string columns dictionary-encoded in every row group, None disables.
+    columns / filters: compare only these columns / rows (see recon.filters); only the
+        columns needed are read, and rows are picked by the left file's values.
+    rules: per-column comparison rules, {column: Rule or dict} (see recon.rules),
+        evaluated as Polars expressions.
+    mismatches: Parquet path for differing rows + diff mask, or None to skip.
+    label_col: column copied next to row_index in the mismatch file (if present).
+    bitmap: path for the run-length encoded row-match bitmap (see recon.bitmap), or None.
+    """
+    t0 = perf_counter()
+    rules = resolve_rules(rules, pq.read_schema(left))
+    # The label is written out as a value, so it is never swapped for codes
+    label = label_col if mismatches is not None else None
+    compare_cols, read_cols = _projection(left, columns, filters, extra=[label] if label else [])
+    # Nor are ruled columns: codes of the raw strings know nothing about case or whitespace;
+    # nor filtered ones, whose predicates compare against string literals
+    keep = ([label] if label else []) + list(rules) + filter_columns(filters)
+    df1, df2, dictionary_columns = _read_dictionary_codes(left, right, dictionary_columns, keep, read_cols)
+    df1, df2, positions = _select_rows(df1, df2, filters)
+    labels = df1.get_column(label_col) if label is not None and label_col in df1.columns else None
+    df1, df2 = df1.select(compare_cols), df2.select(compare_cols)
+    t1 = perf_counter()
+
+    # assume both frames have identical schemas and column order
+    eq = df1 == df2
+    ruled = [c for c in compare_cols if c in rules]
+    if ruled:
+        # Both sides side by side (no copy), so a rule is one expression over two columns
+        pairs = pl.concat([df1.select(ruled), df2.select(pl.col(c).alias(f"{c}__right") for c in ruled)],
+                          how="horizontal")
+        eq = eq.with_columns(
+            pairs.select(polars_equal(pl.col(c), pl.col(f"{c}__right"), rules[c], df1.schema[c].is_float()).alias(c)
+                         for c in ruled)
+            .get_columns()
+        )
+    t2 = perf_counter()
+    matched = (
+        eq
+        .select(pl.all_horizontal(pl.all()).alias("row_match"))
+        .select(pl.col("row_match").sum())
+        .item()
+    )
+    mismatched = df1.height - matched
+    t3 = perf_counter()
+    timings = {"read": t1 - t0, "compare": t2 - t1, "reduce": t3 - t2}
+
+    if mismatches is not None:
+        out = Path(mismatches)
+        if out.exists():
+            out.unlink()  # never leave mismatches from a previous run behind
+
+        # Only the mismatching rows are gathered, and only when there are any
+        if mismatched:
+            cols = eq.columns
+            not_equal = [~pl.col(c).fill_null(False) for c in cols]
+            # Key values come from df1 under a temporary name (the bool frame reuses the column names)
+            keys = [labels.alias("__key")] if labels is not None else []
+            # Positions in the file: the filtered rows' original positions, if filtered
+            index = (positions.alias("row_index") if positions is not None
+                     else pl.int_range(pl.len()).alias("row_index"))
+            diff = (
+                eq.select(not_equal)
+                .with_columns(index, *keys)
+                .filter(pl.any_horizontal(cols))
+                .select(
+                    pl.col("row_index").cast(pl.Int64),
+                    *[pl.col("__key").alias(label_col) for _ in keys],
+                    pl.sum_horizontal(
+                        [pl.col(c).cast(pl.UInt64) * (1 << i) for i, c in enumerate(cols)]
+                    ).alias("diff_mask"),
+                )
+            )
+            out.parent.mkdir(parents=True, exist_ok=True)
+            diff.write_parquet(out, metadata=diff_mask_metadata(cols))
+        timings["mismatches"] = perf_counter() - t3
+
+    extra = {"dictionary_columns": dictionary_columns, "rules": sorted(rules)}
+    if bitmap is not None:
+        t4 = perf_counter()
+        rows = eq.select(pl.all_horizontal(pl.all()).fill_null(False).not_().arg_true()).to_series()
+        if positions is not None:
+            rows = positions.gather(rows)
+        match_bitmap = MatchBitmap.from_positions(rows.to_numpy(), read_footer(left).num_rows, df1.height)
+        extra.update(bitmap=str(match_bitmap.save(bitmap)), bitmap_runs=len(match_bitmap.starts))
+        timings["bitmap"] = perf_counter() - t4
+
+    return ReconResult("polars_vectorized", matched, mismatched, timings=timings, extra=extra)
+
+
+def reconcile_lazy(left, right, *, columns: list = None, filters=None, rules: dict = None,
+                   mismatches=None, label_col: str = "row", explain: bool = False,
+                   bitmap=None) -> ReconResult:
+    """
+    One lazy query over both scans, run by the streaming engine: rows are paired by
+    position (horizontal concat, no join or hash table), compared column-wise into a
+    diff mask, and both the counts and the mismatching rows come out of the same pass,
+    the latter written with sink_parquet; both files must have the same number of rows.
+    Memory grows with the row-group size (Polars decodes whole row groups), not with
+    the file: unlike a join on a row index, the positional pairing needs no state
+    beyond the batches in flight. Polars sizes its thread pool once, from
+    POLARS_MAX_THREADS, when first imported; the size in use is reported in
+    extra["threads"].
+
+    columns / filters / rules: as for reconcile_vectorized (filters pick rows by the
+        left file's values). Nulls never match, as there.
+    mismatches: Parquet path for differing rows + diff mask, or None to skip.
+    label_col: column copied next to row_index in the mismatch file (if present).
+    explain: put the optimized streaming plans (counts, then the mismatch sink) in extra["plan"].
+    bitmap: path for the run-length encoded row-match bitmap (see recon.bitmap), or None;
+        the mismatching positions are collected by the same streaming run.
+    """
+    t0 = perf_counter()
+    schema = pq.read_schema(left)
+    rules = resolve_rules(rules, schema)
+    compare_cols, _ = _projection(left, columns, filters)
+    if len(compare_cols) > MAX_MASK_COLUMNS:
+        raise ValueError(f"diff_mask supports at most {MAX_MASK_COLUMNS} columns, got {len(compare_cols)}")
+    has_label = mismatches is not None and label_col in schema.names
+
+    # Fast fail if total row counts differ: a horizontal concat needs equal heights
+    n1, n2 = read_footer(left).num_rows, read_footer(right).num_rows
+    if n1 != n2:
+        raise ValueError(f"Total row count mismatch: {n1} vs {n2}")
+
+    # Left columns keep their names (filters refer to them), right ones get a suffix
+    needed = list(dict.fromkeys(compare_cols + filter_columns(filters) + ([label_col] if has_label else [])))
+    l1 = pl.scan_parquet(left).select(needed).with_row_index("row_index")
+    l2 = pl.scan_parquet(right).select(pl.col(c).alias(f"{c}__right") for c in compare_cols)
+    pairs = pl.concat([l1, l2], how="horizontal")
+    if normalize(filters):
+        pairs = pairs.filter(to_polars(filters))
+
+    def equal(c):
+        a, b = pl.col(c), pl.col(f"{c}__right")
+        return polars_equal(a, b, rules[c], pa.types.is_floating(schema.field(c).type)) if c in rules else a == b
+
+    # Bit i set when column i differs (null counts as a difference)
+    diff = pairs.select(
+        "row_index",
+        *([pl.col(label_col)] if has_label else []),
+        pl.sum_horizontal(
+            [(~equal(c).fill_null(False)).cast(pl.UInt64) * (1 << i) for i, c in enumerate(compare_cols)]
+        ).alias("diff_mask"),
+    )
+    counts = diff.select((pl.col("diff_mask") == 0).sum().alias("matched"), pl.len().alias("total"))
+
+    queries = [counts]
+    if mismatches is not None:
+        out = Path(mismatches)
+        if out.exists():
+            out.unlink()  # never leave mismatches from a previous run behind
+        out.parent.mkdir(parents=True, exist_ok=True)
+        queries.append(
+            diff.filter(pl.col("diff_mask") != 0)
+                .with_columns(pl.col("row_index").cast(pl.Int64))
+                .sink_parquet(out, metadata=diff_mask_metadata(compare_cols), lazy=True)
+        )
+    if bitmap is not None:
+        queries.append(diff.filter(pl.col("diff_mask") != 0).select("row_index"))
+    t1 = perf_counter()
+
+    # All queries in one streaming run; the shared scans are executed once
+    frames = pl.collect_all(queries, engine="streaming")
+    matched, total = frames[0].row(0)
+    t2 = perf_counter()
+
+    extra = {"threads": pl.thread_pool_size(), "rules": sorted(rules)}
+    if bitmap is not None:
+        # Streaming output is not ordered by position
+        rows = np.sort(frames[-1].get_column("row_index").to_numpy().astype(np.int64))
+        match_bitmap = MatchBitmap.from_positions(rows, read_footer(left).num_rows, total)
+        extra.update(bitmap=str(match_bitmap.save(bitmap)), bitmap_runs=len(match_bitmap.starts))
+    if explain:
+        extra["plan"] = "\n\n".join(q.explain(engine="streaming") for q in queries)
+    timings = {"plan": t1 - t0, "execute": t2 - t1}
+    return ReconResult("polars_lazy", matched, total - matched, timings=timings, extra=extra)
@@ -0,0 +1,310 @@
+# recon/engines/pyarrow_engine.py
+from time import perf_counter
+from functools import reduce
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from ..bitmap import BitmapBuilder, mismatch_positions
+from ..compare import dictionary_columns as detect_dictionary_columns
+from ..filters import arrow_mask, filter_columns, normalize, prune_row_groups
+from ..fingerprint import load_or_build_index, diff_row_groups
+from ..footer import footer_plan, read_footer
+from ..mismatch import MismatchWriter
+from ..prefetch import Prefetcher
+from ..parallel import parallel_match_counts
+from ..result import ReconResult
+from ..rules import column_equal, resolve_rules
+from ..snapshot import MappedSnapshot, ensure_snapshot
+from ..trace import TimedFile, active_tracer
+from ..tuner import BatchSizeTuner
+
+
+def _row_group_layout(meta) -> list:
+    return [meta.row_group(i).num_rows for i in range(meta.num_row_groups)]
+
+
+def reconcile(left, right, *, batch_size: int = 131_072, tune: bool = False, tune_rss_budget: int = None,
+              use_fingerprint_index: bool = False, footer_check: bool = False, workers: int = 1,
+              dictionary_columns="auto", input_mode: str = "parquet",
+              prefetch: int = 0, columns: list = None, filters=None, rules: dict = None, mismatches=None,
+              label_col: str = "row", bitmap=None) -> ReconResult:
+    """
+    Positional reconciliation over lock-step Parquet batches.
+
+    batch_size: rows per batch (the starting point when tune=True).
+    tune: adapt the batch size online and cache it (see recon.tuner).
+    tune_rss_budget: with tune, reject batch sizes whose probe pushes RSS over this
+        many bytes (None = throughput alone decides).
+    use_fingerprint_index: skip row groups/columns proven identical by the sidecar index.
+    footer_check: skip row groups/columns proven identical from the footers and, where the
+        statistics agree, the raw chunk bytes (see recon.footer); no sidecar, no decode.
+    workers: > 1 fans row-group ranges out to a process pool, which only counts: it
+        can't be combined with tune, the skip options, prefetch, mmap, mismatches,
+        bitmaps or tracing.
+    dictionary_columns: columns read as dictionary arrays and compared by integer code;
+        "auto" picks string columns dictionary-encoded in every row group, None disables.
+    input_mode: "parquet" reads into heap buffers; "mmap" memory-maps the Parquet files;
+        "ipc" compares zero-copy views of memory-mapped Arrow IPC snapshots, converted
+        once per file version (see recon.snapshot).
+    prefetch: queue depth of a background reader per file (0 = read inline). Overlaps
+        read/decode with the compare; timings["stall"] is the time the compare waited.
+    columns: compare only these columns (None = all); nothing else is decoded.
+    filters: rows to compare, as pyarrow-style (column, op, value) tuples (see
+        recon.filters). Evaluated on the left file and applied to the same positions
+        on the right; row groups whose left statistics rule them out are skipped.
+    rules: per-column comparison rules, {column: Rule or dict} (tolerances, timestamp
+        truncation, case/whitespace-insensitive strings, null == null; see recon.rules).
+    mismatches: Parquet path for differing rows + diff mask, or None to skip.
+    label_col: column copied next to row_index in the mismatch file (if present).
+    bitmap: path for the run-length encoded row-match bitmap (see recon.bitmap), or None.
+    """
+    if input_mode not in ("parquet", "mmap", "ipc"):
+        raise ValueError(f"input_mode must be 'parquet', 'mmap' or 'ipc', got {input_mode!r}")
+    if tune_rss_budget is not None and not tune:
+        raise ValueError("tune_rss_budget only applies with tune=True")
+    if use_fingerprint_index and footer_check:
+        raise ValueError("Choose one of use_fingerprint_index and footer_check")
+    skip_option = "use_fingerprint_index" if use_fingerprint_index else "footer_check" if footer_check else None
+    if input_mode == "ipc" and (tune or skip_option or workers > 1):
+        raise ValueError("input_mode='ipc' has a fixed batch layout; it can't be combined with "
+                         "tune, use_fingerprint_index, footer_check or workers > 1")
+    if workers > 1:
+        # The process pool only counts matches, reading each file in full with plain reads
+        unsupported = [name for name, used in (
+            ("tune", tune), ("use_fingerprint_index", use_fingerprint_index), ("footer_check", footer_check),
+            ("prefetch", prefetch), ("input_mode='mmap'", input_mode == "mmap"),
+            ("mismatches", mismatches is not None), ("bitmap", bitmap is not None),
+            ("tracing", active_tracer() is not None),
+        ) if used]
+        if unsupported:
+            raise ValueError(f"workers > 1 can't be combined with {', '.join(unsupported)}")
+    filters = normalize(filters)
+    if filters and skip_option:
+        raise ValueError(f"{skip_option} counts whole row groups; it can't be combined with filters")
+    meta1, meta2 = read_footer(left), read_footer(right)
+    rules = resolve_rules(rules, meta1.schema.to_arrow_schema())
+    if rules and skip_option:
+        raise ValueError(f"{skip_option} proves byte equality only; it can't be combined with rules")
+
+    # Fast fail if total row counts differ
+    if meta1.num_rows != meta2.num_rows:
+        raise ValueError(f"Total row count mismatch: {meta1.num_rows} vs {meta2.num_rows}")
+
+    # Low-cardinality strings stay dictionary-encoded from decode to compare
+    if dictionary_columns == "auto":
+        dictionary_columns = detect_dictionary_columns(meta1, meta2, meta1.schema.to_arrow_schema())
+    # Snapshots hold plain values (see recon.snapshot), so there are no codes to compare
+    dictionary_columns = list(dictionary_columns or []) if input_mode != "ipc" else []
+
+    # Projection: only the selected columns (in file order) are ever decoded
+    if columns is not None:
+        schema_cols = meta1.schema.to_arrow_schema().names
+        missing = [c for c in columns if c not in schema_cols]
+        if missing:
+            raise ValueError(f"Columns not found: {missing}")
+        columns = [c for c in schema_cols if c in columns]
+
+    if workers > 1:
+        matched_rows, total_rows = parallel_match_counts(left, right, batch_size=batch_size, max_workers=workers,
+                                                         dictionary_columns=dictionary_columns,
+                                                         columns=columns, filters=filters, rules=rules)
+        return ReconResult("pyarrow", matched_rows, total_rows - matched_rows,
+                           extra={"batch_size": batch_size, "workers": workers,
+                                  "dictionary_columns": dictionary_columns})
+
+    memory_map = input_mode == "mmap"
+    # When traced, reads go through timed files so the read phase splits into I/O and decode
+    tracer = active_tracer()
+    source1, source2 = left, right
+    if tracer is not None and input_mode == "parquet":
+        source1, source2 = (pa.PythonFile(TimedFile(p, tracer.io), mode="r") for p in (left, right))
+    pf1 = pq.ParquetFile(source1, metadata=meta1, read_dictionary=dictionary_columns, memory_map=memory_map)
+    pf2 = pq.ParquetFile(source2, metadata=meta2, read_dictionary=dictionary_columns, memory_map=memory_map)
+
+    # With a filter, only rows that pass it are counted (as they are compared)
+    total_rows = 0 if filters else pf1.metadata.num_rows
+    matched_rows = 0
+    read_phase = "stall" if prefetch else "read"
+    timings = {read_phase: 0.0, "compare": 0.0, "reduce": 0.0, "mismatches": 0.0}
+
+    all_cols = columns or pf1.schema_arrow.names
+    has_key = mismatches is not None and label_col in pf1.schema_arrow.names
+    writer = None
+    if mismatches is not None:
+        writer = MismatchWriter(
+            mismatches, all_cols,
+            key_col=label_col if has_key else None,
+            key_type=pf1.schema_arrow.field(label_col).type if has_key else None,
+        )
+    builder = BitmapBuilder(pf1.metadata.num_rows) if bitmap is not None else None
+
+    layout = _row_group_layout(pf1.metadata)
+    layout_aligned = layout == _row_group_layout(pf2.metadata)
+
+    # First row of every row group, to turn batch positions into file positions
+    rg_starts = [0]
+    for rows in layout[:-1]:
+        rg_starts.append(rg_starts[-1] + rows)
+
+    # Sidecar fingerprints (rebuilt only when a file changes) prove most row groups equal
+    plan = None
+    if use_fingerprint_index:
+        t0 = perf_counter()
+        plan = diff_row_groups(load_or_build_index(left), load_or_build_index(right))
+        timings["index"] = perf_counter() - t0
+
+    # Or straight from the footers, comparing raw bytes only where the statistics agree
+    footer_info = None
+    if footer_check:
+        t0 = perf_counter()
+        plan = footer_plan(left, right)
+        if plan is not None:
+            plan, footer_info = plan[:2], plan[2]
+        timings["footer"] = perf_counter() - t0
+
+    # Row groups the left file's statistics rule out are never read (positions stay aligned
+    # only when both files share the row-group layout, so otherwise nothing is pruned)
+    keep = None
+    if filters and layout_aligned and input_mode != "ipc":
+        keep = prune_row_groups(pf1.metadata, filters)
+
+    if plan is not None:
+        matched_rows, pending = plan
+        if columns is not None:
+            # Row groups whose differences lie outside the selected columns match as a whole
+            subset = []
+            for rg, cols in pending:
+                cols = [c for c in cols if c in all_cols]
+                if cols:
+                    subset.append((rg, cols))
+                else:
+                    matched_rows += layout[rg]
+            pending = subset
+    elif keep is not None or (tune and layout_aligned):
+        pending = [(rg, all_cols) for rg in (keep if keep is not None else range(len(layout)))]
+    else:
+        # One lock-step pass over both files
+        pending = [(None, all_cols)]
+
+    snapshots = None
+    if input_mode == "ipc":
+        t0 = perf_counter()
+        snapshots = MappedSnapshot(ensure_snapshot(left)), MappedSnapshot(ensure_snapshot(right))
+        timings["snapshot"] = perf_counter() - t0
+        batch_size = None  # fixed by the snapshots
+
+    # Batch size is re-chosen per row group while tuning, then fixed (and cached)
+    tuner = BatchSizeTuner(pf1, start=batch_size, rss_budget=tune_rss_budget) if tune else None
+
+    try:
+        for rg, columns in pending:
+            row_groups = None if rg is None else [rg]
+            if tuner is not None:
+                batch_size = tuner.batch_size
+            unit_start, unit_rows = perf_counter(), 0
+            offset = 0 if rg is None else rg_starts[rg]
+
+            # The key (to label mismatches) and filter columns are read but never compared
+            extra_cols = ([label_col] if has_key else []) + filter_columns(filters)
+            read_cols = columns + [c for c in dict.fromkeys(extra_cols) if c not in columns]
+
+            if snapshots is not None:
+                it1, it2 = (snapshot.iter_batches(columns=read_cols) for snapshot in snapshots)
+            else:
+                it1 = pf1.iter_batches(batch_size=batch_size, row_groups=row_groups, columns=read_cols)
+                it2 = pf2.iter_batches(batch_size=batch_size, row_groups=row_groups, columns=read_cols)
+
+            # Background threads keep up to `prefetch` batches per file decoded ahead of the compare
+            if prefetch:
+                it1, it2 = Prefetcher(it1, prefetch), Prefetcher(it2, prefetch)
+
+            try:
+                # Lock-step iteration (like zip), timing read+decode separately from compute
+                # (with prefetching, only the time spent waiting on the readers: a stall)
+                while True:
+                    t0 = perf_counter()
+                    b1, b2 = next(it1, None), next(it2, None)
+                    t1 = perf_counter()
+                    timings[read_phase] += t1 - t0
+                    if b1 is None or b2 is None:
+                        break
+
+                    if b1.num_rows != b2.num_rows or b1.num_columns != b2.num_columns:
+                        raise ValueError("Batch shape mismatch")
+                    batch_rows = b1.num_rows
+                    batch_keys = b1.column(label_col) if has_key else None
+
+                    # Rows picked by the left file's values, same positions taken on the right
+                    selected = None
+                    if filters:
+                        mask = arrow_mask(b1, filters)
+                        selected = pc.indices_nonzero(mask)
+                        b1, b2 = b1.filter(mask), b2.filter(mask)
+                        total_rows += b1.num_rows
+
+                    # Row-wise full equality: AND across all per-column equalities
+                    # Note: pc.equal yields null for null==null; and_kleene preserves nulls.
+                    # Casting to int64 makes True->1, False->0, null->null; pc.sum ignores nulls.
+                    column_equals = {c: column_equal(b1.column(c), b2.column(c), rules.get(c)) for c in columns}
+                    row_equal = reduce(pc.and_kleene, column_equals.values())
+                    t2 = perf_counter()
+
+                    # Count True values in this batch
+                    matches_in_batch = int(pc.sum(pc.cast(row_equal, pa.int64())).as_py() or 0)
+                    t3 = perf_counter()
+                    matched_rows += matches_in_batch
+                    timings["compare"] += t2 - t1
+                    timings["reduce"] += t3 - t2
+
+                    # Mismatch extraction only runs for batches that actually differ
+                    t4 = t3
+                    if (writer is not None or builder is not None) and matches_in_batch < b1.num_rows:
+                        # Back to positions in the unfiltered batch (where batch_keys come from)
+                        positions = selected.to_numpy() if selected is not None else None
+                        if writer is not None:
+                            writer.write(offset, row_equal, column_equals, batch_keys, positions=positions)
+                        if builder is not None:
+                            builder.add(mismatch_positions(row_equal, positions, offset))
+                        t4 = perf_counter()
+                        timings["mismatches"] += t4 - t3
+                    if tracer is not None:
+                        tracer.batch(batch_rows, [(read_phase, t0, t1), ("compare", t1, t2), ("reduce", t2, t3)]
+                                     + ([("mismatches", t3, t4)] if t4 > t3 else []))
+                    offset += batch_rows
+                    unit_rows += b1.num_rows
+            finally:
+                if prefetch:
+                    it1.close()
+                    it2.close()
+
+            # Throughput feedback in values (rows x columns) so column subsets compare fairly
+            if tuner is not None:
+                tuner.record(unit_rows * len(columns), perf_counter() - unit_start)
+    finally:
+        if snapshots is not None:
+            for snapshot in snapshots:
+                snapshot.close()
+
+    if tuner is not None:
+        tuner.close()
+        batch_size = tuner.batch_size
+
+    if writer is not None:
+        writer.close()
+    bitmap_info = {}
+    if builder is not None:
+        match_bitmap = builder.finish(total_rows)
+        bitmap_info = {"bitmap": str(match_bitmap.save(bitmap)), "bitmap_runs": len(match_bitmap.starts)}
+    for source in (source1, source2):
+        if source is not left and source is not right:
+            source.close()
+
+    return ReconResult("pyarrow", matched_rows, total_rows - matched_rows,
+                       timings=timings, extra={"batch_size": batch_size,
+                                               "dictionary_columns": dictionary_columns,
+                                               "input_mode": input_mode,
+                                               "prefetch": prefetch, "rules": sorted(rules),
+                                               **({"footer": footer_info} if footer_info else {}),
+                                               **bitmap_info})
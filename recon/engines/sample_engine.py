@@ -0,0 +1,141 @@
+# recon/engines/sample_engine.py
+import math
+from functools import reduce
+from time import perf_counter
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from ..compare import dictionary_columns as detect_dictionary_columns
+from ..footer import read_footer
+from ..result import ReconResult
+from ..rules import column_equal, resolve_rules
+from ..sampling import cluster_interval, design_effect, spent_alpha, stratified_order
+
+
+def _row_group_layout(meta) -> list:
+    return [meta.row_group(i).num_rows for i in range(meta.num_row_groups)]
+
+
+def reconcile(left, right, *, threshold: float = None, confidence: float = 0.95,
+              fraction: float = 0.1, min_rows: int = 100_000, strata: int = 8, seed: int = None,
+              batch_size: int = 65_536, columns: list = None, rules: dict = None) -> ReconResult:
+    """
+    Approximate positional reconciliation from a stratified random sample of row groups.
+
+    Row groups are drawn round-robin from `strata` contiguous ranges of the file (see
+    recon.sampling) and compared batch by batch. Row groups are the units drawn, so the
+    match rate's interval uses their spread (recon.sampling.cluster_interval) rather
+    than treating rows as independent.
+
+    threshold: the go/no-go match rate, tested after every row group once min_rows were
+        compared. Sampling stops as soon as the interval lies entirely above it ("pass")
+        or below it ("fail"). Each test spends part of 1 - confidence (see
+        recon.sampling.spent_alpha), so repeated looks don't inflate the error rate.
+        Without a threshold, `fraction` of the rows is sampled and the estimate reported.
+    fraction: sampling budget as a share of the rows; with a threshold, reaching it
+        without a verdict gives "inconclusive" (1.0 = keep going up to a full, exact pass).
+    columns / rules: as for the PyArrow engine (see recon.rules).
+
+    matched_rows / mismatched_rows count the sampled rows only; the estimate, interval
+    (at look_confidence, the last look's level, when a threshold was tested) and
+    decision are in extra. Both files must share the row-group layout.
+    """
+    if not 0 < confidence < 1:
+        raise ValueError(f"confidence must be in (0, 1), got {confidence}")
+    if not 0 < fraction <= 1:
+        raise ValueError(f"fraction must be in (0, 1], got {fraction}")
+    if threshold is not None and not 0 <= threshold <= 1:
+        raise ValueError(f"threshold must be in [0, 1], got {threshold}")
+
+    t0 = perf_counter()
+    meta1, meta2 = read_footer(left), read_footer(right)
+    layout = _row_group_layout(meta1)
+    if layout != _row_group_layout(meta2):
+        raise ValueError("Row-group layout mismatch: sampling needs identically chunked files")
+    population = meta1.num_rows
+
+    schema = meta1.schema.to_arrow_schema()
+    rules = resolve_rules(rules, schema)
+    if columns is not None:
+        missing = [c for c in columns if c not in schema.names]
+        if missing:
+            raise ValueError(f"Columns not found: {missing}")
+    columns = [c for c in schema.names if columns is None or c in columns]
+
+    dictionary_columns = detect_dictionary_columns(meta1, meta2, schema)
+    pf1 = pq.ParquetFile(left, metadata=meta1, read_dictionary=dictionary_columns)
+    pf2 = pq.ParquetFile(right, metadata=meta2, read_dictionary=dictionary_columns)
+
+    order = stratified_order(layout, strata, seed)
+    budget = min(math.ceil(population * fraction), population)
+    sampled = matched = 0
+    groups, batches = [], []  # (matched, rows) per row group read and per batch
+    alpha, spent, looks = 1 - confidence, 0.0, 0
+    level = confidence
+    decision = None
+    low, high = 0.0, 1.0
+    t1 = perf_counter()
+
+    def clusters():
+        # Row groups are the random draws; while only one was read, its batches are the
+        # best evidence of how concentrated mismatches are
+        return groups if len(groups) > 1 else batches
+
+    for rg in order:
+        group_matched = group_rows = 0
+        # Batches of one row group are decoded page by page, so stopping mid-group saves work
+        for b1, b2 in zip(pf1.iter_batches(batch_size=batch_size, row_groups=[rg], columns=columns),
+                          pf2.iter_batches(batch_size=batch_size, row_groups=[rg], columns=columns)):
+            row_equal = reduce(pc.and_kleene, (column_equal(b1.column(c), b2.column(c), rules.get(c))
+                                               for c in columns))
+            batch_matched = int(pc.sum(pc.cast(row_equal, pa.int64())).as_py() or 0)
+            batches.append((batch_matched, b1.num_rows))
+            group_matched += batch_matched
+            group_rows += b1.num_rows
+            if sampled + group_rows >= budget:
+                break
+        groups.append((group_matched, group_rows))
+        matched += group_matched
+        sampled += group_rows
+
+        if threshold is not None and sampled >= min(min_rows, population):
+            # This look's share of alpha: what the spending function allows by now, less
+            # what earlier looks already used
+            step = spent_alpha(alpha, sampled / budget) - spent
+            spent += step
+            looks += 1
+            level = 1 - step
+            low, high = cluster_interval(clusters(), population, level)
+            if low >= threshold:
+                decision = "pass"
+            elif high < threshold:
+                decision = "fail"
+        if decision is not None or sampled >= budget:
+            break
+    t2 = perf_counter()
+
+    if not looks:
+        low, high = cluster_interval(clusters(), population, confidence)
+
+    if threshold is not None and decision is None:
+        # Either the budget ran out first, or the whole file was read and the rate is exact
+        if sampled < population:
+            decision = "inconclusive"
+        else:
+            decision = "pass" if matched / population >= threshold else "fail"
+
+    timings = {"plan": t1 - t0, "sample": t2 - t1}
+    return ReconResult(
+        "sample", matched, sampled - matched, timings=timings,
+        extra={
+            "estimated_match_rate": matched / sampled if sampled else None,
+            "ci_low": low, "ci_high": high, "confidence": confidence,
+            "threshold": threshold, "decision": decision,
+            "looks": looks, "look_confidence": level, "design_effect": design_effect(clusters()),
+            "sampled_rows": sampled, "total_rows": population,
+            "sampled_fraction": sampled / population if population else 1.0,
+            "row_groups_read": len(groups), "row_groups": len(layout),
+        },
+    )
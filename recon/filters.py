@@ -0,0 +1,175 @@
+# recon/filters.py
+"""
+Row filters in the same disjunctive normal form as pyarrow.parquet's `filters`:
+
+    [("row", ">=", 1_000), ("row", "<", 2_000)]           # AND of predicates
+    [[("L1", "==", "A")], [("value", "in", [1, 2, 3])]]   # OR of ANDs
+
+The helpers translate one filter into an Arrow mask, a DuckDB WHERE clause and a
+Polars expression, and prune row groups whose min/max statistics rule them out.
+NaN is refused as a filter value: Arrow never finds NaN equal to anything, while
+Polars and DuckDB sort it above every number and find it equal to itself.
+"""
+from datetime import date, datetime
+from functools import reduce
+from math import isnan
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+OPERATORS = ("==", "=", "!=", "<", "<=", ">", ">=", "in", "not in")
+
+
+def _is_predicate(f) -> bool:
+    # (column, op, value); a JSON-decoded one is a list, a conjunction never starts with a str
+    return isinstance(f, tuple) or (isinstance(f, list) and len(f) == 3 and isinstance(f[0], str))
+
+
+def _is_nan(value) -> bool:
+    return isinstance(value, float) and isnan(value)
+
+
+def normalize(filters) -> list:
+    # Always a list of conjunctions (lists of (column, op, value) tuples)
+    if not filters:
+        return []
+    if all(_is_predicate(f) for f in filters):
+        filters = [list(filters)]
+    for conjunction in filters:
+        for predicate in conjunction:
+            if len(predicate) != 3 or predicate[1] not in OPERATORS:
+                raise ValueError(f"Bad filter {predicate!r}: expected (column, op, value) with op in {OPERATORS}")
+            values = predicate[2] if predicate[1] in ("in", "not in") else [predicate[2]]
+            if any(_is_nan(v) for v in values):
+                raise ValueError(f"Bad filter {predicate!r}: NaN compares differently in Arrow, Polars and DuckDB")
+    return [[tuple(p) for p in c] for c in filters]
+
+
+def filter_columns(filters) -> list:
+    # Columns a filter reads, in first-use order
+    names = []
+    for conjunction in normalize(filters):
+        for column, _, _ in conjunction:
+            if column not in names:
+                names.append(column)
+    return names
+
+
+# --- Arrow: evaluate on a decoded batch ---
+def _arrow_predicate(values, op, value):
+    if op in ("in", "not in"):
+        if not value:
+            # An empty value set has no type to match the column against
+            mask = pa.scalar(op == "not in")
+        else:
+            mask = pc.is_in(values, value_set=pa.array(list(value)))
+            mask = pc.invert(mask) if op == "not in" else mask
+        # is_in says False for a null value; like SQL and Polars, it stays unknown
+        return pc.if_else(pc.is_valid(values), mask, pa.scalar(None, pa.bool_()))
+    func = {"==": pc.equal, "=": pc.equal, "!=": pc.not_equal,
+            "<": pc.less, "<=": pc.less_equal, ">": pc.greater, ">=": pc.greater_equal}[op]
+    return func(values, value)
+
+
+def arrow_mask(data, filters) -> pa.Array:
+    """Boolean mask over a RecordBatch/Table; a null comparison never selects a row."""
+    disjuncts = [
+        reduce(pc.and_kleene, (_arrow_predicate(data.column(c), op, v) for c, op, v in conjunction))
+        for conjunction in normalize(filters)
+    ]
+    return pc.fill_null(reduce(pc.or_kleene, disjuncts), False)
+
+
+# --- DuckDB: WHERE clause ---
+def _sql_literal(value) -> str:
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, datetime):
+        return f"TIMESTAMP '{value.isoformat(sep=' ')}'"
+    if isinstance(value, date):
+        return f"DATE '{value.isoformat()}'"
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    raise TypeError(f"Unsupported filter value {value!r}")
+
+
+def to_sql(filters, alias: str = None) -> str:
+    def column(name):
+        quoted = '"' + name.replace('"', '""') + '"'
+        return f"{alias}.{quoted}" if alias else quoted
+
+    def predicate(c, op, v):
+        if op in ("in", "not in") and not v:
+            # SQL has no empty list; like Arrow and Polars, a null value stays unknown
+            return "FALSE" if op == "in" else f"{column(c)} IS NOT NULL"
+        if op in ("in", "not in"):
+            return f"{column(c)} {op.upper()} ({', '.join(_sql_literal(x) for x in v)})"
+        return f"{column(c)} {'=' if op == '==' else op} {_sql_literal(v)}"
+
+    return " OR ".join(
+        "(" + " AND ".join(predicate(*p) for p in conjunction) + ")"
+        for conjunction in normalize(filters)
+    )
+
+
+# --- Polars: expression for filter() / scan_parquet pushdown ---
+def to_polars(filters):
+    import polars as pl
+
+    def predicate(c, op, v):
+        col = pl.col(c)
+        if op in ("in", "not in"):
+            mask = col.is_in(list(v))
+            return ~mask if op == "not in" else mask
+        return {"==": col == v, "=": col == v, "!=": col != v, "<": col < v,
+                "<=": col <= v, ">": col > v, ">=": col >= v}[op]
+
+    return pl.any_horizontal([
+        pl.all_horizontal([predicate(*p) for p in conjunction])
+        for conjunction in normalize(filters)
+    ]).fill_null(False)
+
+
+# --- Row-group pruning from footer statistics ---
+def _may_match(stats, op, value) -> bool:
+    # False only when min/max prove no row in the row group satisfies the predicate
+    if stats is None or not stats.has_min_max:
+        return True
+    lo, hi = stats.min, stats.max
+    try:
+        if op in ("==", "="):
+            return lo <= value <= hi
+        if op == "<":
+            return lo < value
+        if op == "<=":
+            return lo <= value
+        if op == ">":
+            return hi > value
+        if op == ">=":
+            return hi >= value
+        if op == "in":
+            return any(lo <= v <= hi for v in value)
+    except TypeError:  # statistics in a type the value can't be compared with
+        return True
+    return True  # != and not in can't be ruled out from a range
+
+
+def prune_row_groups(meta, filters) -> list:
+    """Indices of the row groups that may hold rows passing the filter."""
+    conjunctions = normalize(filters)
+    if not conjunctions:
+        return list(range(meta.num_row_groups))
+
+    keep = []
+    for rg in range(meta.num_row_groups):
+        rg_meta = meta.row_group(rg)
+        stats = {rg_meta.column(i).path_in_schema: rg_meta.column(i).statistics
+                 for i in range(rg_meta.num_columns)}
+        if any(all(_may_match(stats.get(c), op, v) for c, op, v in conjunction)
+               for conjunction in conjunctions):
+            keep.append(rg)
+    return keep
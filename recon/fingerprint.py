@@ -0,0 +1,156 @@
+# recon/fingerprint.py
+import hashlib, os, pickle
+from pathlib import Path
+
+import pyarrow.parquet as pq
+
+INDEX_SUFFIX = ".fpidx.pkl"
+INDEX_VERSION = 2
+READ_BLOCK = 1 << 20  # hash raw column chunks 1 MiB at a time
+
+
+def index_path(path) -> Path:
+    # Sidecar lives next to the Parquet file: data.parquet -> data.parquet.fpidx.pkl
+    return Path(str(path) + INDEX_SUFFIX)
+
+
+def _chunk_byte_range(col_meta) -> tuple:
+    # A column chunk starts at its dictionary page (if any), then its data pages
+    start = col_meta.data_page_offset
+    if col_meta.has_dictionary_page and col_meta.dictionary_page_offset:
+        start = min(start, col_meta.dictionary_page_offset)
+    return start, col_meta.total_compressed_size
+
+
+def _null_count(col_meta):
+    # None means "unknown", which callers must treat as "may contain nulls"
+    if not col_meta.is_stats_set or not col_meta.statistics.has_null_count:
+        return None
+    return col_meta.statistics.null_count
+
+
+def _may_hold_nan(col_meta) -> bool:
+    # Float statistics leave NaN out of min/max and don't count it, so nothing in the
+    # footer rules NaN out; NaN != NaN, so equal bytes don't mean equal values
+    if col_meta.physical_type in ("FLOAT", "DOUBLE"):
+        return True
+    return (col_meta.physical_type == "FIXED_LEN_BYTE_ARRAY" and col_meta.is_stats_set
+            and str(col_meta.statistics.logical_type) == "Float16")
+
+
+def build_index(path) -> dict:
+    """
+    Hash the still-encoded bytes of every column chunk (no decompression or decoding).
+    Equal digests for the same row group and column mean the decoded values are equal too.
+    """
+    path = Path(path)
+    stat = path.stat()
+    pf = pq.ParquetFile(path)
+    meta = pf.metadata
+
+    row_groups = []
+    with open(path, "rb") as f:
+        for rg in range(meta.num_row_groups):
+            rg_meta = meta.row_group(rg)
+            columns, null_counts, floats = {}, {}, []
+            rg_hash = hashlib.blake2b(digest_size=16)
+
+            for ci in range(rg_meta.num_columns):
+                col_meta = rg_meta.column(ci)
+                start, remaining = _chunk_byte_range(col_meta)
+
+                # Encoding details are part of the identity, not just the payload
+                h = hashlib.blake2b(digest_size=16)
+                h.update(f"{col_meta.physical_type}|{col_meta.compression}|{col_meta.encodings}".encode())
+                f.seek(start)
+                while remaining > 0:
+                    block = f.read(min(READ_BLOCK, remaining))
+                    if not block:
+                        break
+                    h.update(block)
+                    remaining -= len(block)
+
+                name = col_meta.path_in_schema
+                columns[name] = h.hexdigest()
+                null_counts[name] = _null_count(col_meta)
+                if _may_hold_nan(col_meta):
+                    floats.append(name)
+                rg_hash.update(h.digest())
+
+            row_groups.append({
+                "num_rows": rg_meta.num_rows,
+                "hash": rg_hash.hexdigest(),
+                "columns": columns,
+                "null_counts": null_counts,
+                "floats": floats,
+            })
+
+    return {
+        "version": INDEX_VERSION,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "schema": pf.schema_arrow.to_string(show_schema_metadata=False),
+        "row_groups": row_groups,
+    }
+
+
+def load_or_build_index(path) -> dict:
+    # Reuse the sidecar while the file's size and mtime are unchanged; rebuild otherwise
+    path = Path(path)
+    sidecar = index_path(path)
+    stat = path.stat()
+
+    if sidecar.exists() and sidecar.stat().st_size > 0:
+        try:
+            with open(sidecar, "rb") as f:
+                index = pickle.load(f)
+            if (isinstance(index, dict)
+                    and index.get("version") == INDEX_VERSION
+                    and index.get("size") == stat.st_size
+                    and index.get("mtime_ns") == stat.st_mtime_ns):
+                return index
+        except (EOFError, pickle.UnpicklingError, AttributeError) as e:
+            print(f"[warn] {sidecar.name} unreadable ({type(e).__name__}). Rebuilding.")
+
+    index = build_index(path)
+
+    # Atomic write, same as utils_results.save_results
+    tmp = sidecar.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+        pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, sidecar)
+    return index
+
+
+def diff_row_groups(index1: dict, index2: dict):
+    """
+    Plan which row groups still need decoding.
+
+    Returns (matched_rows, pending) where matched_rows counts rows proven equal from
+    fingerprints alone and pending is a list of (row_group, columns_to_compare).
+    Returns None when the two files are not laid out identically (schema or
+    row-group boundaries differ), in which case callers must do a full scan.
+    """
+    if index1["schema"] != index2["schema"]:
+        return None
+    rgs1, rgs2 = index1["row_groups"], index2["row_groups"]
+    if [rg["num_rows"] for rg in rgs1] != [rg["num_rows"] for rg in rgs2]:
+        return None
+
+    matched_rows = 0
+    pending = []
+    for i, (rg1, rg2) in enumerate(zip(rgs1, rgs2)):
+        # A byte-identical chunk can be skipped unless it may hold nulls or NaN: the
+        # PyArrow comparison treats null == null and NaN == NaN as "not matched", so
+        # those still need decoding.
+        cols = [
+            name for name, digest in rg1["columns"].items()
+            if digest != rg2["columns"].get(name) or rg1["null_counts"].get(name) != 0
+            or name in rg1["floats"]
+        ]
+        if cols:
+            pending.append((i, cols))
+        else:
+            matched_rows += rg1["num_rows"]
+
+    return matched_rows, pending
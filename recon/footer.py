@@ -0,0 +1,124 @@
+# recon/footer.py
+import os
+from functools import lru_cache
+
+import pyarrow.parquet as pq
+
+from .fingerprint import READ_BLOCK, _chunk_byte_range, _may_hold_nan, _null_count
+
+# Physical types whose footer min/max are the exact values (no truncation, no NaN exclusion)
+EXACT_STATS_TYPES = ("BOOLEAN", "INT32", "INT64")
+FOOTER_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=FOOTER_CACHE_SIZE)
+def _cached_footer(path: str, size: int, mtime_ns: int):
+    return pq.read_metadata(path)
+
+
+def read_footer(path):
+    """
+    Parsed footer (pq.FileMetaData) of a Parquet file, from an LRU cache keyed by the
+    file's path, size and modification time: a rewritten file is read again, an
+    unchanged one never. Pays off in long-running processes (see recon.service).
+    """
+    st = os.stat(path)
+    return _cached_footer(os.path.abspath(path), st.st_size, st.st_mtime_ns)
+
+
+def footer_cache_info() -> dict:
+    info = _cached_footer.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "max_size": info.maxsize}
+
+
+def _stats_signature(col_meta) -> tuple:
+    # What the footer says about a chunk's values; any difference proves the values differ
+    if not col_meta.is_stats_set:
+        return None
+    s = col_meta.statistics
+    return (s.has_min_max and s.min_raw, s.has_min_max and s.max_raw,
+            s.has_null_count and s.null_count, s.num_values)
+
+
+def _constant(c1, c2, num_rows: int) -> bool:
+    # Both chunks hold num_rows copies of the same value: min == max, no nulls, exact stats
+    if c1.physical_type not in EXACT_STATS_TYPES or not (c1.is_stats_set and c2.is_stats_set):
+        return False
+    s1, s2 = c1.statistics, c2.statistics
+    return (s1.has_min_max and s2.has_min_max and _null_count(c1) == 0 and _null_count(c2) == 0
+            and s1.num_values == s2.num_values == num_rows
+            and s1.min_raw == s1.max_raw == s2.min_raw == s2.max_raw)
+
+
+def _same_bytes(f1, f2, c1, c2) -> bool:
+    # Compare the still-encoded chunk bytes of both files, block by block, stopping early
+    (start1, size1), (start2, size2) = _chunk_byte_range(c1), _chunk_byte_range(c2)
+    if size1 != size2:
+        return False
+    f1.seek(start1)
+    f2.seek(start2)
+    remaining = size1
+    while remaining > 0:
+        n = min(READ_BLOCK, remaining)
+        block = f1.read(n)
+        if not block or block != f2.read(n):
+            return False
+        remaining -= n
+    return True
+
+
+def footer_plan(left, right):
+    """
+    Plan which row groups and columns still need decoding, from the footers first.
+
+    Per row group and column chunk:
+    - different statistics (min/max, null count, value count) prove the values differ;
+    - equal exact statistics with min == max and no nulls prove every value is equal;
+    - otherwise, with the same physical type, compression and encodings, the raw chunk
+      bytes of both files are compared (read, never decompressed): equal bytes prove
+      equal values.
+    Chunks that may hold nulls or NaN are always decoded (null == null and NaN == NaN are
+    not matches); float statistics leave NaN out, so float chunks are never proven equal.
+
+    Returns (matched_rows, pending, info) like recon.fingerprint.diff_row_groups plus
+    counters for the chunks in each category, or None when schema or row-group
+    boundaries differ (callers then do a full scan). Needs no sidecar file.
+    """
+    meta1, meta2 = read_footer(left), read_footer(right)
+    if not meta1.schema.to_arrow_schema().equals(meta2.schema.to_arrow_schema()):
+        return None
+    if ([meta1.row_group(i).num_rows for i in range(meta1.num_row_groups)]
+            != [meta2.row_group(i).num_rows for i in range(meta2.num_row_groups)]):
+        return None
+
+    info = {"stats_differ": 0, "constant": 0, "bytes_equal": 0, "bytes_differ": 0, "bytes_proven": 0}
+    matched_rows = 0
+    pending = []
+    with open(left, "rb") as f1, open(right, "rb") as f2:
+        for rg in range(meta1.num_row_groups):
+            rg1, rg2 = meta1.row_group(rg), meta2.row_group(rg)
+            cols = []
+            for ci in range(rg1.num_columns):
+                c1, c2 = rg1.column(ci), rg2.column(ci)
+                name = c1.path_in_schema
+                if _stats_signature(c1) != _stats_signature(c2):
+                    info["stats_differ"] += 1
+                    cols.append(name)
+                elif _constant(c1, c2, rg1.num_rows):
+                    info["constant"] += 1
+                elif _null_count(c1) != 0 or _may_hold_nan(c1):
+                    cols.append(name)
+                elif ((c1.physical_type, c1.compression, c1.encodings)
+                      == (c2.physical_type, c2.compression, c2.encodings)
+                      and _same_bytes(f1, f2, c1, c2)):
+                    info["bytes_equal"] += 1
+                    info["bytes_proven"] += c1.total_compressed_size
+                else:
+                    info["bytes_differ"] += 1
+                    cols.append(name)
+            if cols:
+                pending.append((rg, cols))
+            else:
+                matched_rows += rg1.num_rows
+
+    return matched_rows, pending, info
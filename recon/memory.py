@@ -0,0 +1,72 @@
+# recon/memory.py
+import os, sys, threading
+
+try:
+    import resource  # POSIX only
+except ImportError:
+    resource = None
+
+try:
+    PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+except (AttributeError, ValueError, OSError):
+    PAGE_SIZE = 4096
+
+
+def peak_rss_bytes():
+    # Process high-water mark; ru_maxrss is KiB on Linux, bytes on macOS
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def current_rss_bytes():
+    # /proc is cheap enough to poll; psutil covers macOS/Windows when installed
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        pass
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().rss
+
+
+class PeakRSS:
+    """
+    Context manager sampling RSS on a background thread while a block runs.
+
+    Unlike ru_maxrss, the peak is scoped to the block, so several engines run in
+    the same process each get their own number. Falls back to the process
+    high-water mark when RSS can't be polled on this platform.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.peak = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self) -> None:
+        while True:
+            rss = current_rss_bytes()
+            if rss is not None and (self.peak is None or rss > self.peak):
+                self.peak = rss
+            if self._stop.wait(self.interval):
+                return
+
+    def __enter__(self):
+        if current_rss_bytes() is not None:
+            self._thread = threading.Thread(target=self._sample, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+        else:
+            self.peak = peak_rss_bytes()
+        return False
@@ -0,0 +1,101 @@
+# recon/mismatch.py
+import json
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+MISMATCH_DIR = Path("mismatches")
+MASK_METADATA_KEY = "diff_mask_columns"  # bit i of diff_mask <-> columns[i]
+MAX_MASK_COLUMNS = 64
+
+
+def mismatch_path(engine: str) -> Path:
+    # One output file per engine, e.g. mismatches/pyarrow.parquet
+    MISMATCH_DIR.mkdir(exist_ok=True)
+    return MISMATCH_DIR / f"{engine}.parquet"
+
+
+def diff_mask_metadata(columns: list) -> dict:
+    # Stored in the Parquet footer so readers can decode diff_mask without guessing
+    if len(columns) > MAX_MASK_COLUMNS:
+        raise ValueError(f"diff_mask supports at most {MAX_MASK_COLUMNS} columns, got {len(columns)}")
+    return {MASK_METADATA_KEY: json.dumps(list(columns))}
+
+
+def read_mask_columns(path) -> list:
+    # Footer key/value metadata is where every engine (PyArrow, DuckDB, Polars) puts it
+    metadata = pq.read_metadata(path).metadata or {}
+    return json.loads(metadata[MASK_METADATA_KEY.encode()])
+
+
+def decode_diff_mask(mask: int, columns: list) -> list:
+    # Column names whose bit is set
+    return [c for i, c in enumerate(columns) if mask >> i & 1]
+
+
+class MismatchWriter:
+    """
+    Stream mismatching rows of a PyArrow comparison into a Parquet file.
+
+    Output columns: row_index (0-based position in the left file), the key column
+    (if any, taken from the left file) and diff_mask (uint64, bit i set when
+    columns[i] differs). The file is only created once a mismatch is seen, so the
+    all-match path never touches the writer.
+    """
+
+    def __init__(self, path, columns: list, key_col: str = None, key_type: pa.DataType = None):
+        self.path = Path(path)
+        self.columns = list(columns)
+        self.bits = {c: i for i, c in enumerate(self.columns)}
+        self.key_col = key_col
+
+        fields = [pa.field("row_index", pa.int64())]
+        if key_col is not None:
+            fields.append(pa.field(key_col, key_type))
+        fields.append(pa.field("diff_mask", pa.uint64()))
+        self.schema = pa.schema(fields, metadata=diff_mask_metadata(self.columns))
+
+        self._writer = None
+        self.rows_written = 0
+
+        # Drop output from a previous run so a clean run leaves no stale mismatches
+        if self.path.exists():
+            self.path.unlink()
+
+    def write(self, row_offset: int, row_equal: pa.Array, column_equals: dict, keys: pa.Array = None,
+              positions=None) -> None:
+        """
+        row_equal: per-row result (null counts as a mismatch).
+        column_equals: {column name: per-row pc.equal result} for the compared columns.
+        positions: batch positions of the rows in row_equal, when only a subset of the
+            batch was compared (None = row_equal covers the whole batch).
+        """
+        # Only the mismatching rows are gathered, so memory scales with mismatches
+        idx = pc.indices_nonzero(pc.invert(pc.fill_null(row_equal, False)))
+        if len(idx) == 0:
+            return
+
+        mask = np.zeros(len(idx), dtype=np.uint64)
+        for name, eq in column_equals.items():
+            differs = pc.invert(pc.fill_null(pc.take(eq, idx), False))
+            mask |= differs.to_numpy(zero_copy_only=False).astype(np.uint64) << np.uint64(self.bits[name])
+
+        rows = idx if positions is None else pc.take(pa.array(positions), idx)
+        arrays = [pc.add(pc.cast(rows, pa.int64()), row_offset)]
+        if self.key_col is not None:
+            arrays.append(pc.take(keys, rows))
+        arrays.append(pa.array(mask, pa.uint64()))
+
+        if self._writer is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = pq.ParquetWriter(self.path, self.schema)
+        self._writer.write_batch(pa.record_batch(arrays, schema=self.schema))
+        self.rows_written += len(idx)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
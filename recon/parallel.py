@@ -0,0 +1,109 @@
+# recon/parallel.py
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from .filters import arrow_mask, filter_columns, prune_row_groups
+from .rules import column_equal
+
+
+def row_group_layout(path) -> list:
+    # Row count of every row group, read from the footer only
+    meta = pq.ParquetFile(path).metadata
+    return [meta.row_group(i).num_rows for i in range(meta.num_row_groups)]
+
+
+def split_row_groups(layout: list, num_parts: int) -> list:
+    """
+    Split row-group indices into at most num_parts contiguous ranges of roughly
+    equal row counts. Returns a list of (first, last_exclusive) tuples.
+    """
+    total = sum(layout)
+    num_parts = max(1, min(num_parts, len(layout)))
+    target = total / num_parts
+
+    ranges, start, acc = [], 0, 0
+    for i, rows in enumerate(layout):
+        acc += rows
+        # Close the range once it reaches its share of rows
+        if acc >= target * (len(ranges) + 1):
+            ranges.append((start, i + 1))
+            start = i + 1
+    if start < len(layout):
+        ranges.append((start, len(layout)))
+    return ranges
+
+
+def _init_worker():
+    # One Arrow thread per process: the pool already provides the parallelism
+    pa.set_cpu_count(1)
+    pa.set_io_thread_count(1)
+
+
+def count_matches(path1, path2, first: int, last: int, batch_size: int,
+                  dictionary_columns: list = None, columns: list = None, filters=None, rules: dict = None) -> tuple:
+    """Worker: compare row groups [first, last) of both files, return (matched_rows, total_rows)."""
+    pf1 = pq.ParquetFile(path1, read_dictionary=dictionary_columns)
+    pf2 = pq.ParquetFile(path2, read_dictionary=dictionary_columns)
+    # Row groups the left statistics rule out are skipped by every worker
+    keep = set(prune_row_groups(pf1.metadata, filters))
+    row_groups = [rg for rg in range(first, last) if rg in keep]
+
+    columns = columns or pf1.schema_arrow.names
+    read_cols = columns + [c for c in filter_columns(filters) if c not in columns]
+
+    total_rows = 0
+    matched_rows = 0
+    for b1, b2 in zip(
+        pf1.iter_batches(batch_size=batch_size, row_groups=row_groups, columns=read_cols, use_threads=False),
+        pf2.iter_batches(batch_size=batch_size, row_groups=row_groups, columns=read_cols, use_threads=False)
+    ):
+        if b1.num_rows != b2.num_rows or b1.num_columns != b2.num_columns:
+            raise ValueError("Batch shape mismatch")
+        if filters:
+            mask = arrow_mask(b1, filters)
+            b1, b2 = b1.filter(mask), b2.filter(mask)
+
+        # Same kernel as the single-threaded path so the counts are identical
+        row_equal = reduce(
+            pc.and_kleene,
+            (column_equal(b1.column(c), b2.column(c), (rules or {}).get(c)) for c in columns)
+        )
+        matched_rows += int(pc.sum(pc.cast(row_equal, pa.int64())).as_py() or 0)
+        total_rows += b1.num_rows
+
+    return matched_rows, total_rows
+
+
+def parallel_match_counts(path1, path2, batch_size: int, max_workers: int = None,
+                          tasks_per_worker: int = 4, dictionary_columns: list = None,
+                          columns: list = None, filters=None,
+                          rules: dict = None) -> tuple:
+    """
+    Fan row-group ranges of both files out to a process pool and sum the partial counts.
+    Both files must share the same row-group layout. Returns (matched_rows, total_rows).
+    """
+    layout1, layout2 = row_group_layout(path1), row_group_layout(path2)
+    if layout1 != layout2:
+        raise ValueError("Row-group layout mismatch: parallel mode needs identically chunked files")
+
+    max_workers = max_workers or os.cpu_count() or 1
+    # A few ranges per worker keeps cores busy when row groups decode at different speeds
+    ranges = split_row_groups(layout1, max_workers * tasks_per_worker)
+
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(ranges) or 1),
+                             initializer=_init_worker) as pool:
+        futures = [
+            pool.submit(count_matches, str(path1), str(path2), first, last, batch_size,
+                        dictionary_columns, columns, filters, rules)
+            for first, last in ranges
+        ]
+        partials = [f.result() for f in futures]
+
+    matched_rows = sum(m for m, _ in partials)
+    total_rows = sum(t for _, t in partials)
+    return matched_rows, total_rows
@@ -0,0 +1,65 @@
+# recon/prefetch.py
+import queue, threading
+
+_DONE = object()
+
+
+class Prefetcher:
+    """
+    Pull an iterator on a background thread into a bounded queue.
+
+    Parquet reads and decompression release the GIL, so while the caller compares
+    batch i the thread is already decoding batch i+1 .. i+depth. The queue bound
+    caps the extra memory at `depth` batches. Exceptions from the source are
+    re-raised in the caller; close() stops the thread early.
+    """
+
+    def __init__(self, iterator, depth: int = 2):
+        if depth < 1:
+            raise ValueError("depth must be at least 1")
+        self._queue = queue.Queue(maxsize=depth)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(iterator,), daemon=True)
+        self._thread.start()
+
+    def _put(self, item) -> bool:
+        # Wake up now and then so close() never waits on a full queue
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self, iterator) -> None:
+        try:
+            for item in iterator:
+                if not self._put(item):
+                    return
+        except BaseException as e:  # handed to the consumer, raised there
+            self._put(e)
+            return
+        self._put(_DONE)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        item = self._queue.get()
+        if item is _DONE:
+            self._queue.put(_DONE)  # stay exhausted on repeated next()
+            raise StopIteration
+        if isinstance(item, BaseException):
+            raise item
+        return item
+
+    def close(self) -> None:
+        self._stop.set()
+        # Drain so a producer blocked in put() sees the stop flag
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        self._thread.join()
@@ -0,0 +1,42 @@
+# recon/result.py
+from dataclasses import dataclass, field
+
+
+@dataclass
+class ReconResult:
+    """
+    Outcome of one reconciliation, whatever the engine.
+
+    Positional engines only fill matched/mismatched rows; keyed ones also report
+    keys present on one side only. All of them count towards total_rows.
+    """
+    engine: str
+    matched_rows: int
+    mismatched_rows: int
+    left_only: int = 0
+    right_only: int = 0
+    timings: dict = field(default_factory=dict)   # seconds per phase, "total" always set by reconcile()
+    peak_rss_bytes: int = None
+    extra: dict = field(default_factory=dict)     # engine-specific details (batch_size, workers, ...)
+    inputs: tuple = None                          # (left, right) as passed to reconcile()
+
+    @property
+    def total_rows(self) -> int:
+        return self.matched_rows + self.mismatched_rows + self.left_only + self.right_only
+
+    @property
+    def match_rate(self) -> float:
+        return self.matched_rows / self.total_rows if self.total_rows else 1.0
+
+    def as_record(self) -> dict:
+        # Flat record for the results store (match_rate/time_taken_sec are what the chart reads)
+        return {
+            "match_rate": round(self.match_rate, 10),
+            "time_taken_sec": round(self.timings.get("total", 0.0), 10),
+            "matched_rows": self.matched_rows,
+            "mismatched_rows": self.mismatched_rows,
+            "left_only": self.left_only,
+            "right_only": self.right_only,
+            "peak_rss_bytes": self.peak_rss_bytes,
+            **self.extra,
+        }
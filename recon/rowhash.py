@@ -0,0 +1,66 @@
+# recon/rowhash.py
+import numpy as np
+import pyarrow as pa
+
+_SEED = np.uint64(0xCBF29CE484222325)
+_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)  # odd, so every step is a bijection
+# fmix64, the MurmurHash3 finalizer: every output bit depends on every input bit
+_MIX1 = np.uint64(0xFF51AFD7ED558CCD)
+_MIX2 = np.uint64(0xC4CEB9FE1A85EC53)
+_SHIFT = np.uint64(33)
+
+
+def hashable(data_type: pa.DataType) -> bool:
+    # Fixed-width values whose raw bits can be read straight out of the Arrow buffer
+    return (
+        pa.types.is_integer(data_type) or pa.types.is_floating(data_type)
+        or pa.types.is_temporal(data_type)
+    ) and data_type.bit_width >= 8
+
+
+def raw_values(arr: pa.Array) -> np.ndarray:
+    # Zero-copy view of the value buffer as unsigned ints of the same width
+    width = arr.type.bit_width // 8
+    values = np.frombuffer(arr.buffers()[1], dtype=f"u{width}", count=len(arr) + arr.offset)
+    return values[arr.offset:]
+
+
+def new_hashes(num_rows: int) -> np.ndarray:
+    return np.full(num_rows, _SEED, dtype=np.uint64)
+
+
+def mix(values: np.ndarray, out: np.ndarray, tmp: np.ndarray) -> np.ndarray:
+    # fmix64 of every value into out (tmp: scratch of the same size). Without it, two
+    # changes to the same bit (e.g. both signs of a debit/credit pair flipped) cancel out
+    np.copyto(out, values, casting="unsafe")
+    for multiplier in (_MIX1, _MIX2, None):
+        np.right_shift(out, _SHIFT, out=tmp)
+        np.bitwise_xor(out, tmp, out=out)
+        if multiplier is not None:
+            np.multiply(out, multiplier, out=out)
+    return out
+
+
+def fold(h: np.ndarray, values: np.ndarray, scratch: tuple = None) -> None:
+    """
+    h = (h ^ fmix64(value)) * K in place. scratch: two uint64 buffers of len(h) to reuse.
+    Two different rows collide with probability about 2**-64, whatever their difference.
+    """
+    out, tmp = scratch or (np.empty(len(h), dtype=np.uint64), np.empty(len(h), dtype=np.uint64))
+    np.bitwise_xor(h, mix(values, out, tmp), out=h)
+    np.multiply(h, _MULTIPLIER, out=h)
+
+
+def row_hashes(arrays: list, num_rows: int) -> np.ndarray:
+    """
+    One uint64 per row over fixed-width arrays, folding in one column after another.
+
+    Each value is mixed before it is folded in, so rows that differ anywhere collide only
+    by 64-bit chance; everything runs in place on one accumulator and two scratch buffers.
+    Null slots hash whatever bytes sit under them, so callers must mask nulls themselves.
+    """
+    h = new_hashes(num_rows)
+    scratch = np.empty(num_rows, dtype=np.uint64), np.empty(num_rows, dtype=np.uint64)
+    for arr in arrays:
+        fold(h, raw_values(arr), scratch)
+    return h
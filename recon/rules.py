@@ -0,0 +1,161 @@
+# recon/rules.py
+"""
+Per-column comparison rules, for columns where exact equality is too strict:
+
+    rules = {
+        "amount_1": Rule(abs_tol=0.005),                 # |a - b| <= 0.005
+        "price":    {"rel_tol": 1e-9},                   # |a - b| <= 1e-9 * max(|a|, |b|)
+        "ts":       {"truncate": "millisecond"},         # compare timestamps floored to ms
+        "L1":       {"ignore_case": True, "trim": True}, # " Abc" == "abc"
+        "comment":  {"nulls_equal": True},               # null == null is a match
+    }
+
+Columns without a rule keep the engines' exact equality. Every rule is a handful of
+Arrow compute kernels (or Polars expressions) over whole columns, never a Python loop.
+"""
+from dataclasses import dataclass, fields
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from .compare import equal
+
+TRUNCATE_UNITS = {"day": "1d", "hour": "1h", "minute": "1m", "second": "1s",
+                  "millisecond": "1ms", "microsecond": "1us"}  # Arrow unit -> Polars duration
+
+
+@dataclass(frozen=True)
+class Rule:
+    abs_tol: float = 0.0        # numeric: absolute tolerance
+    rel_tol: float = 0.0        # numeric: tolerance relative to the larger magnitude
+    truncate: str = None        # temporal: floor both sides to this unit first
+    ignore_case: bool = False   # strings: compare lower-cased
+    trim: bool = False          # strings: strip leading/trailing whitespace
+    nulls_equal: bool = False   # null on both sides is a match
+
+    @property
+    def tolerant(self) -> bool:
+        return bool(self.abs_tol or self.rel_tol)
+
+
+def _is_string(data_type: pa.DataType) -> bool:
+    if pa.types.is_dictionary(data_type):
+        data_type = data_type.value_type
+    return pa.types.is_string(data_type) or pa.types.is_large_string(data_type)
+
+
+def resolve_rules(rules, schema: pa.Schema) -> dict:
+    """
+    {column: Rule} from a mapping of Rule objects or keyword dicts, checked against the
+    file schema so a typo or a rule that can't apply fails before anything is read.
+    """
+    resolved = {}
+    for column, rule in (rules or {}).items():
+        if isinstance(rule, dict):
+            unknown = set(rule) - {f.name for f in fields(Rule)}
+            if unknown:
+                raise ValueError(f"Unknown rule option(s) for '{column}': {sorted(unknown)}")
+            rule = Rule(**rule)
+        if column not in schema.names:
+            raise ValueError(f"Rule given for unknown column '{column}'")
+        data_type = schema.field(column).type
+
+        if rule.abs_tol < 0 or rule.rel_tol < 0:
+            raise ValueError(f"Tolerances must be >= 0 (column '{column}')")
+        if rule.tolerant and not (pa.types.is_integer(data_type) or pa.types.is_floating(data_type)
+                                  or pa.types.is_decimal(data_type)):
+            raise ValueError(f"Tolerance needs a numeric column; '{column}' is {data_type}")
+        if rule.truncate is not None:
+            if rule.truncate not in TRUNCATE_UNITS:
+                raise ValueError(f"truncate must be one of {list(TRUNCATE_UNITS)}, got {rule.truncate!r}")
+            if not pa.types.is_timestamp(data_type):
+                raise ValueError(f"truncate needs a timestamp column; '{column}' is {data_type}")
+        if (rule.ignore_case or rule.trim) and not _is_string(data_type):
+            raise ValueError(f"ignore_case/trim need a string column; '{column}' is {data_type}")
+        resolved[column] = rule
+    return resolved
+
+
+# --- Arrow kernels ---
+def _normalize_strings(values, rule: Rule):
+    if rule.trim:
+        values = pc.utf8_trim_whitespace(values)
+    if rule.ignore_case:
+        values = pc.utf8_lower(values)
+    return values
+
+
+def _prepare(arr, rule: Rule):
+    # Value transforms applied to each side before comparing
+    if rule.truncate is not None:
+        return pc.floor_temporal(arr, unit=rule.truncate)
+    if not (rule.ignore_case or rule.trim):
+        return arr
+    if pa.types.is_dictionary(arr.type):
+        # Transform the (small) dictionary, then re-encode it so values that became equal
+        # ("A" and "a") share a code; the codes stay integers for the comparison
+        chunks = arr.chunks if isinstance(arr, pa.ChunkedArray) else [arr]
+        mapped = []
+        for chunk in chunks:
+            remap = pc.dictionary_encode(_normalize_strings(chunk.dictionary, rule))
+            mapped.append(pa.DictionaryArray.from_arrays(pc.take(remap.indices, chunk.indices), remap.dictionary))
+        return pa.chunked_array(mapped) if isinstance(arr, pa.ChunkedArray) else mapped[0]
+    return _normalize_strings(arr, rule)
+
+
+def _within_tolerance(a, b, rule: Rule):
+    a, b = pc.cast(a, pa.float64()), pc.cast(b, pa.float64())
+    tol = rule.abs_tol
+    if rule.rel_tol:
+        scale = pc.max_element_wise(pc.abs(a), pc.abs(b))
+        tol = pc.max_element_wise(pc.multiply(scale, rule.rel_tol), pa.scalar(rule.abs_tol))
+    # Exact equality as well, so inf == inf (inf - inf is NaN)
+    return pc.or_kleene(pc.less_equal(pc.abs(pc.subtract(a, b)), tol), pc.equal(a, b))
+
+
+def column_equal(a, b, rule: Rule = None):
+    """
+    pc.equal semantics (null in -> null out) under an optional rule;
+    with rule.nulls_equal, a null on both sides gives True instead.
+    """
+    if rule is None:
+        return equal(a, b)
+    a, b = _prepare(a, rule), _prepare(b, rule)
+    eq = _within_tolerance(a, b, rule) if rule.tolerant else equal(a, b)
+    if rule.nulls_equal:
+        eq = pc.or_kleene(eq, pc.and_(pc.is_null(a), pc.is_null(b)))
+    return eq
+
+
+# --- Polars expressions ---
+def polars_equal(a, b, rule: Rule, floating: bool = False):
+    """
+    Same rule as column_equal, between two Polars expressions. Polars' == holds for
+    NaN == NaN where Arrow's doesn't, so NaN is ruled out explicitly; floating: the
+    columns are floats (tolerant rules compare as floats whatever the type).
+    """
+    import polars as pl
+
+    def prepare(expr):
+        if rule.truncate is not None:
+            return expr.dt.truncate(TRUNCATE_UNITS[rule.truncate])
+        if rule.trim or rule.ignore_case:
+            expr = expr.cast(pl.String)  # Categorical columns have no .str namespace
+        if rule.trim:
+            expr = expr.str.strip_chars()
+        if rule.ignore_case:
+            expr = expr.str.to_lowercase()
+        return expr
+
+    a, b = prepare(a), prepare(b)
+    if rule.tolerant:
+        a, b = a.cast(pl.Float64), b.cast(pl.Float64)
+        tol = pl.lit(rule.abs_tol)
+        if rule.rel_tol:
+            tol = pl.max_horizontal(pl.max_horizontal(a.abs(), b.abs()) * rule.rel_tol, tol)
+        eq = (((a - b).abs() <= tol) | (a == b)) & a.is_not_nan()
+    else:
+        eq = (a == b) & a.is_not_nan() if floating else a == b
+    if rule.nulls_equal:
+        eq = eq | (a.is_null() & b.is_null())
+    return eq
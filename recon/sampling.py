@@ -0,0 +1,90 @@
+# recon/sampling.py
+import math, random
+from statistics import NormalDist
+
+from .parallel import split_row_groups
+
+
+def stratified_order(layout: list, strata: int, seed: int = None) -> list:
+    """
+    Row-group indices in sampling order: the file is cut into `strata` contiguous ranges,
+    each range is shuffled, and draws go round-robin over the ranges. Any prefix of the
+    order is then spread over the whole file instead of clustering at one end.
+    """
+    rng = random.Random(seed)
+    ranges = [list(range(first, last)) for first, last in split_row_groups(layout, strata)]
+    for r in ranges:
+        rng.shuffle(r)
+    order = []
+    while any(ranges):
+        rng.shuffle(ranges)  # which stratum goes first changes every round
+        order.extend(r.pop() for r in ranges if r)
+    return order
+
+
+def _wilson(p: float, n: float, confidence: float) -> tuple:
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    centre = (p + z * z / (2 * n)) / (1 + z * z / n)
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / (1 + z * z / n)
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+def wilson_interval(matched: int, sampled: int, population: int, confidence: float = 0.95) -> tuple:
+    """
+    Wilson score interval for the match rate, with a finite population correction:
+    the interval narrows as the sample approaches the whole file and collapses to the
+    exact rate once every row was compared. Rows are treated as independent draws;
+    see cluster_interval when they were drawn in blocks.
+    """
+    if sampled == 0:
+        return 0.0, 1.0
+    p = matched / sampled
+    if sampled >= population:
+        return p, p
+    n = sampled * (population - 1) / (population - sampled)  # effective sample size after FPC
+    return _wilson(p, n, confidence)
+
+
+def design_effect(clusters: list) -> float:
+    """
+    Variance of the match rate estimated between clusters, as a multiple of what
+    independent rows would give (never below 1). clusters: (matched, rows) per block
+    of rows drawn together, e.g. per row group.
+    """
+    k = len(clusters)
+    rows = sum(n for _, n in clusters)
+    if k < 2 or rows == 0:
+        return 1.0
+    p = sum(m for m, _ in clusters) / rows
+    if p in (0.0, 1.0):
+        return 1.0  # every cluster at the same rate: nothing to inflate
+    # Ratio estimator variance over clusters vs the binomial variance over rows
+    spread = sum((m - p * n) ** 2 for m, n in clusters) / (k - 1)
+    var_clusters = spread / (k * (rows / k) ** 2)
+    return max(1.0, var_clusters / (p * (1 - p) / rows))
+
+
+def cluster_interval(clusters: list, population: int, confidence: float = 0.95) -> tuple:
+    """
+    Wilson interval (see wilson_interval) for rows drawn in clusters: the sample size is
+    divided by the design effect, so mismatches concentrated in a few row groups widen
+    the interval instead of passing for independent evidence.
+    """
+    matched, sampled = sum(m for m, _ in clusters), sum(n for _, n in clusters)
+    if sampled == 0:
+        return 0.0, 1.0
+    p = matched / sampled
+    if sampled >= population:
+        return p, p
+    n = sampled / design_effect(clusters) * (population - 1) / (population - sampled)
+    return _wilson(p, n, confidence)
+
+
+def spent_alpha(alpha: float, progress: float) -> float:
+    """
+    Share of the error rate `alpha` spent once `progress` (0..1) of the sampling budget
+    was read: the Pocock-type spending function alpha * ln(1 + (e - 1) * progress).
+    Testing look j at level spent_alpha(t_j) - spent_alpha(t_j-1) keeps the chance of
+    any wrong verdict across all looks within alpha.
+    """
+    return alpha * math.log(1 + (math.e - 1) * min(max(progress, 0.0), 1.0))
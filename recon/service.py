@@ -0,0 +1,251 @@
+# recon/service.py
+"""
+Resident reconciliation service: one long-running process that keeps the engines
+imported, a pool of DuckDB connections open and Parquet footers cached (see
+recon.footer.read_footer), and runs reconcile jobs on a bounded set of worker threads.
+
+    POST /jobs        {"left", "right", "engine", "options", "label"} -> 202 {"id": ...}
+                      (503 when every worker is busy and the queue is full)
+    GET  /jobs/<id>   job state and, once done, its result; ?wait=<s> blocks until then
+    GET  /status      workers, queue, pool and footer cache counters
+
+Jobs run in threads, so engines share the process: Arrow, Polars and DuckDB release
+the GIL while they work. Peak RSS is the process's, so it overlaps between
+concurrent jobs. Relative paths resolve against the service's working directory.
+"""
+import json, threading, uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from queue import Queue
+from urllib import error, request
+from urllib.parse import parse_qs, urlsplit
+
+from .api import reconcile
+from .engines import ENGINES, get_engine
+from .footer import footer_cache_info
+from .result import ReconResult
+
+DEFAULT_PORT = 8765
+
+
+class ServiceBusy(RuntimeError):
+    """Every worker is busy and the queue is full."""
+
+
+class ConnectionPool:
+    """
+    A fixed set of DuckDB connections, each lent to one job at a time. Settings a job
+    changes (see recon.engines.duckdb_engine.reconcile) are reset when it is returned.
+    """
+
+    JOB_SETTINGS = ("threads", "memory_limit", "temp_directory")
+
+    def __init__(self, size: int):
+        import duckdb
+
+        self.size = size
+        self._idle = Queue()
+        for _ in range(size):
+            self._idle.put(duckdb.connect())
+
+    @contextmanager
+    def connection(self):
+        con = self._idle.get()  # blocks while every connection is lent out
+        try:
+            yield con
+        finally:
+            for setting in self.JOB_SETTINGS:
+                con.execute(f"RESET {setting}")
+            self._idle.put(con)
+
+    def idle(self) -> int:
+        return self._idle.qsize()
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+class ReconService:
+    """
+    Job scheduler: at most `workers` jobs run at once and at most `queue_size` more wait;
+    submitting beyond that raises ServiceBusy instead of piling up work. The last
+    `history` finished jobs are kept for lookup.
+
+    preload: engine names imported up front, so the first job doesn't pay for it.
+    on_result: called as on_result(job, result) in the worker thread after a job
+        succeeds, e.g. to append it to the results store.
+    """
+
+    def __init__(self, workers: int = 2, queue_size: int = 16, duckdb_connections: int = None,
+                 history: int = 1_000, preload=(), on_result=None):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.history = history
+        self.on_result = on_result
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="recon")
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._lock = threading.Lock()
+        self._jobs = OrderedDict()   # id -> job record, oldest first
+        self._done = {}              # id -> threading.Event, set once the job has finished
+        # One connection per worker is enough: a job holds one at a time
+        self.pool = ConnectionPool(duckdb_connections or workers)
+        for name in preload:
+            get_engine(name)
+
+    def submit(self, left, right, engine: str = "pyarrow", options: dict = None, label: str = None) -> str:
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine '{engine}'. Choose from: {', '.join(ENGINES)}")
+        if not self._slots.acquire(blocking=False):
+            raise ServiceBusy(f"{self.workers} jobs running and {self.queue_size} queued")
+        job = {"id": uuid.uuid4().hex[:12], "state": "queued", "label": label, "engine": engine,
+               "left": str(left), "right": str(right), "options": options or {},
+               "submitted_at": _now(), "started_at": None, "finished_at": None, "result": None, "error": None}
+        with self._lock:
+            self._jobs[job["id"]] = job
+            self._done[job["id"]] = threading.Event()
+            self._trim()
+        self._executor.submit(self._run, job)
+        return job["id"]
+
+    def _trim(self) -> None:
+        # Forget the oldest finished jobs beyond the history limit (never queued or running ones)
+        finished = [i for i, j in self._jobs.items() if j["state"] in ("done", "failed")]
+        for job_id in finished[:max(0, len(finished) - self.history)]:
+            del self._jobs[job_id], self._done[job_id]
+
+    def _run(self, job: dict) -> None:
+        job["state"], job["started_at"] = "running", _now()
+        try:
+            opts = dict(job["options"])
+            if job["engine"] == "duckdb" and "con" not in opts:
+                # Settings the job applies (threads, memory_limit, ...) are reset on return
+                with self.pool.connection() as con:
+                    result = reconcile(job["left"], job["right"], engine="duckdb", con=con, **opts)
+            else:
+                result = reconcile(job["left"], job["right"], engine=job["engine"], **opts)
+            job["result"] = asdict(result)
+            if self.on_result is not None:
+                self.on_result(job, result)
+            job["state"] = "done"
+        except Exception as exc:  # reported through the job, the worker lives on
+            job["state"], job["error"] = "failed", f"{type(exc).__name__}: {exc}"
+        finally:
+            job["finished_at"] = _now()
+            self._slots.release()
+            self._done[job["id"]].set()
+
+    def job(self, job_id: str, wait: float = None) -> dict:
+        """The job record (KeyError if unknown); wait: seconds to block for it to finish."""
+        with self._lock:
+            job, done = self._jobs[job_id], self._done[job_id]
+        if wait:
+            done.wait(wait)
+        return job
+
+    def status(self) -> dict:
+        with self._lock:
+            states = [j["state"] for j in self._jobs.values()]
+        return {"workers": self.workers, "queue_size": self.queue_size,
+                "running": states.count("running"), "queued": states.count("queued"),
+                "done": states.count("done"), "failed": states.count("failed"),
+                "duckdb_connections": self.pool.size, "duckdb_idle": self.pool.idle(),
+                "footer_cache": footer_cache_info()}
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    service: ReconService = None  # set on the subclass made by serve()
+
+    def _send(self, status: int, body: dict) -> None:
+        data = json.dumps(body, default=str).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        if urlsplit(self.path).path != "/jobs":
+            return self._send(404, {"error": f"No such endpoint: {self.path}"})
+        try:
+            spec = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            job_id = self.service.submit(spec["left"], spec["right"], spec.get("engine", "pyarrow"),
+                                         spec.get("options"), spec.get("label"))
+        except ServiceBusy as exc:
+            return self._send(503, {"error": str(exc)})
+        except (KeyError, ValueError, TypeError) as exc:
+            return self._send(400, {"error": f"Bad job: {exc}"})
+        self._send(202, {"id": job_id})
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == "/status":
+            return self._send(200, self.service.status())
+        if url.path.startswith("/jobs/"):
+            try:
+                wait = float(parse_qs(url.query).get("wait", ["0"])[0])
+            except ValueError:
+                return self._send(400, {"error": f"Bad wait: {url.query}"})
+            try:
+                return self._send(200, self.service.job(url.path[len("/jobs/"):], wait=wait))
+            except KeyError:
+                return self._send(404, {"error": f"Unknown job: {url.path}"})
+        self._send(404, {"error": f"No such endpoint: {self.path}"})
+
+    def log_message(self, format, *args):
+        pass  # one line per poll would drown the service's own output
+
+
+def serve(service: ReconService, host: str = "127.0.0.1", port: int = DEFAULT_PORT) -> ThreadingHTTPServer:
+    """HTTP server for the service (not started: call serve_forever()). Binds to localhost by default."""
+    handler = type("Handler", (_Handler,), {"service": service})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+class ServiceClient:
+    """Submit jobs to a running service and wait for their results, e.g. from 01. main.py."""
+
+    def __init__(self, url: str = f"http://127.0.0.1:{DEFAULT_PORT}"):
+        self.url = url.rstrip("/")
+
+    def _call(self, path: str, body: dict = None, timeout: float = None) -> dict:
+        data = json.dumps(body).encode() if body is not None else None
+        req = request.Request(self.url + path, data=data, headers={"Content-Type": "application/json"})
+        try:
+            with request.urlopen(req, timeout=timeout) as resp:
+                return json.loads(resp.read())
+        except error.HTTPError as exc:
+            message = json.loads(exc.read()).get("error", str(exc))
+            raise (ServiceBusy if exc.code == 503 else ValueError)(message) from None
+
+    def submit(self, left, right, engine: str = "pyarrow", label: str = None, **opts) -> str:
+        # Paths are sent absolute, so they mean the same file to the service
+        opts = {k: str(Path(v).resolve()) if isinstance(v, Path) else v for k, v in opts.items()}
+        body = {"left": str(Path(left).resolve()), "right": str(Path(right).resolve()),
+                "engine": engine, "options": opts, "label": label}
+        return self._call("/jobs", body)["id"]
+
+    def wait(self, job_id: str, poll: float = 30) -> dict:
+        while True:
+            job = self._call(f"/jobs/{job_id}?wait={poll}", timeout=poll + 30)
+            if job["state"] in ("done", "failed"):
+                return job
+
+    def reconcile(self, left, right, engine: str = "pyarrow", **opts) -> ReconResult:
+        """Like recon.reconcile, run by the service; a failed job raises RuntimeError."""
+        job = self.wait(self.submit(left, right, engine, **opts))
+        if job["state"] == "failed":
+            raise RuntimeError(f"Job {job['id']} failed: {job['error']}")
+        result = job["result"]
+        return ReconResult(**{**result, "inputs": tuple(result["inputs"])})
+
+    def status(self) -> dict:
+        return self._call("/status")
@@ -0,0 +1,129 @@
+# recon/snapshot.py
+import json, mmap, os
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+SNAPSHOT_SUFFIX = ".arrow"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_BATCH_ROWS = 131_072  # record batch size inside the snapshot (fixed, so two snapshots align)
+SOURCE_METADATA_KEY = b"recon_snapshot_source"
+
+
+def snapshot_path(path) -> Path:
+    # Sidecar lives next to the Parquet file: data.parquet -> data.parquet.arrow
+    return Path(str(path) + SNAPSHOT_SUFFIX)
+
+
+def _source_stamp(path: Path) -> dict:
+    stat = path.stat()
+    return {"version": SNAPSHOT_VERSION, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+            "batch_rows": SNAPSHOT_BATCH_ROWS}
+
+
+def _read_stamp(sidecar: Path):
+    try:
+        with pa.memory_map(str(sidecar)) as source:
+            metadata = pa.ipc.open_file(source).schema.metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return None
+    raw = metadata.get(SOURCE_METADATA_KEY)
+    return json.loads(raw) if raw else None
+
+
+def build_snapshot(path) -> Path:
+    """
+    Convert a Parquet file into an uncompressed Arrow IPC file, one batch at a time.
+
+    Uncompressed IPC needs no decoding: once memory-mapped, every column is a view
+    into the page cache. Dictionary columns are written as plain values, since the
+    IPC file format cannot hold a different dictionary per batch.
+    """
+    path = Path(path)
+    sidecar = snapshot_path(path)
+    stamp = _source_stamp(path)
+    pf = pq.ParquetFile(path)
+    schema = pf.schema_arrow.with_metadata({
+        **(pf.schema_arrow.metadata or {}), SOURCE_METADATA_KEY: json.dumps(stamp).encode(),
+    })
+
+    # Atomic write, same as the fingerprint index
+    tmp = sidecar.with_suffix(".tmp")
+    with pa.OSFile(str(tmp), "wb") as sink, pa.ipc.new_file(sink, schema) as writer:
+        for batch in pf.iter_batches(batch_size=SNAPSHOT_BATCH_ROWS):
+            writer.write_batch(batch)
+    os.replace(tmp, sidecar)
+    return sidecar
+
+
+def ensure_snapshot(path) -> Path:
+    # Reuse the sidecar while the Parquet file's size and mtime are unchanged; rebuild otherwise
+    path = Path(path)
+    sidecar = snapshot_path(path)
+    if sidecar.exists() and _read_stamp(sidecar) == _source_stamp(path):
+        return sidecar
+    return build_snapshot(path)
+
+
+class MappedSnapshot:
+    """
+    Read-only memory map of an Arrow IPC file, handed out batch by batch without copies.
+
+    release(batch) drops the mapped pages up to the end of that batch from this
+    process (MADV_DONTNEED); the data stays in the page cache, so RSS stays near
+    one batch while a rerun over the same snapshot is still served from memory.
+    close() (or leaving a with block) unmaps the file; batches still held by the
+    caller keep their pages mapped until they are freed.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = pa.py_buffer(self._mmap)
+        self._base = buffer.address
+        self._reader = pa.ipc.open_file(pa.BufferReader(buffer))
+        self.schema = self._reader.schema
+        self.num_batches = self._reader.num_record_batches
+        self._released = 0
+
+    def iter_batches(self, columns: list = None):
+        # Like ParquetFile.iter_batches; a batch's pages are released once the next one is asked for
+        for i in range(self.num_batches):
+            batch = self._reader.get_batch(i)
+            if columns is not None:
+                batch = batch.select(columns)
+            yield batch
+            self.release(batch)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def close(self) -> None:
+        if self._mmap is None:
+            return
+        self._reader = None
+        mapped, self._mmap = self._mmap, None
+        try:
+            mapped.close()
+        except BufferError:
+            # Batches handed out still point into the map: it goes with the last of them
+            pass
+
+    def release(self, batch: pa.RecordBatch) -> None:
+        if self._mmap is None or not hasattr(mmap, "MADV_DONTNEED"):
+            return
+        end = max(
+            (buf.address + buf.size - self._base
+             for column in batch.columns for buf in column.buffers() if buf is not None),
+            default=0,
+        )
+        # madvise wants page-aligned ranges; everything before `end` has been compared
+        end -= end % mmap.PAGESIZE
+        if end > self._released:
+            self._mmap.madvise(mmap.MADV_DONTNEED, self._released, end - self._released)
+            self._released = end
@@ -0,0 +1,213 @@
+# recon/trace.py
+"""
+Opt-in instrumentation: reconcile(..., trace="traces/pyarrow.json") records
+
+- per-phase (and for PyArrow per-batch) spans: read, with its I/O wait vs decode split,
+  compare, reduce, mismatches;
+- bytes read, rows/s, CPU time vs wall time (high utilization = compute-bound, low =
+  waiting on I/O), Arrow allocator high-water mark and peak RSS;
+
+and writes them as a Chrome trace (open in chrome://tracing or ui.perfetto.dev) whose
+"otherData" holds the flat summary, also returned in result.extra["trace"].
+Without a trace nothing is recorded and the engines run their usual code.
+"""
+import contextvars, io, json, os, sys, threading
+from contextlib import contextmanager
+from pathlib import Path
+from time import perf_counter
+
+TRACE_DIR = Path("traces")
+
+_ACTIVE = contextvars.ContextVar("recon_tracer", default=None)
+
+
+def active_tracer():
+    # The Tracer of the reconcile() call in progress, or None when not tracing
+    return _ACTIVE.get()
+
+
+def trace_path(engine: str) -> Path:
+    # One trace per engine, e.g. traces/pyarrow.json
+    TRACE_DIR.mkdir(exist_ok=True)
+    return TRACE_DIR / f"{engine}.json"
+
+
+def read_io_counters() -> dict:
+    # rchar: bytes returned by read() calls (page cache included); read_bytes: fetched from disk
+    try:
+        with open("/proc/self/io") as f:
+            return {k: int(v) for k, v in (line.split(":") for line in f)}
+    except (OSError, ValueError):
+        return {}
+
+
+class IOCounter:
+    """Bytes and seconds spent inside read calls, summed over every TimedFile sharing it."""
+
+    def __init__(self):
+        self.bytes = 0
+        self.seconds = 0.0
+        self._lock = threading.Lock()  # prefetch threads read concurrently
+
+    def add(self, nbytes: int, seconds: float) -> None:
+        with self._lock:
+            self.bytes += nbytes
+            self.seconds += seconds
+
+    def snapshot(self) -> tuple:
+        with self._lock:
+            return self.bytes, self.seconds
+
+
+class TimedFile(io.FileIO):
+    """
+    A read-only file that times its own reads. Wrapped in pa.PythonFile it lets
+    the time a Parquet read spends waiting on I/O be told apart from decoding.
+    """
+
+    def __init__(self, path, counter: IOCounter):
+        super().__init__(path, "rb")
+        self.counter = counter
+
+    def read(self, size=-1):
+        t0 = perf_counter()
+        data = super().read(size)
+        self.counter.add(len(data), perf_counter() - t0)
+        return data
+
+    def readinto(self, buffer):
+        t0 = perf_counter()
+        n = super().readinto(buffer)
+        self.counter.add(n or 0, perf_counter() - t0)
+        return n
+
+
+class Tracer:
+    """Collects Chrome-trace events (complete spans and counters) for one run."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.events = []
+        self.origin = perf_counter()
+        self.io = IOCounter()
+        self.batches = 0
+        self._pid = os.getpid()
+        self._io_seen = (0, 0.0)
+
+    def _us(self, t: float) -> float:
+        return round((t - self.origin) * 1e6, 3)
+
+    def complete(self, name: str, start: float, end: float, cat: str = "phase", **args) -> None:
+        # A span from perf_counter() stamps the engine already takes
+        self.events.append({"name": name, "cat": cat, "ph": "X", "ts": self._us(start),
+                            "dur": round((end - start) * 1e6, 3), "pid": self._pid,
+                            "tid": threading.get_ident(), "args": args})
+
+    def counter(self, name: str, at: float, **values) -> None:
+        self.events.append({"name": name, "ph": "C", "ts": self._us(at), "pid": self._pid, "args": values})
+
+    def batch(self, rows: int, phases: list) -> None:
+        """
+        One iteration of a batch loop: phases = [(name, start, end), ...], read first.
+        The read span carries the bytes and I/O seconds the timed files saw since the
+        previous batch (with prefetching that I/O ran on the reader threads meanwhile).
+        """
+        nbytes, seconds = self.io.snapshot()
+        (name, start, end), rest = phases[0], phases[1:]
+        self.complete(name, start, end, cat="batch", rows=rows, bytes=nbytes - self._io_seen[0],
+                      io_s=round(seconds - self._io_seen[1], 6))
+        self._io_seen = nbytes, seconds
+        for name, start, end in rest:
+            self.complete(name, start, end, cat="batch")
+        self.batches += 1
+        arrow = sys.modules.get("pyarrow")
+        if arrow is not None:
+            self.counter("arrow_memory", phases[-1][2], bytes_allocated=arrow.total_allocated_bytes())
+
+    @contextmanager
+    def span(self, name: str, cat: str = "phase", **args):
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.complete(name, start, perf_counter(), cat, **args)
+
+    def phases(self, start: float, timings: dict) -> None:
+        # For engines that only report phase totals: their phases run one after another
+        t = start
+        for name, seconds in timings.items():
+            if name != "total":
+                self.complete(name, t, t + seconds)
+                t += seconds
+
+    def phase_summary(self) -> dict:
+        # Per span name: count, total, mean and max
+
+        spans = {}
+        for e in self.events:
+            if e["ph"] != "X" or e["cat"] == "run":
+                continue
+            s = spans.setdefault(e["name"], {"count": 0, "total_s": 0.0, "max_ms": 0.0})
+            s["count"] += 1
+            s["total_s"] += e["dur"] / 1e6
+            s["max_ms"] = max(s["max_ms"], e["dur"] / 1e3)
+        for s in spans.values():
+            s["mean_ms"] = s["total_s"] * 1e3 / s["count"]
+        return spans
+
+    def export(self, path, summary: dict) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms", "otherData": summary}, f)
+        return path
+
+
+def cpu_seconds() -> float:
+    # User + system time of every thread, plus worker processes already reaped
+    t = os.times()
+    return t.user + t.system + t.children_user + t.children_system
+
+
+def run_summary(tracer: Tracer, result, wall_s: float, cpu_s: float, io_delta: dict) -> dict:
+    """
+    The flat summary: throughput, CPU utilization (cpu_s / wall_s; about 1 per busy core
+    when compute-bound, well below 1 when waiting on I/O), bytes read and, when the
+    engine read through timed files, how the read phase split into I/O and decode.
+    """
+    phases = tracer.phase_summary()
+    bytes_read = io_delta.get("rchar", tracer.io.bytes)
+    summary = {
+        "engine": tracer.name,
+        "wall_s": wall_s,
+        "cpu_s": cpu_s,
+        "cpu_utilization": cpu_s / wall_s if wall_s else None,
+        "rows": result.total_rows,
+        "rows_per_s": result.total_rows / wall_s if wall_s else None,
+        "bytes_read": bytes_read,
+        "disk_bytes_read": io_delta.get("read_bytes"),
+        "read_mb_per_s": bytes_read / wall_s / 2**20 if wall_s else None,
+        "batches": tracer.batches,
+        "peak_rss_bytes": result.peak_rss_bytes,
+        "phases": phases,
+    }
+    arrow = sys.modules.get("pyarrow")
+    if arrow is not None:
+        # Process-wide high-water mark of Arrow's allocator (Polars/DuckDB allocate elsewhere)
+        summary["arrow_max_memory"] = arrow.default_memory_pool().max_memory()
+    if tracer.io.bytes:
+        summary["io_s"] = tracer.io.seconds
+        if "read" in phases:
+            summary["decode_s"] = max(phases["read"]["total_s"] - tracer.io.seconds, 0.0)
+    return summary
+
+
+@contextmanager
+def tracing(name: str):
+    """Activate a Tracer for the block; yields it."""
+    tracer = Tracer(name)
+    token = _ACTIVE.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _ACTIVE.reset(token)
@@ -0,0 +1,169 @@
+# recon/tuner.py
+import hashlib, os, pickle, platform
+from pathlib import Path
+
+from .memory import PeakRSS
+
+CACHE_PATH = Path("batch_size_cache.pkl")
+LEGACY_PATH = Path("pyarrow.pkl")  # written by "09. pyarrow_batch_optimizer.py"
+
+
+def load_tuned_batch_size(path: Path = LEGACY_PATH, default: int = 131_072) -> int:
+    """
+    Load an integer batch size from pyarrow.pkl with robust fallbacks.
+    Accepts either:
+      - an int directly, or
+      - a dict containing one of the keys:
+        ['optimal_batch_size', 'batch_size', 'best_batch', 'tuned_batch_size'].
+    """
+    if not path.exists() or path.stat().st_size == 0:
+        print(f"[warn] {path.name} not found/empty. Using default batch size = {default}.")
+        return default
+
+    try:
+        with open(path, "rb") as f:
+            obj = pickle.load(f)
+    except Exception as e:
+        print(f"[warn] Failed to read {path.name} ({type(e).__name__}). Using default batch size = {default}.")
+        return default
+
+    if isinstance(obj, int) and obj > 0:
+        return obj
+
+    if isinstance(obj, dict):
+        for k in ["optimal_batch_size", "batch_size", "best_batch", "tuned_batch_size"]:
+            if k in obj and isinstance(obj[k], int) and obj[k] > 0:
+                return obj[k]
+
+    print(f"[warn] {path.name} did not contain a valid positive int. Using default batch size = {default}.")
+    return default
+
+
+def tuning_key(pf, rss_budget: int = None) -> tuple:
+    """What a tuned batch size depends on: file schema, row-group size, machine and RSS budget."""
+    schema = pf.schema_arrow.to_string(show_schema_metadata=False)
+    meta = pf.metadata
+    rg_rows = meta.row_group(0).num_rows if meta.num_row_groups else 0
+    machine = (platform.node(), platform.machine(), os.cpu_count())
+    return hashlib.sha1(schema.encode()).hexdigest(), rg_rows, machine, rss_budget
+
+
+def load_cache(path: Path = CACHE_PATH) -> dict:
+    if not path.exists() or path.stat().st_size == 0:
+        return {}
+    try:
+        with open(path, "rb") as f:
+            cache = pickle.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (EOFError, pickle.UnpicklingError, AttributeError) as e:
+        print(f"[warn] {path.name} unreadable ({type(e).__name__}). Re-tuning.")
+        return {}
+
+
+def save_cache(cache: dict, path: Path = CACHE_PATH) -> None:
+    # Atomic write, same as utils_results.save_results
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+        pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+
+
+class BatchSizeTuner:
+    """
+    Online hill-climb over batch size, driven by the reconciliation loop itself.
+
+    The caller reads one unit (e.g. a row group) at batch_size, then calls
+    record(). The tuner first doubles the batch size while throughput improves,
+    otherwise halves it, and settles after max_probes units. A candidate whose run
+    pushes RSS over rss_budget is rejected; the peak is measured from one record() to
+    the next (see recon.memory.PeakRSS), so an earlier spike in the process doesn't
+    count against every candidate. The winner is cached per
+    tuning_key() (budget included: a size picked under no budget may not fit a
+    tight one), so later runs start tuned and never probe again.
+    """
+
+    def __init__(self, pf, start: int = 131_072, min_size: int = 8_192, max_size: int = 4_194_304,
+                 max_probes: int = 4, min_gain: float = 0.05, rss_budget: int = None,
+                 cache_path: Path = CACHE_PATH):
+        self.key = tuning_key(pf, rss_budget)
+        self.min_size, self.max_size = min_size, max_size
+        self.max_probes = max_probes
+        self.min_gain = min_gain            # ignore improvements smaller than timing noise
+        self.rss_budget = rss_budget
+        self.cache_path = cache_path
+
+        cached = load_cache(cache_path).get(self.key)
+        self.tuned = cached is not None
+        self.batch_size = cached["batch_size"] if self.tuned else start
+
+        self._best = None        # (values_per_sec, batch_size)
+        self._direction = 2.0    # grow first, shrink if growing doesn't help
+        self._probes = 0
+        self._rss = None         # PeakRSS of the probe in progress
+        self._watch()
+
+    def _watch(self) -> None:
+        # Start measuring the next probe's peak RSS (only needed against a budget)
+        self._unwatch()
+        if self.rss_budget is not None and not self.tuned:
+            self._rss = PeakRSS().__enter__()
+
+    def _unwatch(self):
+        # Stop measuring; the peak of the probe that just ended, or None
+        rss, self._rss = self._rss, None
+        if rss is None:
+            return None
+        rss.__exit__(None, None, None)
+        return rss.peak
+
+    def record(self, num_values: int, seconds: float) -> None:
+        """Feed back one unit processed at the current batch_size (values = rows x columns)."""
+        if self.tuned or num_values == 0:
+            return
+        self._probes += 1
+
+        throughput = num_values / max(seconds, 1e-9)
+        peak = self._unwatch()
+        over_budget = self.rss_budget is not None and peak is not None and peak > self.rss_budget
+
+        if not over_budget and (self._best is None or throughput > self._best[0] * (1 + self.min_gain)):
+            self._best = (throughput, self.batch_size)
+        elif self._direction > 1 and self._probes <= 2:
+            # The first step up did not pay off: try going down from the best instead
+            self._direction = 0.5
+        else:
+            self._finish()
+            return
+
+        if self._probes >= self.max_probes:
+            self._finish()
+            return
+
+        candidate = int(self._best[1] * self._direction) if self._best else int(self.batch_size * 0.5)
+        if not self.min_size <= candidate <= self.max_size:
+            self._finish()
+            return
+        self.batch_size = candidate
+        self._watch()
+
+    def close(self) -> None:
+        """End of scan: keep what was learned if at least two sizes were compared."""
+        self._unwatch()
+        if self.tuned:
+            return
+        if self._probes >= 2:
+            self._finish()
+        elif self._best is not None:
+            # Too few units to compare anything: report the size actually used, cache nothing
+            self.batch_size = self._best[1]
+
+    def _finish(self) -> None:
+        self._unwatch()
+        if self._best is not None:
+            self.batch_size = self._best[1]
+        self.tuned = True
+
+        cache = load_cache(self.cache_path)
+        cache[self.key] = {"batch_size": self.batch_size,
+                           "values_per_sec": self._best[0] if self._best else None}
+        save_cache(cache, self.cache_path)
@@ -0,0 +1,82 @@
+# tests/conftest.py
+import sys
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+# recon and utils_results are imported from the repository root, like the numbered scripts
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+ROWS = 10
+NAN = float("nan")
+
+
+def base_columns(rows: int = ROWS) -> dict:
+    return {"row": list(range(rows)), "x": [float(i) for i in range(rows)], "s": [f"s{i}" for i in range(rows)]}
+
+
+# --- Shared edits: (left, right) column lists changed in place ---
+def plain(left, right):
+    right["x"][2] = -1.0
+    right["s"][7] = "zz"
+
+
+def nulls(left, right):
+    left["x"][1] = right["x"][1] = None   # null on both sides
+    right["s"][3] = None
+    left["x"][5] = None
+
+
+def nans(left, right):
+    left["x"][1] = right["x"][1] = NAN    # NaN on both sides
+    right["x"][4] = NAN
+
+
+SCENARIOS = {"plain": plain, "nulls": nulls, "nans": nans}
+
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path, monkeypatch):
+    # Engines write sidecars, caches, bitmaps/ and mismatches/ relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def parquet_pair(tmp_path):
+    """
+    Factory: write <name>_a.parquet / <name>_b.parquet with ROWS rows in row groups of 4,
+    after edit(left, right) changed the column lists in place (by default the scenario
+    called `name`, if any). Returns both paths.
+    """
+    def make(name: str, edit=None, rows: int = ROWS, right_rows: int = None, row_group_size: int = 4):
+        left, right = base_columns(rows), base_columns(rows if right_rows is None else right_rows)
+        edit = edit or SCENARIOS.get(name)
+        if edit is not None:
+            edit(left, right)
+        paths = tmp_path / f"{name}_a.parquet", tmp_path / f"{name}_b.parquet"
+        schema = pa.schema([("row", pa.int64()), ("x", pa.float64()), ("s", pa.string())])
+        for path, columns in zip(paths, (left, right)):
+            pq.write_table(pa.table(columns, schema=schema), path, row_group_size=row_group_size)
+        return paths
+
+    return make
+
+
+def counts(result) -> tuple:
+    return result.matched_rows, result.mismatched_rows, result.left_only, result.right_only
+
+
+@pytest.fixture
+def pyarrow_agrees(parquet_pair):
+    """Check: under `opts`, the PyArrow engine counts every scenario like its plain scan."""
+    from recon import reconcile
+
+    def check(**opts):
+        for name in SCENARIOS:
+            left, right = parquet_pair(name)
+            assert counts(reconcile(left, right, engine="pyarrow", **opts)) == counts(reconcile(left, right)), name
+
+    return check
@@ -0,0 +1,11 @@
+# tests/test_bench.py
+import pytest
+
+from recon.bench import summarize
+
+
+def test_summarize():
+    stats = summarize([3.0, 1.0, None, 2.0])
+    assert stats["median"] == 2.0 and stats["min"] == 1.0 and stats["max"] == 3.0
+    assert stats["p95"] == 3.0 and stats["stddev"] == pytest.approx(1.0)
+    assert summarize([]) == {} and summarize([5.0])["stddev"] == 0.0
@@ -0,0 +1,69 @@
+# tests/test_bitmap.py
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from recon import reconcile
+from recon.bitmap import BitmapBuilder, MatchBitmap
+
+N = 100
+
+
+def bitmap(*positions, compared=None) -> MatchBitmap:
+    return MatchBitmap.from_positions(sorted(positions), N, compared)
+
+
+def test_runs_and_queries():
+    b = bitmap(3, 4, 5, 10, 50, 51, compared=90)
+    assert list(b.starts) == [3, 10, 50] and list(b.lengths) == [3, 1, 2]
+    assert b.mismatched == 6 and b.matched == 84
+    assert b.count_range(4, 51) == 4
+    assert list(b.rows(4, 51)) == [4, 5, 10, 50]
+    assert 10 in b and 11 not in b
+
+
+def test_set_operations():
+    a, b = bitmap(1, 2, 3, 7), bitmap(3, 4, 7, 9)
+    assert list((a & b).rows()) == [3, 7]
+    assert list((a | b).rows()) == [1, 2, 3, 4, 7, 9]
+    assert list((a - b).rows()) == [1, 2]
+    assert list((a ^ b).rows()) == [1, 2, 4, 9]
+
+
+def test_set_operations_with_empty_bitmaps():
+    a, empty = bitmap(1, 2, compared=80), bitmap()
+    assert (a | empty) == a and (empty | a) == a
+    assert len(a & empty) == 0 and len(empty - a) == 0
+    assert (a - empty) == a and len(empty ^ empty) == 0
+    assert 0 not in empty
+    # compared_rows is carried over from the left operand
+    assert (a | empty).compared_rows == 80
+    with pytest.raises(ValueError):
+        a & MatchBitmap([], [], N + 1)
+
+
+def test_builder_merges_runs_across_batches(tmp_path):
+    builder = BitmapBuilder(N)
+    builder.add(np.array([8, 9]))
+    builder.add(np.array([10, 20]))
+    b = builder.finish(compared_rows=N)
+    assert list(b.starts) == [8, 20] and list(b.lengths) == [3, 1]
+    assert MatchBitmap.load(b.save(tmp_path / "b.parquet")) == b
+
+
+def test_rows_by_key(tmp_path):
+    path = tmp_path / "left.parquet"
+    pq.write_table(pa.table({"row": np.arange(N) * 10}), path, row_group_size=16)
+    b = bitmap(2, 30, 31, 70)
+    assert b.rows_by_key(path, "row", 25, 310).to_pydict() == {"row_index": [30], "row": [300]}
+    assert b.rows_by_key(path, "row").column("row").to_pylist() == [20, 300, 310, 700]
+    assert b.rows_by_key(path, "row", 900).num_rows == 0
+
+
+@pytest.mark.parametrize("engine", ["pandas_chunked", "duckdb", "polars_vectorized", "polars_lazy", "pyarrow"])
+def test_engines_write_the_same_bitmap(engine, parquet_pair):
+    left, right = parquet_pair("plain")
+    result = reconcile(left, right, engine=engine, bitmap=f"{engine}.bitmap.parquet")
+    b = MatchBitmap.load(result.extra["bitmap"])
+    assert list(b.rows()) == [2, 7] and b.matched == 8
@@ -0,0 +1,22 @@
+# tests/test_compare.py
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from recon.compare import dictionary_columns, equal
+
+
+def test_dictionary_codes_never_change_the_counts(pyarrow_agrees):
+    pyarrow_agrees(dictionary_columns=None)
+
+
+def test_dictionary_columns_and_codes(tmp_path):
+    labels = ["A", "B", "C"] * 100
+    pq.write_table(pa.table({"L1": labels, "u": [str(i) for i in range(300)]}), tmp_path / "a.parquet")
+    pq.write_table(pa.table({"L1": labels[::-1], "u": [str(i) for i in range(300)]}), tmp_path / "b.parquet")
+    meta1, meta2 = pq.read_metadata(tmp_path / "a.parquet"), pq.read_metadata(tmp_path / "b.parquet")
+    assert "L1" in dictionary_columns(meta1, meta2, meta1.schema.to_arrow_schema())
+
+    # Each side has its own dictionary; codes are compared after mapping to shared ones
+    a = pa.array(["A", "B", None, "C"]).dictionary_encode()
+    b = pa.DictionaryArray.from_arrays(pa.array([1, 0, None, 2], pa.int32()), pa.array(["B", "A", "D"]))
+    assert equal(a, b).to_pylist() == [True, True, None, False]
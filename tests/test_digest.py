@@ -0,0 +1,38 @@
+# tests/test_digest.py
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from recon import reconcile
+from recon.digest import digest_path
+
+
+def write(path, rows, values, labels):
+    pq.write_table(pa.table({"row": rows, "v": values, "label": labels}), path)
+
+
+def counts(result) -> tuple:
+    return result.matched_rows, result.mismatched_rows, result.left_only, result.right_only
+
+
+def test_digest_matches_duckdb_keyed(tmp_path):
+    left, right = tmp_path / "base.parquet", tmp_path / "delivery.parquet"
+    write(left, [0, 1, 2, 3, 4, 5], [1, 2, 3, 4, None, 6], ["a", "b", "c", "d", "e", None])
+    # Key 5 dropped, key 9 added, a sign flip, a changed string and equal nulls
+    write(right, [0, 1, 2, 3, 4, 9], [1, -2, 3, 4, None, 0], ["a", "b", "cc", "d", "e", "z"])
+
+    digest = reconcile(left, right, engine="digest", key="row")
+    keyed = reconcile(left, right, engine="duckdb", key="row")
+    assert counts(digest) == counts(keyed) == (3, 2, 1, 1)
+    assert digest_path(left).exists()          # the baseline's digest is kept for reuse
+    assert not digest_path(right).exists()     # the delivery's only when asked to
+
+
+def test_saved_digest_is_the_next_baseline(tmp_path):
+    left, right = tmp_path / "base.parquet", tmp_path / "delivery.parquet"
+    write(left, [0, 1, 2], [1, 2, 3], ["a", "b", "c"])
+    write(right, [0, 1, 2], [1, 2, 4], ["a", "b", "c"])
+    result = reconcile(left, right, engine="digest", key="row", save_digest=True)
+    assert counts(result) == (2, 1, 0, 0)
+    # Against the delivery's own digest, the delivery matches itself
+    again = reconcile(result.extra["digest"], right, engine="digest", key="row")
+    assert counts(again) == (3, 0, 0, 0)
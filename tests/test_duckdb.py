@@ -0,0 +1,24 @@
+# tests/test_duckdb.py
+import pytest
+
+from recon import reconcile
+
+
+def counts(result) -> tuple:
+    return result.matched_rows, result.mismatched_rows, result.left_only, result.right_only
+
+
+@pytest.mark.parametrize("align", ["positional", "file_row_number"])
+def test_unequal_lengths(align, parquet_pair):
+    left, right = parquet_pair("plain", right_rows=8)
+    assert counts(reconcile(left, right, engine="duckdb", align=align)) == (6, 2, 2, 0)
+    assert counts(reconcile(right, left, engine="duckdb", align=align)) == (6, 2, 0, 2)
+    # Filters select by the left file's values, so right-only rows have none to pass
+    filtered = reconcile(left, right, engine="duckdb", align=align, filters=[("row", ">=", 5)])
+    assert counts(filtered) == (2, 1, 2, 0)
+
+
+def test_bad_align(parquet_pair):
+    left, right = parquet_pair("plain")
+    with pytest.raises(ValueError):
+        reconcile(left, right, engine="duckdb", align="rowid")
@@ -0,0 +1,58 @@
+# tests/test_filters.py
+import duckdb
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from recon.filters import arrow_mask, normalize, prune_row_groups, to_polars, to_sql
+
+TABLE = pa.table({"row": list(range(10)), "L1": ["A", "B", None, "A", "C", "B", "A", None, "C", "A"]})
+
+
+@pytest.mark.parametrize("filters", [
+    [("row", ">=", 3), ("row", "<", 8)],
+    [[("L1", "==", "A")], [("row", "in", [1, 2])]],
+    [("L1", "!=", "A")],
+    [("L1", "not in", ["B", "C"])],
+])
+def test_arrow_sql_and_polars_select_the_same_rows(filters):
+    assert sum(selected_rows(filters)) > 0
+
+
+@pytest.mark.parametrize("filters", [
+    [("L1", "in", [])],
+    [("L1", "not in", [])],   # every non-null value
+    [[("row", "in", [])], [("row", "<", 2)]],
+])
+def test_empty_value_lists(filters):
+    selected_rows(filters)
+
+
+def selected_rows(filters) -> list:
+    # The rows each translation selects; they must agree
+    arrow = arrow_mask(TABLE, filters).to_pylist()
+    con = duckdb.connect()
+    con.register("t", TABLE)
+    sql = [r[0] for r in con.execute(f"SELECT coalesce({to_sql(filters)}, FALSE) FROM t").fetchall()]
+    polars = pl.from_arrow(TABLE).select(to_polars(filters).alias("m"))["m"].to_list()
+    assert arrow == sql == polars
+    return arrow
+
+
+def test_prune_row_groups(tmp_path):
+    pq.write_table(TABLE, tmp_path / "t.parquet", row_group_size=4)
+    meta = pq.read_metadata(tmp_path / "t.parquet")
+    assert prune_row_groups(meta, [("row", ">=", 8)]) == [2]
+    assert prune_row_groups(meta, [[("row", "<", 2)], [("row", "==", 9)]]) == [0, 2]
+    assert prune_row_groups(meta, [("row", "!=", 0)]) == [0, 1, 2]
+    assert prune_row_groups(meta, None) == [0, 1, 2]
+    assert prune_row_groups(meta, [("row", "in", [])]) == []
+
+
+@pytest.mark.parametrize("predicate", [
+    ("row", "~", 1), ("x", "==", float("nan")), ("x", "not in", [1.0, float("nan")]),
+])
+def test_normalize_rejects_bad_filters(predicate):
+    with pytest.raises(ValueError):
+        normalize([predicate])
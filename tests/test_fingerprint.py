@@ -0,0 +1,36 @@
+# tests/test_fingerprint.py
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from recon.fingerprint import build_index, diff_row_groups, index_path, load_or_build_index
+
+NAN = float("nan")
+
+
+def test_fingerprint_index_never_changes_the_counts(pyarrow_agrees):
+    pyarrow_agrees(use_fingerprint_index=True)
+
+
+def test_diff_row_groups(tmp_path):
+    left, right = tmp_path / "a.parquet", tmp_path / "b.parquet"
+    pq.write_table(pa.table({"row": list(range(12)), "k": list(range(12))}), left, row_group_size=4)
+    pq.write_table(pa.table({"row": list(range(12)), "k": [0] * 4 + list(range(4, 12))}), right, row_group_size=4)
+    assert diff_row_groups(build_index(left), build_index(right)) == (8, [(0, ["k"])])
+
+
+def test_float_chunks_are_always_decoded(tmp_path):
+    # Byte-equal chunks holding NaN are not equal values: NaN != NaN
+    path = tmp_path / "a.parquet"
+    pq.write_table(pa.table({"row": list(range(12)), "x": [NAN if i == 5 else float(i) for i in range(12)]}),
+                   path, row_group_size=4)
+    matched, pending = diff_row_groups(build_index(path), build_index(path))
+    assert matched == 0 and [cols for _, cols in pending] == [["x"]] * 3
+
+
+def test_sidecar_follows_rewrites(tmp_path):
+    path = tmp_path / "a.parquet"
+    pq.write_table(pa.table({"row": [1, 2]}), path)
+    assert load_or_build_index(path)["row_groups"][0]["num_rows"] == 2
+    assert index_path(path).exists()
+    pq.write_table(pa.table({"row": [1, 2, 3]}), path)
+    assert load_or_build_index(path)["row_groups"][0]["num_rows"] == 3
@@ -0,0 +1,59 @@
+# tests/test_footer.py
+import os
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from recon.footer import footer_cache_info, footer_plan, read_footer
+
+NAN = float("nan")
+
+
+def write_pair(tmp_path, left: dict, right: dict):
+    paths = tmp_path / "a.parquet", tmp_path / "b.parquet"
+    for path, columns in zip(paths, (left, right)):
+        pq.write_table(pa.table(columns), path, row_group_size=4)
+    return paths
+
+
+def test_footer_check_never_changes_the_counts(pyarrow_agrees):
+    pyarrow_agrees(footer_check=True)
+
+
+def test_identical_ints_are_proven_from_the_footer(tmp_path):
+    columns = {"row": list(range(12)), "k": [7] * 12}
+    left, right = write_pair(tmp_path, columns, columns)
+    matched, pending, info = footer_plan(left, right)
+    assert (matched, pending) == (12, [])
+    assert info["constant"] == 3 and info["bytes_equal"] == 3
+
+
+def test_float_chunks_are_always_decoded(tmp_path):
+    # Byte-equal chunks holding NaN are not equal values: NaN != NaN
+    columns = {"row": list(range(12)), "x": [NAN if i == 5 else float(i) for i in range(12)]}
+    left, right = write_pair(tmp_path, columns, columns)
+    matched, pending, _ = footer_plan(left, right)
+    assert matched == 0 and pending == [(0, ["x"]), (1, ["x"]), (2, ["x"])]
+
+
+def test_differences_and_layouts(tmp_path):
+    # Same statistics, different bytes: only the raw chunk comparison tells
+    left, right = write_pair(tmp_path, {"row": list(range(12))}, {"row": [1, 0] + list(range(2, 12))})
+    matched, pending, info = footer_plan(left, right)
+    assert (matched, pending, info["bytes_differ"]) == (8, [(0, ["row"])], 1)
+    left, right = write_pair(tmp_path, {"row": list(range(12))}, {"row": [-1] + list(range(1, 12))})
+    assert footer_plan(left, right)[1] == [(0, ["row"])]
+    left, right = write_pair(tmp_path, {"row": list(range(12))}, {"row": list(range(13))})
+    assert footer_plan(left, right) is None  # different row groups: callers scan in full
+
+
+def test_read_footer_cache_follows_rewrites(tmp_path):
+    path = tmp_path / "a.parquet"
+    pq.write_table(pa.table({"row": [1, 2]}), path)
+    assert read_footer(path) is read_footer(path)
+    hits = footer_cache_info()["hits"]
+    read_footer(path)
+    assert footer_cache_info()["hits"] == hits + 1
+    pq.write_table(pa.table({"row": [1, 2, 3]}), path)
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1))
+    assert read_footer(path).num_rows == 3
@@ -0,0 +1,44 @@
+# tests/test_keyed.py
+import pytest
+
+from recon import reconcile
+
+
+def counts(result) -> tuple:
+    return result.matched_rows, result.mismatched_rows, result.left_only, result.right_only
+
+
+def test_keyed_counts_one_sided_keys(parquet_pair):
+    def rekey(left, right):
+        right["row"][0] = 100   # key 0 only on the left, key 100 only on the right
+        right["x"][5] = -1.0
+
+    left, right = parquet_pair("keyed", rekey)
+    assert counts(reconcile(left, right, engine="duckdb", key="row")) == (8, 1, 1, 1)
+
+
+def test_keyed_rows_pair_by_key_not_position(parquet_pair):
+    def shuffle(left, right):
+        for column in right.values():
+            column.reverse()
+
+    left, right = parquet_pair("shuffled", shuffle)
+    assert counts(reconcile(left, right, engine="duckdb", key="row")) == (10, 0, 0, 0)
+    assert reconcile(left, right, engine="duckdb").mismatched_rows == 10
+
+
+def test_keyed_nulls_are_equal(parquet_pair):
+    left, right = parquet_pair("nulls")
+    assert counts(reconcile(left, right, engine="duckdb", key="row")) == (8, 2, 0, 0)
+
+
+def test_duplicate_keys_are_refused(parquet_pair):
+    def duplicate(left, right):
+        right["row"][4] = 3
+
+    left, right = parquet_pair("duplicates", duplicate)
+    with pytest.raises(ValueError, match="0 duplicate key.* in the left file, 1 in the right"):
+        reconcile(left, right, engine="duckdb", key="row")
+    # Filtered out, the duplicate no longer matters
+    result = reconcile(left, right, engine="duckdb", key="row", filters=[("row", "<", 3)])
+    assert counts(result) == (3, 0, 0, 0)
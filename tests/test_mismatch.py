@@ -0,0 +1,23 @@
+# tests/test_mismatch.py
+import pyarrow.parquet as pq
+import pytest
+
+from recon import reconcile
+from recon.mismatch import decode_diff_mask, read_mask_columns
+
+
+@pytest.mark.parametrize("engine", ["pyarrow", "duckdb", "polars_vectorized", "polars_lazy"])
+def test_mismatch_files(engine, parquet_pair):
+    left, right = parquet_pair("plain")
+    reconcile(left, right, engine=engine, mismatches=f"{engine}.parquet")
+    table = pq.read_table(f"{engine}.parquet").to_pydict()
+    assert table["row_index"] == [2, 7] and table["row"] == [2, 7]
+    columns = read_mask_columns(f"{engine}.parquet")
+    assert [decode_diff_mask(m, columns) for m in table["diff_mask"]] == [["x"], ["s"]]
+
+
+def test_stale_mismatch_file_is_removed(parquet_pair):
+    left, right = parquet_pair("plain")
+    reconcile(left, right, engine="duckdb", mismatches="out.parquet")
+    reconcile(left, left, engine="duckdb", mismatches="out.parquet")
+    assert not (left.parent / "out.parquet").exists()
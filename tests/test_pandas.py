@@ -0,0 +1,19 @@
+# tests/test_pandas.py
+import pytest
+
+from recon import reconcile
+
+
+@pytest.mark.parametrize("batch_size", [3, 4, 1_000])
+def test_chunk_size_never_changes_the_counts(batch_size, parquet_pair):
+    for name in ("plain", "nulls", "nans"):
+        left, right = parquet_pair(name)
+        chunked = reconcile(left, right, engine="pandas_chunked", batch_size=batch_size)
+        arrow = reconcile(left, right)
+        assert (chunked.matched_rows, chunked.mismatched_rows) == (arrow.matched_rows, arrow.mismatched_rows)
+
+
+def test_row_count_mismatch(parquet_pair):
+    left, right = parquet_pair("plain", right_rows=8)
+    with pytest.raises(ValueError):
+        reconcile(left, right, engine="pandas_chunked")
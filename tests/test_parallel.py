@@ -0,0 +1,26 @@
+# tests/test_parallel.py
+import pytest
+
+from recon import reconcile
+from recon.parallel import split_row_groups
+
+
+def test_workers_never_change_the_counts(pyarrow_agrees):
+    pyarrow_agrees(workers=2)
+
+
+def test_split_row_groups():
+    assert split_row_groups([10] * 6, 3) == [(0, 2), (2, 4), (4, 6)]
+    assert split_row_groups([100, 1, 1, 1], 2) == [(0, 1), (1, 4)]
+    assert split_row_groups([5, 5], 8) == [(0, 1), (1, 2)]
+
+
+@pytest.mark.parametrize("opts", [
+    {"tune": True}, {"use_fingerprint_index": True}, {"footer_check": True}, {"prefetch": 2},
+    {"input_mode": "mmap"}, {"input_mode": "ipc"}, {"mismatches": "out.parquet"}, {"bitmap": "out.bitmap"},
+    {"trace": "trace.json"},
+])
+def test_workers_refuse_options_they_would_ignore(opts, parquet_pair):
+    left, right = parquet_pair("plain")
+    with pytest.raises(ValueError):
+        reconcile(left, right, workers=2, **opts)
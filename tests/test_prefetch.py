@@ -0,0 +1,23 @@
+# tests/test_prefetch.py
+import pytest
+
+from recon.prefetch import Prefetcher
+
+
+def test_prefetch_never_changes_the_counts(pyarrow_agrees):
+    pyarrow_agrees(prefetch=2)
+
+
+def test_prefetcher_keeps_order_and_raises_source_errors():
+    assert list(Prefetcher(iter(range(100)), depth=3)) == list(range(100))
+
+    def failing():
+        yield 1
+        raise OSError("disk gone")
+
+    it = Prefetcher(failing())
+    assert next(it) == 1
+    with pytest.raises(OSError):
+        next(it)
+    with pytest.raises(ValueError):
+        Prefetcher(iter([]), depth=0)
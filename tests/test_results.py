@@ -0,0 +1,48 @@
+# tests/test_results.py
+import pickle
+import runpy
+import threading
+from contextlib import closing
+from pathlib import Path
+
+import utils_results
+from recon import ReconResult
+from utils_results import connect, load_results, record_result
+
+WIPE_SCRIPT = Path(__file__).resolve().parent.parent / "01. wipe_results.py"
+
+
+def legacy_runs(path: Path, labels) -> None:
+    with open(path, "wb") as f:
+        pickle.dump({label: {"match_rate": 1.0, "time_taken_sec": 0.5} for label in labels}, f)
+
+
+def run_count() -> int:
+    with closing(connect()) as con:
+        return con.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+
+def test_legacy_runs_are_imported_once(workdir):
+    legacy_runs(utils_results.LEGACY_PATH, ["Pandas", "DuckDB"])
+    # Several first connections at once: only one of them imports
+    threads = [threading.Thread(target=lambda: connect().close()) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert run_count() == 2
+
+    result = ReconResult("pyarrow", 9, 1)
+    latest = record_result("PyArrow", result, time_taken_sec=0.1)
+    assert list(latest) == ["Pandas", "DuckDB", "PyArrow"]
+    assert latest["PyArrow"]["mismatched_rows"] == 1 and latest["PyArrow"]["time_taken_sec"] == 0.1
+    assert load_results(dataset="none") == {}
+
+
+def test_wipe_does_not_bring_legacy_runs_back(workdir):
+    legacy_runs(utils_results.LEGACY_PATH, ["Pandas"])
+    record_result("PyArrow", ReconResult("pyarrow", 10, 0))
+    assert run_count() == 2
+    runpy.run_path(str(WIPE_SCRIPT))
+    assert run_count() == 0
+    assert len(list(workdir.glob("results-*.sqlite"))) == 1  # the old store is archived
@@ -0,0 +1,26 @@
+# tests/test_rowhash.py
+import numpy as np
+import pyarrow as pa
+
+from recon import reconcile
+from recon.rowhash import row_hashes
+
+
+def test_row_hashes_tell_column_order_and_sign_apart():
+    a = pa.array([1, -1, 0, 2], pa.int64())
+    b = pa.array([-1, 1, 0, 2], pa.int64())
+    h = row_hashes([a, b], 4)
+    assert h[0] != h[1]                                  # swapping values between columns
+    assert row_hashes([a], 4)[0] != row_hashes([b], 4)[0]  # a sign flip
+    assert len(np.unique(row_hashes([pa.array(np.arange(10_000))], 10_000))) == 10_000
+
+
+def test_digest_sees_sign_flips(parquet_pair):
+    # Values that only differ in sign must not hash alike
+    def flip(left, right):
+        right["x"][3] = -3.0
+        right["x"][6] = -6.0
+
+    left, right = parquet_pair("flip", flip)
+    result = reconcile(left, right, engine="digest", key="row")
+    assert (result.matched_rows, result.mismatched_rows) == (8, 2)
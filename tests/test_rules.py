@@ -0,0 +1,42 @@
+# tests/test_rules.py
+import polars as pl
+import pyarrow as pa
+import pytest
+
+from recon.rules import Rule, column_equal, polars_equal, resolve_rules
+
+NAN = float("nan")
+
+
+def both(a: pa.Array, b: pa.Array, rule: Rule) -> tuple:
+    # (Arrow result, Polars result) of the same rule, as Python lists
+    arrow = column_equal(a, b, rule).to_pylist()
+    frame = pl.from_arrow(pa.table({"a": a, "b": b}))
+    floating = pa.types.is_floating(a.type)
+    polars = frame.select(polars_equal(pl.col("a"), pl.col("b"), rule, floating).alias("eq"))["eq"].to_list()
+    return arrow, polars
+
+
+@pytest.mark.parametrize("rule", [Rule(abs_tol=0.01), Rule(rel_tol=1e-3), Rule(nulls_equal=True),
+                                  Rule(abs_tol=0.01, nulls_equal=True)])
+def test_numeric_rules_agree(rule):
+    a = pa.array([1.0, 2.0, NAN, NAN, float("inf"), None, None, 100.0])
+    b = pa.array([1.005, 2.5, NAN, 1.0, float("inf"), None, 1.0, 100.05])
+    arrow, polars = both(a, b, rule)
+    assert arrow == polars
+    assert arrow[2] is False  # NaN never equals NaN
+
+
+def test_string_rules_on_categorical():
+    a = pa.array([" Abc", "x", None, "Q "]).dictionary_encode()
+    b = pa.array(["abc", "X ", None, "r"]).dictionary_encode()
+    arrow, polars = both(a, b, Rule(ignore_case=True, trim=True, nulls_equal=True))
+    assert arrow == polars == [True, True, True, False]
+
+
+def test_resolve_rules_rejects_bad_rules():
+    schema = pa.schema([("x", pa.float64()), ("s", pa.string())])
+    assert resolve_rules({"x": {"abs_tol": 0.1}}, schema) == {"x": Rule(abs_tol=0.1)}
+    for rules in ({"x": {"trim": True}}, {"s": {"abs_tol": 1}}, {"y": {}}, {"x": {"tol": 1}}):
+        with pytest.raises(ValueError):
+            resolve_rules(rules, schema)
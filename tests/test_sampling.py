@@ -0,0 +1,47 @@
+# tests/test_sampling.py
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from recon import reconcile
+from recon.sampling import cluster_interval, design_effect, spent_alpha, stratified_order, wilson_interval
+
+
+def test_stratified_order_is_a_permutation():
+    order = stratified_order([10] * 20, strata=4, seed=1)
+    assert sorted(order) == list(range(20))
+    # The first round draws one row group from each stratum
+    assert sorted(i // 5 for i in order[:4]) == [0, 1, 2, 3]
+
+
+def test_intervals():
+    low, high = wilson_interval(990, 1_000, 1_000_000)
+    assert low < 0.99 < high
+    assert wilson_interval(990, 1_000, 1_000) == (0.99, 0.99)  # every row compared: exact
+    # The same rows, with all mismatches in one of ten row groups, give a wider interval
+    spread = [(99, 100)] * 10
+    concentrated = [(100, 100)] * 9 + [(90, 100)]
+    assert design_effect(spread) == 1.0 and design_effect(concentrated) > 1.0
+    low_spread, _ = cluster_interval(spread, 100_000)
+    low_concentrated, _ = cluster_interval(concentrated, 100_000)
+    assert low_concentrated < low_spread
+
+
+def test_alpha_spending():
+    assert spent_alpha(0.05, 0) == 0 and spent_alpha(0.05, 1) == pytest.approx(0.05)
+    assert spent_alpha(0.05, 0.3) < spent_alpha(0.05, 0.6) < 0.05
+
+
+def test_sample_engine_decisions(tmp_path):
+    left, right = tmp_path / "a.parquet", tmp_path / "b.parquet"
+    pq.write_table(pa.table({"v": list(range(4_000))}), left, row_group_size=500)
+    pq.write_table(pa.table({"v": [-1 if i % 100 == 0 else i for i in range(4_000)]}), right, row_group_size=500)
+
+    full = reconcile(left, right, engine="sample", threshold=0.95, fraction=1.0, min_rows=4_000, seed=0)
+    assert (full.matched_rows, full.mismatched_rows) == (3_960, 40)
+    assert full.extra["decision"] == "pass" and full.extra["ci_low"] == full.extra["ci_high"] == 0.99
+    failing = reconcile(left, right, engine="sample", threshold=0.999, fraction=1.0, min_rows=500, seed=0)
+    assert failing.extra["decision"] == "fail"
+    assert failing.extra["look_confidence"] > 0.95  # each look spends only part of alpha
+    with pytest.raises(ValueError):
+        reconcile(left, right, engine="sample", confidence=1.5)
@@ -0,0 +1,58 @@
+# tests/test_service.py
+import json
+import threading
+from urllib import error, request
+
+import pytest
+
+from recon.service import ReconService, ServiceClient, serve
+
+
+@pytest.fixture
+def service():
+    service = ReconService(workers=1, queue_size=2)
+    yield service
+    service.shutdown()
+
+
+@pytest.fixture
+def client(service):
+    server = serve(service, port=0)  # any free port
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield ServiceClient(f"http://127.0.0.1:{server.server_address[1]}")
+    server.shutdown()
+    server.server_close()
+
+
+def test_jobs_run_and_pooled_settings_are_reset(service, parquet_pair):
+    left, right = parquet_pair("plain", lambda a, b: b["x"].__setitem__(2, -1.0))
+    with service.pool.connection() as con:
+        default_limit = con.execute("SELECT current_setting('memory_limit')").fetchone()[0]
+
+    job_id = service.submit(left, right, "duckdb", {"memory_limit": "123MB", "threads": 1})
+    job = service.job(job_id, wait=30)
+    assert job["state"] == "done"
+    assert (job["result"]["matched_rows"], job["result"]["mismatched_rows"]) == (9, 1)
+    with service.pool.connection() as con:
+        assert con.execute("SELECT current_setting('memory_limit')").fetchone()[0] == default_limit
+
+    failed = service.job(service.submit(left, right, "pyarrow", {"no_such_option": 1}), wait=30)
+    assert failed["state"] == "failed" and "no_such_option" in failed["error"]
+    with pytest.raises(ValueError):
+        service.submit(left, right, "no_such_engine")
+
+
+def test_http_client(client, parquet_pair):
+    left, right = parquet_pair("plain", lambda a, b: b["s"].__setitem__(7, "zz"))
+    result = client.reconcile(left, right, engine="pyarrow")
+    assert (result.matched_rows, result.mismatched_rows) == (9, 1)
+    assert client.status()["done"] == 1
+
+    with pytest.raises(error.HTTPError) as bad_wait:
+        request.urlopen(f"{client.url}/jobs/x?wait=soon")
+    assert bad_wait.value.code == 400
+    with pytest.raises(error.HTTPError) as unknown:
+        request.urlopen(f"{client.url}/jobs/x")
+    assert unknown.value.code == 404
+    assert "Unknown job" in json.loads(unknown.value.read())["error"]
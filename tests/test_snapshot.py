@@ -0,0 +1,56 @@
+# tests/test_snapshot.py
+import pyarrow as pa
+import pytest
+
+from recon import reconcile
+from recon.engines import pyarrow_engine
+from recon.snapshot import MappedSnapshot, ensure_snapshot, snapshot_path
+
+
+def test_ipc_snapshots_never_change_the_counts(pyarrow_agrees):
+    pyarrow_agrees(input_mode="ipc")
+
+
+def test_snapshot_is_rebuilt_when_the_source_changes(parquet_pair):
+    left, _ = parquet_pair("plain")
+    _, longer = parquet_pair("longer", rows=12)
+    path = ensure_snapshot(left)
+    assert path == snapshot_path(left) and path.exists()
+    built = path.stat().st_mtime_ns
+    assert ensure_snapshot(left).stat().st_mtime_ns == built  # unchanged source: reused
+    longer.replace(left)
+    ensure_snapshot(left)
+    assert pa.ipc.open_file(str(snapshot_path(left))).read_all().num_rows == 12
+
+
+def test_snapshot_closes(parquet_pair):
+    left, _ = parquet_pair("plain")
+    with MappedSnapshot(ensure_snapshot(left)) as snapshot:
+        mapped = snapshot._mmap
+        assert sum(b.num_rows for b in snapshot.iter_batches()) == 10
+    assert mapped.closed
+    snapshot.close()  # closing twice is harmless
+
+    # A batch still held keeps its pages mapped; the map goes with it
+    snapshot = MappedSnapshot(ensure_snapshot(left))
+    batch = next(snapshot.iter_batches())
+    snapshot.close()
+    assert batch.column("row").to_pylist() == list(range(10))
+
+
+def test_engine_closes_its_snapshots(parquet_pair, monkeypatch):
+    closed = []
+    monkeypatch.setattr(MappedSnapshot, "close", lambda self: closed.append(self))
+    left, right = parquet_pair("plain")
+    reconcile(left, right, input_mode="ipc")
+    assert len(closed) == 2
+
+    # Also when the compare fails midway
+    def fail(*args):
+        raise RuntimeError("compare failed")
+
+    closed.clear()
+    monkeypatch.setattr(pyarrow_engine, "column_equal", fail)
+    with pytest.raises(RuntimeError):
+        reconcile(left, right, input_mode="ipc")
+    assert len(closed) == 2
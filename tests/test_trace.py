@@ -0,0 +1,14 @@
+# tests/test_trace.py
+import json
+
+from recon import reconcile
+
+
+def test_trace_export(parquet_pair):
+    left, right = parquet_pair("plain")
+    result = reconcile(left, right, trace="trace.json")
+    summary = result.extra["trace"]
+    assert summary["engine"] == "pyarrow" and summary["rows"] == 10
+    events = json.loads((left.parent / "trace.json").read_text())
+    names = {e["name"] for e in (events["traceEvents"] if isinstance(events, dict) else events)}
+    assert "reconcile" in names
@@ -0,0 +1,54 @@
+# tests/test_tuner.py
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from recon.memory import current_rss_bytes, peak_rss_bytes
+from recon import reconcile
+from recon.tuner import CACHE_PATH, BatchSizeTuner, load_cache
+
+
+@pytest.fixture
+def pf(tmp_path):
+    pq.write_table(pa.table({"v": list(range(100))}), tmp_path / "t.parquet")
+    return pq.ParquetFile(tmp_path / "t.parquet")
+
+
+def test_budget_is_checked_per_probe(pf, tmp_path):
+    # An earlier spike puts the process's lifetime peak over the budget...
+    spike = np.ones(256 << 17)  # 256 MiB
+    del spike
+    budget = current_rss_bytes() + (64 << 20)
+    assert peak_rss_bytes() > budget
+
+    # ...but no probe comes near it, so throughput alone decides
+    cache = tmp_path / "cache.pkl"
+    tuner = BatchSizeTuner(pf, start=16_384, max_probes=3, rss_budget=budget, cache_path=cache)
+    for _ in range(3):
+        tuner.record(tuner.batch_size * 10, 1.0)  # every doubling improves throughput
+    assert tuner.tuned and tuner.batch_size == 65_536
+    assert load_cache(cache)[tuner.key]["batch_size"] == 65_536
+
+    # Later runs under the same budget start tuned and never probe again
+    again = BatchSizeTuner(pf, start=16_384, rss_budget=budget, cache_path=cache)
+    assert again.tuned and again.batch_size == 65_536
+    assert not BatchSizeTuner(pf, start=16_384, cache_path=cache).tuned
+
+
+def test_probe_over_budget_is_rejected(pf, tmp_path):
+    tuner = BatchSizeTuner(pf, start=65_536, rss_budget=1, cache_path=tmp_path / "cache.pkl")
+    tuner.record(65_536 * 10, 1.0)
+    assert tuner._best is None and tuner.batch_size == 32_768  # over budget: try smaller
+    tuner.record(32_768 * 100, 1.0)
+    assert tuner.tuned and tuner._best is None
+
+
+def test_engine_tunes_against_its_budget(parquet_pair):
+    left, right = parquet_pair("plain")
+    result = reconcile(left, right, tune=True, tune_rss_budget=1)
+    assert (result.matched_rows, result.mismatched_rows) == (8, 2)
+    # Sizes picked under a budget are cached apart from unbudgeted ones
+    assert [key[-1] for key in load_cache(CACHE_PATH)] == [1]
+    with pytest.raises(ValueError):
+        reconcile(left, right, tune_rss_budget=1)
@@ -1,30 +1,150 @@
 # utils_results.py
-import pickle, os
+import hashlib, json, pickle, socket, sqlite3
+from contextlib import closing
+from datetime import datetime, timezone
 from pathlib import Path
 
-RESULTS_PATH = Path("results.pkl")
+RESULTS_PATH = Path("results.sqlite")
+LEGACY_PATH = Path("results.pkl")   # the old single pickled dict, imported once
 
-def load_results(path: Path = RESULTS_PATH) -> dict:
-    # Initialize if missing or empty
-    if not path.exists() or path.stat().st_size == 0:
+# Append-only: one row per recorded run, never updated or deleted
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+    recorded_at     TEXT,
+    label           TEXT NOT NULL,
+    engine          TEXT,
+    dataset         TEXT,
+    total_rows      INTEGER,
+    matched_rows    INTEGER,
+    mismatched_rows INTEGER,
+    left_only       INTEGER,
+    right_only      INTEGER,
+    match_rate      REAL,
+    time_taken_sec  REAL,
+    peak_rss_bytes  INTEGER,
+    host            TEXT,
+    timings         TEXT,  -- JSON {phase: seconds}
+    extra           TEXT   -- JSON, engine-specific details
+);
+CREATE INDEX IF NOT EXISTS runs_label ON runs (label, id);
+CREATE INDEX IF NOT EXISTS runs_dataset ON runs (dataset, id);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+COLUMNS = ["recorded_at", "label", "engine", "dataset", "total_rows", "matched_rows", "mismatched_rows",
+           "left_only", "right_only", "match_rate", "time_taken_sec", "peak_rss_bytes", "host",
+           "timings", "extra"]
+
+
+def connect(path: Path = RESULTS_PATH, import_legacy: bool = True) -> sqlite3.Connection:
+    """
+    Open (and create) the store. WAL lets readers run while a script appends, and the
+    busy timeout makes concurrent writers queue up instead of failing.
+    import_legacy: False marks the store as having no legacy runs to import (a wipe).
+    """
+    con = sqlite3.connect(path, timeout=30)
+    con.row_factory = sqlite3.Row
+    con.execute("PRAGMA journal_mode=WAL")
+    con.executescript(SCHEMA)
+    _import_legacy(con, LEGACY_PATH if import_legacy else None)
+    return con
+
+
+def _import_legacy(con: sqlite3.Connection, legacy: Path = LEGACY_PATH) -> None:
+    """
+    One-off: keep the numbers of a pre-existing results.pkl as undated runs.
+    The check, the import and the "done" mark share one write transaction, so two
+    first connections can't both import, and a store imports at most once in its life.
+    """
+    if con.execute("SELECT 1 FROM meta WHERE key = 'legacy_imported'").fetchone():
+        return
+    con.execute("BEGIN IMMEDIATE")
+    try:
+        # Re-checked under the write lock; a store that already has runs predates the mark
+        if not (con.execute("SELECT 1 FROM meta WHERE key = 'legacy_imported'").fetchone()
+                or con.execute("SELECT 1 FROM runs LIMIT 1").fetchone()):
+            for label, record in _read_legacy(legacy).items():
+                con.execute("INSERT INTO runs (label, match_rate, time_taken_sec, matched_rows, mismatched_rows, "
+                            "peak_rss_bytes) VALUES (?, ?, ?, ?, ?, ?)",
+                            (label, record.get("match_rate"), record.get("time_taken_sec"),
+                             record.get("matched_rows"), record.get("mismatched_rows"), record.get("peak_rss_bytes")))
+        con.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('legacy_imported', ?)",
+                    [str(legacy) if legacy is not None else None])
+        con.commit()
+    except BaseException:
+        con.rollback()
+        raise
+
+
+def _read_legacy(legacy: Path) -> dict:
+    if legacy is None or not legacy.exists():
         return {}
     try:
-        with open(path, "rb") as f:
+        with open(legacy, "rb") as f:
             return pickle.load(f)
-    except (EOFError, pickle.UnpicklingError, AttributeError) as e:
-        # File is corrupt or not a pickle — start fresh (and optionally back it up)
-        backup = path.with_suffix(".corrupt.pkl")
-        try:
-            path.replace(backup)
-        except Exception:
-            pass
-        print(f"[warn] results.pkl unreadable ({type(e).__name__}). "
-              f"Backed up to {backup.name}. Starting with empty dict.")
+    except (EOFError, pickle.UnpicklingError, AttributeError):
         return {}
 
-def save_results(results: dict, path: Path = RESULTS_PATH) -> None:
-    # Atomic write to avoid leaving a 0-byte file if a crash occurs mid-write
-    tmp = path.with_suffix(".tmp")
-    with open(tmp, "wb") as f:
-        pickle.dump(results, f, protocol=pickle.HIGHEST_PROTOCOL)
-    os.replace(tmp, path)  # atomic on Windows & POSIX
+
+def dataset_fingerprint(paths) -> str:
+    """
+    Short hash identifying the compared inputs: size and Parquet footer (row groups, sizes,
+    statistics) of every file, so runs on different data are never charted together.
+    Reads a few KB per file. Directories cover every Parquet file under them.
+    """
+    from recon.dataset import footer_bytes, list_files
+
+    h = hashlib.blake2b(digest_size=8)
+    for path in map(Path, paths):
+        files = list(list_files(path).values()) if path.is_dir() else [path]
+        for f in files:
+            h.update(str(f.stat().st_size).encode())
+            h.update(footer_bytes(f))
+    return h.hexdigest()
+
+
+def record_result(label: str, result, path: Path = RESULTS_PATH, **overrides) -> dict:
+    """
+    Append one run of a recon.ReconResult under its chart label; overrides replace
+    fields of the flat record (e.g. an averaged time_taken_sec).
+    Returns the latest run per label, like the old results dict.
+    """
+    record = {**result.as_record(), **overrides}
+    dataset = None
+    if result.inputs is not None:
+        try:
+            dataset = dataset_fingerprint(result.inputs)
+        except (OSError, ValueError):
+            pass  # e.g. a digest baseline whose source is gone
+
+    known = {"match_rate", "time_taken_sec", "matched_rows", "mismatched_rows", "left_only",
+             "right_only", "peak_rss_bytes"}
+    row = {
+        "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "label": label,
+        "engine": result.engine,
+        "dataset": dataset,
+        "total_rows": result.total_rows,
+        **{k: record.get(k) for k in known},
+        "host": socket.gethostname(),
+        "timings": json.dumps(result.timings),
+        "extra": json.dumps({k: v for k, v in record.items() if k not in known}, default=str),
+    }
+    with closing(connect(path)) as con, con:
+        con.execute(f"INSERT INTO runs ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+                    [row[c] for c in COLUMNS])
+    return load_results(path)
+
+
+def load_results(path: Path = RESULTS_PATH, dataset: str = None) -> dict:
+    """Latest run per label ({label: flat record}), optionally for one dataset only."""
+    if not path.exists():
+        return {}
+    where = "WHERE dataset = ?" if dataset is not None else ""
+    query = f"""
+        SELECT * FROM runs WHERE id IN (SELECT MAX(id) FROM runs {where} GROUP BY label) ORDER BY id
+    """
+    with closing(connect(path)) as con:
+        rows = con.execute(query, [dataset] if dataset is not None else []).fetchall()
+    return {r["label"]: {k: r[k] for k in r.keys() if k not in ("id", "label", "timings", "extra")}
+            for r in rows}